@@ -0,0 +1,31 @@
+"""Add index on lists.user_id
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Get current indexes
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    indexes = [idx['name'] for idx in inspector.get_indexes('lists')]
+    
+    # Bulk status lookups join list_items to the user's lists
+    if 'ix_lists_user_id' not in indexes:
+        op.create_index('ix_lists_user_id', 'lists', ['user_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_lists_user_id', table_name='lists')
@@ -0,0 +1,31 @@
+"""Add keyset pagination index on list_items
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Get current indexes
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    indexes = [idx['name'] for idx in inspector.get_indexes('list_items')]
+    
+    # Paged item reads seek on (list_id, added_at, id)
+    if 'ix_list_items_list_added' not in indexes:
+        op.create_index('ix_list_items_list_added', 'list_items', ['list_id', 'added_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_list_items_list_added', table_name='list_items')
@@ -0,0 +1,72 @@
+"""Convert filter_settings list columns to arrays with GIN indexes
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+INTEGER_COLUMNS = [
+    'genres', 'release_types', 'watch_providers', 'companies',
+    'cast', 'crew', 'include_keywords', 'exclude_keywords',
+]
+TEXT_COLUMNS = ['spoken_languages', 'watch_monetization_types', 'origin_countries']
+GIN_COLUMNS = [
+    'genres', 'watch_providers', 'companies', 'cast', 'crew',
+    'include_keywords', 'exclude_keywords',
+]
+
+
+def _split_expression(column: str) -> str:
+    # Existing rows hold either JSON ("[28,12]") or comma/pipe separated ("28,12") values
+    return (
+        f"regexp_split_to_array("
+        f"NULLIF(regexp_replace(\"{column}\", '[\\[\\]\"[:space:]]', '', 'g'), ''), "
+        f"'[,|]')"
+    )
+
+
+def upgrade() -> None:
+    # Get current column types and indexes
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = {col['name']: col['type'] for col in inspector.get_columns('filter_settings')}
+    indexes = [idx['name'] for idx in inspector.get_indexes('filter_settings')]
+
+    for column in INTEGER_COLUMNS:
+        if column in columns and not isinstance(columns[column], sa.ARRAY):
+            op.execute(
+                f"ALTER TABLE filter_settings ALTER COLUMN \"{column}\" "
+                f"TYPE integer[] USING {_split_expression(column)}::integer[]"
+            )
+    for column in TEXT_COLUMNS:
+        if column in columns and not isinstance(columns[column], sa.ARRAY):
+            op.execute(
+                f"ALTER TABLE filter_settings ALTER COLUMN \"{column}\" "
+                f"TYPE text[] USING {_split_expression(column)}"
+            )
+
+    # Containment lookups ("filters that reference genre 27") use these
+    for column in GIN_COLUMNS:
+        name = f'ix_filter_settings_{column}'
+        if name not in indexes:
+            op.create_index(name, 'filter_settings', [column], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    for column in GIN_COLUMNS:
+        op.drop_index(f'ix_filter_settings_{column}', table_name='filter_settings')
+    for column in INTEGER_COLUMNS + TEXT_COLUMNS:
+        op.execute(
+            f"ALTER TABLE filter_settings ALTER COLUMN \"{column}\" "
+            f"TYPE text USING array_to_string(\"{column}\", ',')"
+        )
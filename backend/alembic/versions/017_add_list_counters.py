@@ -0,0 +1,76 @@
+"""Add item_count and last_item_added_at to lists
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Get current columns
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = [col['name'] for col in inspector.get_columns('lists')]
+
+    if 'item_count' not in columns:
+        op.add_column('lists', sa.Column('item_count', sa.Integer(), nullable=False, server_default='0'))
+    if 'last_item_added_at' not in columns:
+        op.add_column('lists', sa.Column('last_item_added_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Backfill from existing items
+    op.execute("""
+        UPDATE lists
+        SET item_count = counts.item_count,
+            last_item_added_at = counts.last_item_added_at
+        FROM (
+            SELECT list_id, count(*) AS item_count, max(added_at) AS last_item_added_at
+            FROM list_items
+            GROUP BY list_id
+        ) AS counts
+        WHERE lists.id = counts.list_id
+    """)
+
+    # Keep the counters current on every insert and delete of list_items
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_list_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE lists
+                SET item_count = item_count + 1,
+                    last_item_added_at = GREATEST(last_item_added_at, NEW.added_at)
+                WHERE id = NEW.list_id;
+                RETURN NEW;
+            END IF;
+            UPDATE lists
+            SET item_count = GREATEST(item_count - 1, 0),
+                last_item_added_at = (
+                    SELECT max(added_at) FROM list_items WHERE list_id = OLD.list_id
+                )
+            WHERE id = OLD.list_id;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_list_items_counters ON list_items")
+    op.execute("""
+        CREATE TRIGGER trg_list_items_counters
+        AFTER INSERT OR DELETE ON list_items
+        FOR EACH ROW EXECUTE FUNCTION update_list_counters()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_list_items_counters ON list_items")
+    op.execute("DROP FUNCTION IF EXISTS update_list_counters()")
+    op.drop_column('lists', 'last_item_added_at')
+    op.drop_column('lists', 'item_count')
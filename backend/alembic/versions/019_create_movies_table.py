@@ -0,0 +1,51 @@
+"""Create movies catalog table
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if 'movies' in inspector.get_table_names():
+        return
+    
+    op.create_table(
+        'movies',
+        sa.Column('id', sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column('title', sa.String(length=500), nullable=False),
+        sa.Column('original_title', sa.String(length=500), nullable=True),
+        sa.Column('original_language', sa.String(length=10), nullable=True),
+        sa.Column('overview', sa.Text(), nullable=True),
+        sa.Column('release_date', sa.Date(), nullable=True),
+        sa.Column('vote_average', sa.Float(), nullable=True),
+        sa.Column('vote_count', sa.Integer(), nullable=True),
+        sa.Column('popularity', sa.Float(), nullable=True),
+        sa.Column('runtime', sa.Integer(), nullable=True),
+        sa.Column('genre_ids', postgresql.ARRAY(sa.Integer()), server_default='{}', nullable=False),
+        sa.Column('poster_path', sa.String(length=255), nullable=True),
+        sa.Column('backdrop_path', sa.String(length=255), nullable=True),
+        sa.Column('payload', postgresql.JSONB(), nullable=False),
+        sa.Column('fetched_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('details_fetched_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_movies_popularity', 'movies', ['popularity'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movies_popularity', table_name='movies')
+    op.drop_table('movies')
@@ -0,0 +1,35 @@
+"""Create sync state table
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if 'sync_state' in inspector.get_table_names():
+        return
+    
+    op.create_table(
+        'sync_state',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('high_water_mark', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sync_state')
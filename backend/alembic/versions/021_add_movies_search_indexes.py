@@ -0,0 +1,47 @@
+"""Add full-text and trigram search indexes to movies
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = [col['name'] for col in inspector.get_columns('movies')]
+    indexes = [index['name'] for index in inspector.get_indexes('movies')]
+
+    if 'search_vector' not in columns:
+        op.execute("""
+            ALTER TABLE movies ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('simple', coalesce(original_title, '')), 'B')
+            ) STORED
+        """)
+    if 'ix_movies_search_vector' not in indexes:
+        op.create_index('ix_movies_search_vector', 'movies', ['search_vector'], postgresql_using='gin')
+    if 'ix_movies_title_trgm' not in indexes:
+        op.create_index(
+            'ix_movies_title_trgm', 'movies', ['title'],
+            postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movies_title_trgm', table_name='movies')
+    op.drop_index('ix_movies_search_vector', table_name='movies')
+    op.drop_column('movies', 'search_vector')
@@ -0,0 +1,48 @@
+"""Add keyword, cast, crew and company ID columns to movies
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+FACET_COLUMNS = ('keyword_ids', 'cast_ids', 'crew_ids', 'company_ids')
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = [col['name'] for col in inspector.get_columns('movies')]
+
+    for name in FACET_COLUMNS:
+        if name not in columns:
+            op.add_column('movies', sa.Column(name, postgresql.ARRAY(sa.Integer()), nullable=True))
+
+    # Stored details payloads already list their production companies
+    op.execute("""
+        UPDATE movies
+        SET company_ids = ARRAY(
+            SELECT DISTINCT (company->>'id')::int
+            FROM jsonb_array_elements(payload->'production_companies') AS company
+            WHERE company ? 'id'
+            ORDER BY 1
+        )
+        WHERE company_ids IS NULL
+          AND details_fetched_at IS NOT NULL
+          AND jsonb_typeof(payload->'production_companies') = 'array'
+    """)
+
+
+def downgrade() -> None:
+    for name in reversed(FACET_COLUMNS):
+        op.drop_column('movies', name)
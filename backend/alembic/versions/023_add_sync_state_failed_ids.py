@@ -0,0 +1,33 @@
+"""Add failed ID list to sync state
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '023'
+down_revision = '022'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = [col['name'] for col in inspector.get_columns('sync_state')]
+
+    if 'failed_ids' not in columns:
+        op.add_column(
+            'sync_state',
+            sa.Column('failed_ids', postgresql.ARRAY(sa.Integer()), server_default='{}', nullable=False)
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('sync_state', 'failed_ids')
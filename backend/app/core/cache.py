@@ -0,0 +1,95 @@
+"""
+Cache Module
+
+This module provides small in-process caches for hot request paths.
+Entries live in the memory of a single worker, so they should only hold
+data that is cheap to rebuild and safe to serve slightly stale.
+
+Features:
+- Size-bounded LRU eviction
+- Optional per-entry time-to-live
+- Explicit invalidation by key
+- Snapshot of live entries for bulk revalidation
+"""
+
+from collections import OrderedDict
+import time
+from typing import Any, Hashable, List, Optional, Tuple
+
+_MISSING = object()
+
+class LRUCache:
+    """
+    Size-bounded least-recently-used cache with optional expiry.
+
+    Attributes:
+        maxsize: Maximum number of entries kept before evicting the oldest
+        ttl: Default lifetime of an entry in seconds (None means no expiry)
+
+    Notes:
+        - Not thread-safe; intended for use from the event loop only
+        - Expired entries are dropped lazily on access
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional lifetime in seconds overriding the cache default
+        """
+        if self.maxsize <= 0:
+            return
+        lifetime = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + lifetime if lifetime is not None else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key from the cache and return its value if present."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Return the unexpired (key, value) pairs, least recently used first."""
+        now = time.monotonic()
+        return [
+            (key, value) for key, (value, expires_at) in self._data.items()
+            if expires_at is None or expires_at > now
+        ]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
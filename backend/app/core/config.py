@@ -11,7 +11,7 @@ Features:
 """
 
 from functools import lru_cache
-from typing import List
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 import os
 from dotenv import load_dotenv
@@ -28,9 +28,69 @@ class Settings(BaseSettings):
         API_V1_STR: API version prefix
         CORS_ORIGINS: List of allowed CORS origins
         DATABASE_URL: Database connection string
+        DATABASE_REPLICA_URLS: Optional read replica connection strings
+        REPLICA_HEALTH_CHECK_SECONDS: Interval between replica health checks
+        READ_YOUR_WRITES_SECONDS: How long a user's reads stay on the primary after a write
+        DB_POOL_SIZE: Connections kept open per engine in each worker
+        DB_MAX_OVERFLOW: Extra connections allowed beyond DB_POOL_SIZE
+        DB_POOL_TIMEOUT: Seconds to wait for a free connection
+        DB_POOL_RECYCLE: Max connection age in seconds before it is replaced
+        DB_POOL_PRE_PING: Whether to ping connections on every checkout
+        DB_ECHO: Whether to log every SQL statement
+        DB_QUERY_CACHE_SIZE: Compiled SQL statements cached per engine
+        DB_PREPARED_STATEMENT_CACHE_SIZE: Server-side prepared statements cached per connection
         SECRET_KEY: JWT secret key
         ALGORITHM: JWT algorithm
         ACCESS_TOKEN_EXPIRE_MINUTES: JWT token expiration time
+        DEFAULT_LISTS_CACHE_SIZE: Max users whose default list IDs are cached
+        ACCESS_TOKEN_CACHE_SIZE: Max verified access tokens cached per worker
+        PRINCIPAL_CACHE_SIZE: Max principals cached per worker
+        PRINCIPAL_CACHE_TTL_SECONDS: Lifetime of a cached principal
+        SHARED_CACHE_URL: Optional Redis URL for caches shared across workers
+        REFRESH_GRACE_SECONDS: How long a refresh token's new token pair is reused for repeat refreshes
+        ACCEPT_LEGACY_TOKEN_SUBJECTS: Accept tokens whose subject is an email (migration window)
+        LOG_SAMPLE_RATES: Fraction of DEBUG/INFO records kept per logger name prefix
+        LOG_DEBUG_HEADER: Request header that opts a request in to debug logging
+        LOG_DEBUG_TOKEN: Value LOG_DEBUG_HEADER must carry; opt-in is disabled when unset
+        METRICS_HEADER: Request header carrying the metrics token
+        METRICS_TOKEN: Value METRICS_HEADER must carry; /api/metrics is disabled when unset
+        CATALOG_WRITE_BATCH_SIZE: Pending catalog writes that trigger a flush
+        CATALOG_WRITE_FLUSH_SECONDS: Longest delay before pending catalog writes are flushed
+        CATALOG_WRITE_MAX_PENDING: Pending catalog writes kept before new ones are dropped
+        CATALOG_DETAILS_MAX_AGE_SECONDS: Age after which stored movie details are refetched
+        CATALOG_SYNC_ENABLED: Run the TMDB changes sync job in this process
+        CATALOG_SYNC_INTERVAL_SECONDS: Time between catalog sync runs
+        CATALOG_SYNC_CONCURRENCY: Movie refetches in flight during a sync run
+        SEARCH_LOCAL_MIN_RELEVANCE: Text relevance a catalog match needs to count toward the
+            full page of strong matches that lets a search skip TMDB
+        SEARCH_CACHE_SIZE: TMDB search pages kept in the per-query cache
+        SEARCH_CACHE_TTL_SECONDS: Lifetime of a cached TMDB search page
+        AUTOCOMPLETE_MAX_TITLES: Most popular movies kept in the typeahead index
+        AUTOCOMPLETE_MAX_PENDING: Movies updated since the last rebuild kept in the typeahead overlay
+        AUTOCOMPLETE_REBUILD_SECONDS: Time between typeahead index rebuilds
+        DISCOVER_LOCAL_ENABLED: Answer discover queries from the catalog snapshot when possible
+        DISCOVER_LOCAL_MIN_MOVIES: Catalog size below which discover queries always go to TMDB
+        DISCOVER_LOCAL_MIN_RESULTS: Local matches below which a discover query goes to TMDB
+        DISCOVER_REBUILD_SECONDS: Time between catalog snapshot rebuilds
+        DISCOVER_FACET_MIN_COVERAGE: Share of candidate movies that must have keyword, cast,
+            crew or company data before such a filter is answered locally
+        SIMILAR_LOCAL_ENABLED: Serve similar movies from catalog content vectors when possible
+        SIMILAR_TOP_K: Similar movies kept and returned per movie
+        SIMILAR_CACHE_SIZE: Movies whose similar movies are kept in the neighbour cache
+        SIMILAR_CACHE_TTL_SECONDS: Lifetime of a cached similar movies list; bounds how long
+            a list scored with an earlier snapshot's feature weights is served
+        SIMILAR_PRECOMPUTE_MOVIES: Most popular movies whose similar movies are computed ahead of requests
+        RECOMMENDATIONS_ENABLED: Build the co-occurrence model and serve personalized recommendations
+        RECOMMENDATIONS_REBUILD_SECONDS: Time between co-occurrence model rebuilds
+        RECOMMENDATIONS_NEIGHBOURS: Co-occurring movies kept per movie
+        RECOMMENDATIONS_MAX_BASKET: Most recently listed movies per user counted by the model
+        RECOMMENDATIONS_MAX_PAIRS: Distinct movie pairs held while building; rarer pairs are pruned past this
+        RECOMMENDATIONS_CACHE_SIZE: Users whose recommendations are cached
+        RECOMMENDATIONS_CACHE_TTL_SECONDS: Lifetime of a user's cached recommendations
+        TMDB_LOW_PRIORITY_RATE_PER_SECOND: TMDB requests per second available to background jobs
+        TMDB_LOW_PRIORITY_BURST: Background TMDB requests allowed back to back
+        PASSWORD_HASH_WORKERS: Threads per worker process for bcrypt hashing
+        PASSWORD_HASH_MAX_QUEUE: Max hashing calls waiting before new ones get 503
     """
     # Base settings
     PROJECT_NAME: str = "CineFiles"
@@ -50,14 +110,83 @@ class Settings(BaseSettings):
     
     # Database settings
     DATABASE_URL: str = "postgresql+asyncpg://postgres:postgres@db:5432/cinefiles"
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_HEALTH_CHECK_SECONDS: int = 15
+    READ_YOUR_WRITES_SECONDS: int = 10
+    
+    # Connection pool settings (per engine, per worker process)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 600
+    DB_POOL_PRE_PING: bool = False
+    DB_ECHO: bool = False
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    
+    # Logging settings
+    LOG_SAMPLE_RATES: Dict[str, float] = {"app.middleware.logging": 0.1}
+    LOG_DEBUG_HEADER: str = "X-Debug-Log"
+    LOG_DEBUG_TOKEN: Optional[str] = None
+    
+    # Metrics settings
+    METRICS_HEADER: str = "X-Metrics-Token"
+    METRICS_TOKEN: Optional[str] = None
+    
+    # Password hashing settings
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
     
     # JWT settings
     SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-secret-key-for-development")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ACCEPT_LEGACY_TOKEN_SUBJECTS: bool = True
+    REFRESH_GRACE_SECONDS: int = 10
+    
+    # Cache settings
+    DEFAULT_LISTS_CACHE_SIZE: int = 10000
+    ACCESS_TOKEN_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    SHARED_CACHE_URL: Optional[str] = None
+    
+    # Movie catalog settings
+    CATALOG_WRITE_BATCH_SIZE: int = 500
+    CATALOG_WRITE_FLUSH_SECONDS: float = 1.0
+    CATALOG_WRITE_MAX_PENDING: int = 10000
+    CATALOG_DETAILS_MAX_AGE_SECONDS: int = 86400
+    CATALOG_SYNC_ENABLED: bool = True
+    CATALOG_SYNC_INTERVAL_SECONDS: int = 3600
+    CATALOG_SYNC_CONCURRENCY: int = 4
+    SEARCH_LOCAL_MIN_RELEVANCE: float = 0.5
+    SEARCH_CACHE_SIZE: int = 2000
+    SEARCH_CACHE_TTL_SECONDS: int = 600
+    AUTOCOMPLETE_MAX_TITLES: int = 100000
+    AUTOCOMPLETE_MAX_PENDING: int = 5000
+    AUTOCOMPLETE_REBUILD_SECONDS: int = 900
+    DISCOVER_LOCAL_ENABLED: bool = True
+    DISCOVER_LOCAL_MIN_MOVIES: int = 50000
+    DISCOVER_LOCAL_MIN_RESULTS: int = 20
+    DISCOVER_REBUILD_SECONDS: int = 600
+    DISCOVER_FACET_MIN_COVERAGE: float = 0.95
+    SIMILAR_LOCAL_ENABLED: bool = True
+    SIMILAR_TOP_K: int = 20
+    SIMILAR_CACHE_SIZE: int = 20000
+    SIMILAR_CACHE_TTL_SECONDS: int = 3600
+    SIMILAR_PRECOMPUTE_MOVIES: int = 2000
+    RECOMMENDATIONS_ENABLED: bool = True
+    RECOMMENDATIONS_REBUILD_SECONDS: int = 3600
+    RECOMMENDATIONS_NEIGHBOURS: int = 50
+    RECOMMENDATIONS_MAX_BASKET: int = 500
+    RECOMMENDATIONS_MAX_PAIRS: int = 20000000
+    RECOMMENDATIONS_CACHE_SIZE: int = 10000
+    RECOMMENDATIONS_CACHE_TTL_SECONDS: int = 300
     
     # External API settings
     TMDB_BEARER_TOKEN: str
+    TMDB_LOW_PRIORITY_RATE_PER_SECOND: float = 5.0
+    TMDB_LOW_PRIORITY_BURST: int = 5
 
     class Config:
         case_sensitive = True
@@ -0,0 +1,62 @@
+"""
+Metrics Module
+
+This module provides lightweight in-process metrics for the API.
+Values are kept per worker process and exposed as JSON through the
+metrics router; nothing is exported to an external system.
+
+Features:
+- Fixed-bucket latency histograms
+- Cheap observation suitable for hot paths
+"""
+
+import bisect
+from typing import Dict, Sequence
+
+# Upper bounds in milliseconds; the last bucket catches everything above
+DEFAULT_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+class Histogram:
+    """
+    Fixed-bucket histogram of durations in milliseconds.
+
+    Attributes:
+        buckets: Sorted bucket upper bounds in milliseconds
+        count: Number of observations
+        total: Sum of all observations in milliseconds
+        max: Largest observation in milliseconds
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        """Record one duration in milliseconds."""
+        self._counts[bisect.bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def snapshot(self) -> Dict:
+        """
+        Return the histogram as a JSON-serializable dict.
+
+        Bucket counts are cumulative, keyed by upper bound ("+Inf" for the last).
+        """
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets + (float("inf"),), self._counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total, 3),
+            "avg_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "buckets": buckets,
+        }
@@ -0,0 +1,118 @@
+"""
+Password Hashing Module
+
+This module runs bcrypt hashing and verification in a dedicated, bounded
+thread pool so a burst of logins or signups never blocks the event loop.
+bcrypt releases the GIL while hashing, so the work runs truly in parallel
+with request handling.
+
+Features:
+- Configurable concurrency cap (worker threads)
+- Bounded queue; excess work is rejected with 503 instead of piling up
+- Queue wait and hashing time histograms, plus live queue depth
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from fastapi import HTTPException, status
+
+from .config import get_settings
+from .metrics import Histogram
+
+settings = get_settings()
+
+class PasswordHashPool:
+    """
+    Bounded thread pool for CPU-heavy password hashing.
+
+    Attributes:
+        max_workers: Number of hashes computed concurrently
+        max_queue: Maximum calls waiting for a free worker
+        queued: Calls currently waiting for a worker
+        running: Calls currently being computed
+        rejected: Calls refused because the queue was full
+        wait_ms: Histogram of time spent waiting for a worker
+        run_ms: Histogram of time spent hashing
+
+    Notes:
+        - Counters are updated from both the event loop and worker threads,
+          so they are guarded by a lock
+        - A call cancelled while still queued (client disconnect, timeout)
+          leaves the queue at once; its job is skipped if a worker picks it up
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.rejected = 0
+        self.wait_ms = Histogram()
+        self.run_ms = Histogram()
+
+    def _timed(self, submitted: float, state: Dict[str, bool], func: Callable, args: tuple) -> Any:
+        started = time.perf_counter()
+        with self._lock:
+            if state["abandoned"]:
+                return None
+            state["started"] = True
+            self.queued -= 1
+            self.running += 1
+            self.wait_ms.observe((started - submitted) * 1000)
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.run_ms.observe((time.perf_counter() - started) * 1000)
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """
+        Run a hashing function on the pool and await its result.
+
+        Raises:
+            HTTPException: 503 if max_queue calls are already waiting
+        """
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many authentication requests, please retry shortly",
+                    headers={"Retry-After": "1"},
+                )
+            self.queued += 1
+        state = {"started": False, "abandoned": False}
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, self._timed, time.perf_counter(), state, func, args)
+        except asyncio.CancelledError:
+            with self._lock:
+                if not state["started"]:
+                    state["abandoned"] = True
+                    self.queued -= 1
+            raise
+
+    def stats(self) -> Dict:
+        """Return pool configuration, live depth and latency histograms."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self.queued,
+                "running": self.running,
+                "rejected": self.rejected,
+                "wait_ms": self.wait_ms.snapshot(),
+                "run_ms": self.run_ms.snapshot(),
+            }
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -0,0 +1,155 @@
+"""
+Principal Cache Module
+
+This module caches the lean principal that get_current_user resolves from
+a token subject, so most authenticated requests never touch the database.
+
+Features:
+- Short-TTL, size-bounded in-process cache (the default)
+- Optional Redis backend shared by all workers, enabled by SHARED_CACHE_URL
+- Invalidation after a commit that changes a user's identity or status,
+  or deletes the user
+
+Only active principals are cached. Redis support needs the optional
+`redis` package; without it the in-process cache is used.
+"""
+
+import asyncio
+import logging
+from typing import Iterable, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from .cache import LRUCache
+from .config import get_settings
+from ..models.user import User
+from ..schemas.user import Principal
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# User columns that a cached principal depends on
+PRINCIPAL_FIELDS = ("email", "username", "is_active", "hashed_password", "token_version")
+
+class PrincipalCache:
+    """
+    Cache of active principals keyed by token subject.
+
+    Attributes:
+        ttl: Lifetime of an entry in seconds
+        redis: Shared Redis client, or None to use the in-process cache
+
+    Notes:
+        - Keys are token subjects; a principal may be stored under both
+          its email and its ID, and invalidation removes both
+        - Redis errors are logged and treated as cache misses
+    """
+
+    def __init__(self, maxsize: int, ttl: float, redis_url: Optional[str] = None):
+        self.ttl = ttl
+        self._local = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.redis = None
+        if redis_url:
+            if redis is None:
+                logger.warning("SHARED_CACHE_URL is set but the redis package is not installed; using in-process principal cache")
+            else:
+                self.redis = redis.from_url(redis_url)
+
+    @staticmethod
+    def _redis_key(subject: str) -> str:
+        return f"principal:{subject}"
+
+    async def get(self, subject: str) -> Optional[Principal]:
+        """Return the cached principal for a token subject, if any."""
+        if self.redis is None:
+            return self._local.get(subject)
+        try:
+            raw = await self.redis.get(self._redis_key(subject))
+        except Exception as e:
+            logger.warning(f"Principal cache read failed: {str(e)}")
+            return None
+        return Principal.model_validate_json(raw) if raw else None
+
+    async def set(self, subject: str, principal: Principal) -> None:
+        """Cache an active principal under a token subject."""
+        if not principal.is_active:
+            return
+        if self.redis is None:
+            self._local.set(subject, principal)
+            return
+        try:
+            await self.redis.set(self._redis_key(subject), principal.model_dump_json(), ex=int(self.ttl))
+        except Exception as e:
+            logger.warning(f"Principal cache write failed: {str(e)}")
+
+    def invalidate(self, subjects: Iterable[str]) -> None:
+        """
+        Drop the principals cached under the given subjects.
+
+        Callable from synchronous code; with Redis the deletion is scheduled
+        on the running event loop.
+        """
+        subjects = list(subjects)
+        if self.redis is None:
+            for subject in subjects:
+                self._local.pop(subject)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.create_task(self._delete_shared(subjects))
+
+    async def _delete_shared(self, subjects: Iterable[str]) -> None:
+        try:
+            await self.redis.delete(*(self._redis_key(subject) for subject in subjects))
+        except Exception as e:
+            logger.warning(f"Principal cache invalidation failed: {str(e)}")
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    redis_url=settings.SHARED_CACHE_URL,
+)
+
+def _subjects_of(target: User) -> set:
+    """Every token subject a user's principal may be cached under."""
+    subjects = {str(target.id)}
+    email_history = inspect(target).attrs.email.history
+    subjects.update(email for email in (email_history.deleted or ()) if email)
+    if target.email:
+        subjects.add(target.email)
+    return subjects
+
+def _queue_invalidation(target: User) -> None:
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault("stale_principals", set()).update(_subjects_of(target))
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target: User) -> None:
+    """Queue invalidation when a column the principal depends on changed."""
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in PRINCIPAL_FIELDS):
+        _queue_invalidation(target)
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target: User) -> None:
+    _queue_invalidation(target)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(session) -> None:
+    """Drop stale principals once the change is visible to other requests."""
+    stale = session.info.pop("stale_principals", None)
+    if stale:
+        principal_cache.invalidate(stale)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session) -> None:
+    session.info.pop("stale_principals", None)
@@ -6,25 +6,37 @@ It handles JWT token generation and password hashing.
 
 Features:
 - JWT token generation and validation
-- Password hashing with bcrypt
+- Password hashing with bcrypt, off the event loop
 - Configurable token expiration
 - Refresh token support
+- Cache of verified access tokens, so repeat requests skip JWT decoding
+- Cached lean principals, so most requests skip the user lookup
+- Tokens identify users by UUID and carry a version claim for revocation
 """
 
 from datetime import datetime, timedelta
+import hashlib
+import time
 from typing import Optional, Annotated
+from uuid import UUID
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 import os
 from dotenv import load_dotenv
 import logging
 
+from .cache import LRUCache
+from .config import get_settings
+from .password_hashing import password_hash_pool
+from .principal import principal_cache
 from ..database.database import get_db
+from ..database.queries import principal_by_email_query, principal_by_id_query, user_by_email_query
+from ..database.routing import request_user_id
 from ..models.user import User
+from ..schemas.user import Principal
 
 load_dotenv()
 
@@ -43,7 +55,12 @@ REFRESH_TOKEN_EXPIRE_DAYS = 90  # 3 months
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+settings = get_settings()
+
+# Verified access token claims keyed by token hash, each kept until the token's exp
+_verified_access_tokens = LRUCache(maxsize=settings.ACCESS_TOKEN_CACHE_SIZE)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash.
     
@@ -53,10 +70,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         
     Returns:
         bool: True if password matches
+    
+    Notes:
+        - Runs on password_hash_pool; raises HTTPException 503 when its queue is full
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await password_hash_pool.run(pwd_context.verify, plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """
     Hash a password.
     
@@ -65,8 +85,23 @@ def get_password_hash(password: str) -> str:
         
     Returns:
         str: Hashed password
+    
+    Notes:
+        - Runs on password_hash_pool; raises HTTPException 503 when its queue is full
+    """
+    return await password_hash_pool.run(pwd_context.hash, password)
+
+def build_token_claims(user) -> dict:
+    """
+    Build the identity claims for a user's access and refresh tokens.
+    
+    Args:
+        user: User or Principal the tokens are issued to
+    
+    Returns:
+        dict: "sub" with the user's UUID and "ver" with their token version
     """
-    return pwd_context.hash(password)
+    return {"sub": str(user.id), "ver": user.token_version or 0}
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -130,9 +165,7 @@ def verify_token(token: str, secret_key: str = SECRET_KEY, verify_type: str = "a
         HTTPException: If token is invalid or expired
     """
     try:
-        logger.info(f"[Token Verify] Verifying {verify_type} token")
         payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
-        logger.info(f"[Token Verify] Token payload: {payload}")
         
         if payload.get("token_type") != verify_type:
             logger.error(f"[Token Verify] Invalid token type. Expected {verify_type}, got {payload.get('token_type')}")
@@ -167,10 +200,99 @@ def verify_token(token: str, secret_key: str = SECRET_KEY, verify_type: str = "a
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+def verify_access_token(token: str) -> dict:
+    """
+    Verify an access token, reusing the claims of a previously verified one.
+    
+    Args:
+        token: JWT access token
+    
+    Returns:
+        dict: Decoded token payload
+    
+    Raises:
+        HTTPException: If token is invalid or expired
+    
+    Notes:
+        - Claims are cached under the token's SHA-256 digest until its exp,
+          so a session's repeat requests skip decoding and signature checks
+        - Only successfully verified tokens are cached
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _verified_access_tokens.get(key)
+    if payload is not None:
+        return payload
+    
+    payload = verify_token(token, SECRET_KEY, "access")
+    remaining = payload.get("exp", 0) - time.time()
+    if remaining > 0:
+        _verified_access_tokens.set(key, payload, ttl=remaining)
+    return payload
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+async def resolve_principal(payload: dict, db: AsyncSession) -> Principal:
+    """
+    Resolve the principal a verified token payload refers to.
+    
+    Args:
+        payload: Verified access or refresh token claims
+        db: Database session, only used on a principal cache miss
+    
+    Returns:
+        Principal: The token's active principal
+    
+    Raises:
+        HTTPException: If the subject is invalid, the user is missing or
+        inactive, or the token was revoked
+    
+    Notes:
+        - "sub" is the user's UUID, resolved by primary key
+        - While ACCEPT_LEGACY_TOKEN_SUBJECTS is on, tokens issued before the
+          switch (sub=email, no "ver" claim) are still accepted
+        - A "ver" claim lower than the user's token_version means the token
+          was revoked; the check runs against the cached principal
+    """
+    subject = payload.get("sub")
+    if not subject:
+        raise _unauthorized("Invalid token claims")
+    try:
+        user_id = UUID(subject)
+        query = principal_by_id_query(user_id)
+    except ValueError:
+        if not settings.ACCEPT_LEGACY_TOKEN_SUBJECTS:
+            raise _unauthorized("Invalid token claims")
+        query = principal_by_email_query(subject)
+    
+    principal = await principal_cache.get(subject)
+    if principal is None:
+        result = await db.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            logger.error(f"[Auth] User not found for token subject: {subject}")
+            raise _unauthorized("User not found")
+        principal = Principal.model_validate(row)
+        await principal_cache.set(subject, principal)
+    
+    if not principal.is_active:
+        raise _unauthorized("Inactive user")
+    version = payload.get("ver")
+    if version is None:
+        if not settings.ACCEPT_LEGACY_TOKEN_SUBJECTS:
+            raise _unauthorized("Invalid token claims")
+    elif version != principal.token_version:
+        raise _unauthorized("Token has been revoked")
+    return principal
+
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> Principal:
     """
     FastAPI dependency for getting the current authenticated user.
     
@@ -179,49 +301,25 @@ async def get_current_user(
         db: Database session (injected by FastAPI)
     
     Returns:
-        User: Current authenticated user
+        Principal: Lean identity of the current authenticated user
     
     Raises:
-        HTTPException: If token is invalid or user not found
-    """
-    logger.info("[Auth] Validating access token")
+        HTTPException: If token is invalid or revoked, or user not found or inactive
     
+    Notes:
+        - The principal comes from principal_cache when possible; the
+          session only opens a connection on a cache miss
+    """
     try:
-        # First try to decode without verification to log the token contents
-        try:
-            unverified_payload = jwt.decode(token, options={"verify_signature": False})
-            logger.info(f"[Auth] Token claims: exp={unverified_payload.get('exp')}, iat={unverified_payload.get('iat')}, type={unverified_payload.get('token_type')}")
-        except Exception as e:
-            logger.error(f"[Auth] Could not decode token for logging: {str(e)}")
+        payload = verify_access_token(token)
+        principal = await resolve_principal(payload, db)
         
-        # Now do the actual verification
-        payload = verify_token(token, SECRET_KEY, "access")
-        email: str = payload.get("sub")
-        if email is None:
-            logger.error("[Auth] No email found in token payload")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token claims",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-            
-        logger.info(f"[Auth] Token validated successfully for user: {email}")
-        
-        # Verify user exists
-        query = select(User).where(User.email == email)
-        result = await db.execute(query)
-        user = result.scalar_one_or_none()
-        
-        if user is None:
-            logger.error(f"[Auth] User not found for email: {email}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-            
-        return user
+        # Lets the database layer attribute this request's writes to the user
+        request_user_id.set(principal.id)
+        return principal
         
+    except HTTPException:
+        raise
     except jwt.ExpiredSignatureError as e:
         logger.error(f"[Auth] Token has expired: {str(e)}")
         raise HTTPException(
@@ -256,11 +354,10 @@ async def authenticate_user(email: str, password: str, db: AsyncSession) -> Opti
     Returns:
         Optional[User]: Authenticated user or None if authentication fails
     """
-    query = select(User).where(User.email == email)
-    result = await db.execute(query)
+    result = await db.execute(user_by_email_query(email))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(password, user.hashed_password):
+    if not user or not await verify_password(password, user.hashed_password):
         return None
         
     return user 
\ No newline at end of file
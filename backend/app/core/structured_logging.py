@@ -0,0 +1,130 @@
+"""
+Structured Logging Module
+
+This module provides a thin structured layer over the standard logging
+package for request hot paths.
+
+Features:
+- Event name plus key=value fields, formatted only when a record is emitted
+- Lazy field values: wrap expensive diagnostics in lazy() and they are
+  computed only if the record is actually written
+- Per-logger sampling of DEBUG/INFO records (LOG_SAMPLE_RATES); warnings
+  and errors are never sampled
+- Per-request debug opt-in: a request carrying the LOG_DEBUG_HEADER with
+  the LOG_DEBUG_TOKEN value logs everything at DEBUG, unsampled
+
+Usage:
+    log = get_logger(__name__)
+    log.info("tmdb_request", path=path, status=status)
+    log.debug("filter_loaded", setting=lazy(lambda: describe(setting)))
+"""
+
+from contextvars import ContextVar
+import logging
+import random
+from typing import Any, Callable, Dict
+
+from .config import get_settings
+
+settings = get_settings()
+
+# Whether the current request opted in to debug logging
+request_debug: ContextVar[bool] = ContextVar("request_debug", default=False)
+
+class lazy:
+    """Field value computed only when the log record is formatted."""
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
+    def __str__(self) -> str:
+        try:
+            return str(self.func())
+        except Exception as e:
+            return f"<lazy field failed: {e!r}>"
+
+    __repr__ = __str__
+
+class _StructuredMessage:
+    """Log message rendered as 'event key=value ...' on first use."""
+
+    __slots__ = ("event", "fields")
+
+    def __init__(self, event: str, fields: Dict[str, Any]):
+        self.event = event
+        self.fields = fields
+
+    def __str__(self) -> str:
+        if not self.fields:
+            return self.event
+        return self.event + " " + " ".join(f"{key}={value}" for key, value in self.fields.items())
+
+class StructuredLogger:
+    """
+    Structured, sampled wrapper around a standard logger.
+
+    Attributes:
+        logger: The wrapped logging.Logger
+        sample_rate: Fraction of DEBUG/INFO records kept (1.0 keeps all)
+    """
+
+    def __init__(self, name: str, sample_rate: float = 1.0):
+        self.logger = logging.getLogger(name)
+        self.sample_rate = sample_rate
+
+    def enabled_for(self, level: int) -> bool:
+        """Whether a record at level would be written for the current request."""
+        return request_debug.get() or self.logger.isEnabledFor(level)
+
+    def debug_enabled(self) -> bool:
+        """Whether DEBUG records are written; guard expensive diagnostics with it."""
+        return self.enabled_for(logging.DEBUG)
+
+    def _log(self, level: int, event: str, fields: Dict[str, Any]) -> None:
+        if request_debug.get():
+            # Bypass the logger's level so opted-in requests see everything
+            record = self.logger.makeRecord(
+                self.logger.name, level, "(structured)", 0,
+                _StructuredMessage(event, fields), None, None,
+            )
+            self.logger.handle(record)
+            return
+        if not self.logger.isEnabledFor(level):
+            return
+        if level < logging.WARNING and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        self.logger.log(level, _StructuredMessage(event, fields), stacklevel=3)
+
+    def debug(self, event: str, **fields: Any) -> None:
+        self._log(logging.DEBUG, event, fields)
+
+    def info(self, event: str, **fields: Any) -> None:
+        self._log(logging.INFO, event, fields)
+
+    def warning(self, event: str, **fields: Any) -> None:
+        self._log(logging.WARNING, event, fields)
+
+    def error(self, event: str, **fields: Any) -> None:
+        self._log(logging.ERROR, event, fields)
+
+def get_logger(name: str) -> StructuredLogger:
+    """
+    Return a structured logger for a module.
+
+    Args:
+        name: Logger name, usually __name__
+
+    Returns:
+        StructuredLogger: Logger sampled at the LOG_SAMPLE_RATES entry for
+        name or its closest configured parent (default 1.0)
+    """
+    rate = 1.0
+    parts = name.split(".")
+    for end in range(len(parts), 0, -1):
+        prefix = ".".join(parts[:end])
+        if prefix in settings.LOG_SAMPLE_RATES:
+            rate = settings.LOG_SAMPLE_RATES[prefix]
+            break
+    return StructuredLogger(name, rate)
@@ -4,22 +4,34 @@ Database Module
 This module provides core database functionality:
 - Base models
 - Session management
-- Engine configuration
+- Engine configuration (primary and read replicas)
+- Connection pool metrics
 - Migration support
 
 All database-related core functionality is centralized here.
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Tuple
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import get_settings
+from app.core.metrics import Histogram
 import logging
+import time
 from urllib.parse import urlparse, urlunparse
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Whether the current checkout is already being timed; QueuePool._do_get
+# retries by calling itself, and concurrent checkouts each run in their own
+# greenlet and context, so the flag must not live on the pool
+_timing_checkout: ContextVar[bool] = ContextVar("timing_checkout", default=False)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -40,27 +52,130 @@ def get_sync_engine():
     from sqlalchemy import create_engine
     return create_engine(sync_url, poolclass=QueuePool)
 
-def get_async_engine():
-    # Parse the URL to ensure correct format
-    parsed = urlparse(str(settings.DATABASE_URL))
-    # Force asyncpg driver for async operations
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records checkout latency, waits and timeouts.
+    
+    Attributes:
+        checkout_latency: Histogram of time spent obtaining a connection
+        wait_time: Histogram of checkouts that had to wait for a free connection
+        timeouts: Number of checkouts that gave up after pool_timeout
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_latency = Histogram()
+        self.wait_time = Histogram()
+        self.timeouts = 0
+
+    def _do_get(self):
+        # Only time the outermost call of this checkout
+        if _timing_checkout.get():
+            return super()._do_get()
+        # Only a checkout with no idle connection and no overflow left waits
+        exhausted = (
+            self._pool.empty()
+            and self._max_overflow > -1
+            and self._overflow >= self._max_overflow
+        )
+        start = time.perf_counter()
+        token = _timing_checkout.set(True)
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            _timing_checkout.reset(token)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.checkout_latency.observe(elapsed_ms)
+            if exhausted:
+                self.wait_time.observe(elapsed_ms)
+
+def get_pool_stats(engine: AsyncEngine) -> Dict:
+    """
+    Report live connection pool usage for an engine.
+    
+    Args:
+        engine: Engine whose pool to inspect
+    
+    Returns:
+        Dict: Pool size, checked-out and idle connections, overflow in use,
+        timeouts and checkout/wait latency histograms
+    """
+    pool = engine.pool
+    stats = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+    }
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update({
+            "timeouts": pool.timeouts,
+            "checkout_latency": pool.checkout_latency.snapshot(),
+            "wait_time": pool.wait_time.snapshot(),
+        })
+    return stats
+
+def _to_async_url(url: str) -> str:
+    """Force the asyncpg driver on a database URL."""
+    parsed = urlparse(str(url))
     if not parsed.scheme.endswith('+asyncpg'):
-        async_url = urlunparse(parsed._replace(scheme='postgresql+asyncpg'))
-    else:
-        async_url = str(settings.DATABASE_URL)
+        return urlunparse(parsed._replace(scheme='postgresql+asyncpg'))
+    return str(url)
+
+def create_engine_for_url(url: str) -> AsyncEngine:
+    """
+    Create an async engine with the application's pool settings.
     
+    Args:
+        url: Database connection string
+    
+    Returns:
+        AsyncEngine: New engine for the given database
+    """
+    async_url = _to_async_url(url)
     logger.info(f"Creating async engine with URL scheme: {urlparse(async_url).scheme}")
     return create_async_engine(
         async_url,
-        pool_size=20,  # Maximum number of connections in the pool
-        max_overflow=10,  # Maximum number of connections that can be created beyond pool_size
-        pool_timeout=30,  # Timeout for getting a connection from the pool
-        pool_pre_ping=True,  # Enable connection health checks
-        pool_recycle=3600,  # Recycle connections after 1 hour
-        echo=settings.DEBUG,  # SQL query logging based on debug mode
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,  # Connections kept open in the pool
+        max_overflow=settings.DB_MAX_OVERFLOW,  # Extra connections allowed beyond pool_size
+        pool_timeout=settings.DB_POOL_TIMEOUT,  # Seconds to wait for a free connection
+        pool_pre_ping=settings.DB_POOL_PRE_PING,  # Round-trip liveness check on every checkout
+        pool_recycle=settings.DB_POOL_RECYCLE,  # Replace connections older than this many seconds
+        echo=settings.DB_ECHO,  # Log every SQL statement
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # Compiled statement cache
+        connect_args={
+            # asyncpg prepared statements kept per connection
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        },
     )
 
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the process-wide engine for the primary database.
+    
+    The engine (and its connection pool) is created once and shared by
+    every session, so requests reuse pooled connections.
+    """
+    return create_engine_for_url(settings.DATABASE_URL)
+
+@lru_cache()
+def get_replica_engines() -> Tuple[AsyncEngine, ...]:
+    """
+    Get the process-wide engines for the configured read replicas.
+    
+    Returns:
+        Tuple[AsyncEngine, ...]: One engine per entry in DATABASE_REPLICA_URLS
+    """
+    return tuple(create_engine_for_url(url) for url in settings.DATABASE_REPLICA_URLS)
+
 # Create session factory
+@lru_cache()
 def get_session_maker():
     return sessionmaker(
         get_async_engine(),
@@ -0,0 +1,165 @@
+"""
+Database Routing Module
+
+This module routes read-only sessions to read replicas and everything else
+to the primary database.
+
+Features:
+- Round-robin selection across healthy replicas
+- Periodic replica health checks with automatic failover to the primary
+- Read-your-writes window: a user's reads stay on the primary for a short
+  time after any transaction of theirs commits a write
+
+With no replicas configured every session goes to the primary.
+"""
+
+import asyncio
+from contextvars import ContextVar
+import itertools
+import logging
+from typing import Dict, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+from app.database.database import get_async_engine, get_replica_engines
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# ID of the authenticated user for the current request, set by get_current_user
+request_user_id: ContextVar[Optional[UUID]] = ContextVar("request_user_id", default=None)
+
+class ReplicaRouter:
+    """
+    Chooses the engine that serves a session.
+
+    Attributes:
+        primary: Engine for the primary database
+        replicas: Engines for the read replicas
+        health_check_seconds: Interval between replica health checks
+
+    Notes:
+        - Replicas are assumed healthy until a check fails
+        - A failing replica is skipped until a later check succeeds
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        read_your_writes_seconds: float = 10,
+        health_check_seconds: float = 15,
+    ):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.health_check_seconds = health_check_seconds
+        self._healthy = list(self.replicas)
+        self._counter = itertools.count()
+        self._recent_writers = LRUCache(maxsize=100000, ttl=read_your_writes_seconds)
+        self._session_makers: Dict[int, sessionmaker] = {}
+        self._health_task: Optional[asyncio.Task] = None
+
+    def mark_write(self, user_id: UUID) -> None:
+        """Pin a user's reads to the primary for the read-your-writes window."""
+        self._recent_writers.set(user_id, True)
+
+    def engine_for_read(self, user_id: Optional[UUID] = None) -> AsyncEngine:
+        """
+        Pick the engine for a read-only session.
+
+        Args:
+            user_id: Optional UUID of the user the session reads for
+
+        Returns:
+            AsyncEngine: The next healthy replica, or the primary if the user
+            wrote recently or no replica is healthy
+        """
+        if user_id is not None and user_id in self._recent_writers:
+            return self.primary
+        healthy = self._healthy
+        if not healthy:
+            return self.primary
+        return healthy[next(self._counter) % len(healthy)]
+
+    def session_maker_for(self, engine: AsyncEngine) -> sessionmaker:
+        """Return the (cached) session factory bound to an engine."""
+        maker = self._session_makers.get(id(engine))
+        if maker is None:
+            maker = sessionmaker(
+                engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autocommit=False,
+                autoflush=False,
+            )
+            self._session_makers[id(engine)] = maker
+        return maker
+
+    async def check_health(self, timeout: float = 2.0) -> None:
+        """Probe every replica with SELECT 1 and refresh the healthy set."""
+        healthy = []
+        for engine in self.replicas:
+            try:
+                async with engine.connect() as conn:
+                    await asyncio.wait_for(conn.execute(text("SELECT 1")), timeout)
+                healthy.append(engine)
+            except Exception as e:
+                logger.warning(f"Read replica {engine.url.host} failed health check: {str(e)}")
+        self._healthy = healthy
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_seconds)
+            await self.check_health()
+
+    def start(self) -> None:
+        """Start periodic health checks if any replicas are configured."""
+        if self.replicas and self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        """Stop periodic health checks."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
+replica_router = ReplicaRouter(
+    get_async_engine(),
+    get_replica_engines(),
+    read_your_writes_seconds=settings.READ_YOUR_WRITES_SECONDS,
+    health_check_seconds=settings.REPLICA_HEALTH_CHECK_SECONDS,
+)
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_statement_writes(orm_execute_state) -> None:
+    """Remember that a session ran an INSERT, UPDATE or DELETE statement."""
+    state = orm_execute_state
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["has_writes"] = True
+
+@event.listens_for(Session, "after_flush")
+def _flag_flush_writes(session, flush_context) -> None:
+    """Remember that a session flushed pending objects."""
+    session.info["has_writes"] = True
+
+@event.listens_for(Session, "after_commit")
+def _record_user_write(session) -> None:
+    """Open the read-your-writes window for the request's user after a write commits."""
+    if not session.info.pop("has_writes", False):
+        return
+    user_id = request_user_id.get()
+    if user_id is not None:
+        replica_router.mark_write(user_id)
+
+@event.listens_for(Session, "after_rollback")
+def _clear_write_flag(session) -> None:
+    session.info.pop("has_writes", None)
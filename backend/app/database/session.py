@@ -2,12 +2,17 @@
 Database Session Module
 
 This module provides database session management for SQLAlchemy.
-It handles both async and sync database connections.
+It handles both async and sync database connections, and routes
+read-only sessions to read replicas when they are configured.
 """
 
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
+from app.core.security import get_current_user
 from app.database.database import get_async_engine
+from app.database.routing import replica_router
+from app.schemas.user import Principal
 
 # Create async session factory using our configured engine
 AsyncSessionLocal = sessionmaker(
@@ -33,4 +38,25 @@ async def get_db() -> AsyncSession:
             await session.rollback()
             raise
         finally:
-            await session.close() 
\ No newline at end of file
+            await session.close()
+
+async def get_read_db(current_user: Principal = Depends(get_current_user)) -> AsyncSession:
+    """
+    Get a database session for read-only endpoints.
+    
+    The session is served by a healthy read replica in round-robin order,
+    unless the user committed a write within the read-your-writes window
+    or no replica is available, in which case the primary is used.
+    
+    Args:
+        current_user: Current authenticated user (injected by FastAPI)
+    
+    Yields:
+        AsyncSession: Database session that must not be used for writes
+    """
+    engine = replica_router.engine_for_read(current_user.id)
+    async with replica_router.session_maker_for(engine)() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
@@ -21,13 +21,22 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.config import get_settings
 from app.database.database import init_db
+from app.database.routing import replica_router
+from app.services.catalog_service import catalog_writer
+from app.services.catalog_sync import catalog_sync
+from app.services.autocomplete import title_index
+from app.services.discover_engine import discover_engine
+from app.services.similarity import similarity_index
+from app.services.recommendations import recommender
 from app.routers.auth import router as auth_router
 from app.routers.movies import router as movies_router
 from app.routers.proxy import router as proxy_router
 from app.routers.person import router as person_router
 from app.routers.lists import router as lists_router
 from app.routers.filter_settings import router as filter_settings_router
+from app.routers.metrics import router as metrics_router
 from app.core.logging_config import configure_logging
+from app.middleware.logging import RequestLoggingMiddleware
 import logging.config
 import logging
 
@@ -46,6 +55,9 @@ app = FastAPI(
     debug=settings.DEBUG
 )
 
+# Structured request logging and per-request debug opt-in
+app.add_middleware(RequestLoggingMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -92,6 +104,12 @@ app.include_router(
     tags=["filter-settings"],
 )
 
+app.include_router(
+    metrics_router,
+    prefix="/api/metrics",
+    tags=["metrics"],
+)
+
 @app.get("/")
 async def root():
     """Root endpoint returning API status"""
@@ -105,8 +123,26 @@ async def root():
 async def startup_event():
     """Startup event handler"""
     logger.info("Starting up CineFiles API")
+    replica_router.start()
+    catalog_writer.start()
+    title_index.start()
+    if settings.SIMILAR_LOCAL_ENABLED:
+        similarity_index.start()
+    if settings.DISCOVER_LOCAL_ENABLED or settings.SIMILAR_LOCAL_ENABLED:
+        discover_engine.start()
+    if settings.CATALOG_SYNC_ENABLED:
+        catalog_sync.start()
+    if settings.RECOMMENDATIONS_ENABLED:
+        recommender.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event handler"""
-    logger.info("Shutting down CineFiles API") 
\ No newline at end of file
+    logger.info("Shutting down CineFiles API")
+    await replica_router.stop() 
+    await catalog_sync.stop()
+    await title_index.stop()
+    await discover_engine.stop()
+    await similarity_index.stop()
+    await recommender.stop()
+    await catalog_writer.stop()
@@ -1,16 +1,63 @@
-from fastapi import Request
-import logging
+"""
+Request Logging Middleware
+
+Pure ASGI middleware that logs one structured record per request and
+applies the per-request debug opt-in.
+
+A request whose LOG_DEBUG_HEADER equals LOG_DEBUG_TOKEN runs with
+request_debug set, so every structured log call it makes is written at
+any level and unsampled. Without a configured token the header is ignored.
+"""
+
+import hmac
 import time
 
-logger = logging.getLogger(__name__)
-
-async def logging_middleware(request: Request, call_next):
-    start_time = time.time()
-    logger.info(f"Request started: {request.method} {request.url}")
-    
-    response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    logger.info(f"Request completed: {request.method} {request.url} - Status: {response.status_code} - Time: {process_time:.2f}s")
-    
-    return response 
\ No newline at end of file
+from app.core.config import get_settings
+from app.core.structured_logging import get_logger, request_debug
+
+settings = get_settings()
+log = get_logger(__name__)
+
+_debug_header = settings.LOG_DEBUG_HEADER.lower().encode("latin-1")
+_debug_token = settings.LOG_DEBUG_TOKEN.encode("latin-1") if settings.LOG_DEBUG_TOKEN else None
+
+class RequestLoggingMiddleware:
+    """Log method, path, status and duration of each HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    def _debug_requested(self, scope) -> bool:
+        if _debug_token is None:
+            return False
+        for name, value in scope["headers"]:
+            if name == _debug_header:
+                return hmac.compare_digest(value, _debug_token)
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_debug.set(self._debug_requested(scope))
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            log.info(
+                "request",
+                method=scope["method"],
+                path=scope["path"],
+                status=status_code,
+                ms=round((time.perf_counter() - start) * 1000, 1),
+            )
+            request_debug.reset(token)
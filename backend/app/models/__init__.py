@@ -1,5 +1,7 @@
 from .user import User
 from .list_models import List, ListItem
+from .movie import Movie
+from .sync_state import SyncState
 
 # Import all models here to ensure they are registered with SQLAlchemy
-__all__ = ["User", "List", "ListItem"] 
\ No newline at end of file
+__all__ = ["User", "List", "ListItem", "Movie", "SyncState"] 
\ No newline at end of file
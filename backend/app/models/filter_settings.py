@@ -1,17 +1,30 @@
 from datetime import datetime
-from typing import Optional
-from sqlalchemy import String, Text, DateTime, ForeignKey, Boolean, Integer, Float
+from typing import List, Optional
+from sqlalchemy import String, Text, DateTime, ForeignKey, Boolean, Integer, Float, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 
 from app.database.database import Base
 
 class FilterSettings(Base):
     """
     FilterSettings model for storing user's filter preferences.
+
+    ID and code filters are native Postgres arrays with GIN indexes, so
+    "all filters that reference genre 27" is an indexed containment query
+    (e.g. FilterSettings.genres.contains([27])).
     """
     __tablename__ = "filter_settings"
+    __table_args__ = (
+        Index("ix_filter_settings_genres", "genres", postgresql_using="gin"),
+        Index("ix_filter_settings_watch_providers", "watch_providers", postgresql_using="gin"),
+        Index("ix_filter_settings_companies", "companies", postgresql_using="gin"),
+        Index("ix_filter_settings_cast", "cast", postgresql_using="gin"),
+        Index("ix_filter_settings_crew", "crew", postgresql_using="gin"),
+        Index("ix_filter_settings_include_keywords", "include_keywords", postgresql_using="gin"),
+        Index("ix_filter_settings_exclude_keywords", "exclude_keywords", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"))
@@ -39,29 +52,29 @@ class FilterSettings(Base):
     runtime_lte: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     
     # Genre, language, and other filters
-    genres: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated genre IDs
+    genres: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)  # Genre IDs
     original_language: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)  # e.g., 'en', 'es'
-    spoken_languages: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated language codes
+    spoken_languages: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text), nullable=True)  # Language codes
     
     # Release type (1: Premiere, 2: Limited, 3: Theatrical, 4: Digital, 5: Physical, 6: TV)
-    release_types: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated numbers
+    release_types: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)  # Release type numbers
     
     # Watch providers and region
-    watch_providers: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated provider IDs
+    watch_providers: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)  # Provider IDs
     watch_region: Mapped[Optional[str]] = mapped_column(String(2), nullable=True)  # ISO 3166-1 country code
-    watch_monetization_types: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated types (free, ads, rent, buy)
+    watch_monetization_types: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text), nullable=True)  # Types (free, ads, rent, buy)
     
     # Company and country filters
-    companies: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated company IDs
-    origin_countries: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated ISO 3166-1 codes
+    companies: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)  # Company IDs
+    origin_countries: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text), nullable=True)  # ISO 3166-1 codes
     
     # Cast and crew filters
-    cast: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated person IDs
-    crew: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated person IDs
+    cast: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)  # Person IDs
+    crew: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)  # Person IDs
     
     # Keywords
-    include_keywords: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated keyword IDs
-    exclude_keywords: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Comma-separated keyword IDs
+    include_keywords: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)  # Keyword IDs
+    exclude_keywords: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)  # Keyword IDs
     
     # Sort options
     sort_by: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # e.g., 'popularity.desc'
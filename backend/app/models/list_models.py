@@ -14,11 +14,12 @@ Features:
 - Lazy loading of relationships
 - Unique constraints to prevent duplicates
 - Support for default system lists
+- Item count and last-added time kept on each list by a database trigger
 """
 
 from datetime import datetime
 from uuid import UUID, uuid4
-from sqlalchemy import Column, ForeignKey, String, Boolean, DateTime, Text, UniqueConstraint
+from sqlalchemy import Column, DDL, ForeignKey, Integer, String, Boolean, DateTime, Text, UniqueConstraint, Index, event
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Mapped, mapped_column
@@ -42,6 +43,8 @@ class List(Base):
         is_default (bool): Whether this is a system-generated default list
         created_at (datetime): Timestamp of list creation
         updated_at (datetime): Timestamp of last list update
+        item_count (int): Number of items in the list
+        last_item_added_at (datetime, optional): When the newest item was added
         items (relationship): One-to-many relationship with ListItem model
         user (relationship): Many-to-one relationship with User model
     
@@ -50,16 +53,20 @@ class List(Base):
         - Lists are automatically deleted when the user is deleted
         - Default lists are created automatically for new users
         - List items are loaded eagerly by default
+        - item_count and last_item_added_at are maintained by a trigger on
+          list_items; read them with a fresh query after writing items
     """
     __tablename__ = "lists"
 
     id: Mapped[UUID] = mapped_column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id: Mapped[UUID] = mapped_column(PostgresUUID(as_uuid=True), ForeignKey("users.id"))
+    user_id: Mapped[UUID] = mapped_column(PostgresUUID(as_uuid=True), ForeignKey("users.id"), index=True)
     name: Mapped[str] = mapped_column(String(100))
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     is_default: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    item_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    last_item_added_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Use string reference to avoid circular import
     items: Mapped[PyList["ListItem"]] = relationship("ListItem", back_populates="list", lazy="selectin", cascade="all, delete-orphan")
@@ -85,6 +92,7 @@ class ListItem(Base):
         - The same movie can appear in different lists
         - Movie IDs are stored as strings to match TMDB's format
         - Items are automatically deleted when their parent list is deleted
+        - (list_id, added_at, id) is indexed for keyset pagination
     """
     __tablename__ = "list_items"
 
@@ -98,4 +106,37 @@ class ListItem(Base):
 
     __table_args__ = (
         UniqueConstraint('list_id', 'movie_id', name='uix_list_movie'),
-    ) 
\ No newline at end of file
+        Index('ix_list_items_list_added', 'list_id', 'added_at', 'id'),
+    )
+
+# Keeps lists.item_count and lists.last_item_added_at in step with list_items.
+# Migration 017 installs the same trigger on existing databases.
+LIST_COUNTERS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION update_list_counters() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE lists
+        SET item_count = item_count + 1,
+            last_item_added_at = GREATEST(last_item_added_at, NEW.added_at)
+        WHERE id = NEW.list_id;
+        RETURN NEW;
+    END IF;
+    UPDATE lists
+    SET item_count = GREATEST(item_count - 1, 0),
+        last_item_added_at = (
+            SELECT max(added_at) FROM list_items WHERE list_id = OLD.list_id
+        )
+    WHERE id = OLD.list_id;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+LIST_COUNTERS_TRIGGER_SQL = """
+CREATE TRIGGER trg_list_items_counters
+AFTER INSERT OR DELETE ON list_items
+FOR EACH ROW EXECUTE FUNCTION update_list_counters()
+"""
+
+for _sql in (LIST_COUNTERS_FUNCTION_SQL, LIST_COUNTERS_TRIGGER_SQL):
+    event.listen(ListItem.__table__, "after_create", DDL(_sql).execute_if(dialect="postgresql"))
@@ -0,0 +1,103 @@
+"""
+Movie Model
+
+This module defines the SQLAlchemy model for the local movie catalog.
+Movies are written through from TMDB responses, so details and list
+hydration can be served from Postgres instead of TMDB.
+
+Features:
+- TMDB ID as primary key
+- Typed columns for the fields we filter, sort and display on
+- Latest raw TMDB payload kept as JSONB
+- Separate timestamps for listing data and full details
+- Keyword, cast, crew and company IDs for the posting index
+- Generated full-text search vector and trigram index for local title search
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy import BigInteger, Computed, DDL, Date, DateTime, Float, Index, Integer, String, Text, event, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database.database import Base
+
+class Movie(Base):
+    """
+    SQLAlchemy model representing a movie in the local catalog.
+    
+    Attributes:
+        id (int): TMDB ID of the movie
+        title (str): Title
+        original_title (str, optional): Title in the original language
+        original_language (str, optional): ISO 639-1 code of the original language
+        overview (str, optional): Plot summary
+        release_date (date, optional): Primary release date
+        vote_average (float, optional): Average TMDB rating
+        vote_count (int, optional): Number of TMDB votes
+        popularity (float, optional): TMDB popularity score
+        runtime (int, optional): Runtime in minutes (details only)
+        genre_ids (List[int]): TMDB genre IDs
+        poster_path (str, optional): TMDB poster image path
+        backdrop_path (str, optional): TMDB backdrop image path
+        payload (dict): Latest TMDB payload; the full details once fetched
+        fetched_at (datetime): When any TMDB response last updated the row
+        details_fetched_at (datetime, optional): When full details were last fetched
+        keyword_ids (List[int], optional): TMDB keyword IDs
+        cast_ids (List[int], optional): Person IDs of the top-billed cast
+        crew_ids (List[int], optional): Person IDs of key crew (director, writers, ...)
+        company_ids (List[int], optional): Production company IDs
+        search_vector: Title (weight A) and original title (weight B) as a
+            tsvector, generated by Postgres
+    
+    Notes:
+        - Listing responses (discover, search) never overwrite a details
+          payload or runtime
+        - search_vector is deferred; only search queries read it
+        - Facet ID columns are NULL until a details response carrying that
+          data is stored, and an empty array when it has none
+    """
+    __tablename__ = "movies"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    title: Mapped[str] = mapped_column(String(500))
+    original_title: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    original_language: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    overview: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    release_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    vote_average: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    vote_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    popularity: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    runtime: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    genre_ids: Mapped[List[int]] = mapped_column(ARRAY(Integer), default=list, server_default="{}")
+    poster_path: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    backdrop_path: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSONB)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    details_fetched_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    keyword_ids: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)
+    cast_ids: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)
+    crew_ids: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)
+    company_ids: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer), nullable=True)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(original_title, '')), 'B')",
+            persisted=True
+        ),
+        deferred=True
+    )
+
+    __table_args__ = (
+        Index('ix_movies_popularity', 'popularity'),
+        Index('ix_movies_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_movies_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+    )
+
+# The trigram index needs pg_trgm before the table is created
+event.listen(
+    Movie.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
@@ -0,0 +1,40 @@
+"""
+Sync State Model
+
+This module defines the SQLAlchemy model for the progress markers of
+background sync jobs, so a job resumes where it stopped after a restart.
+
+Features:
+- One row per job, keyed by job name
+- High-water mark of the data the job has fully processed
+- IDs the job failed to process, retried on its next run
+"""
+
+from datetime import datetime
+from typing import List
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database.database import Base
+
+class SyncState(Base):
+    """
+    SQLAlchemy model representing the progress of a sync job.
+    
+    Attributes:
+        name (str): Name of the job
+        high_water_mark (datetime): Point up to which the job has processed its source
+        failed_ids (List[int]): IDs before the mark that still need processing
+        updated_at (datetime): When the mark last moved
+    """
+    __tablename__ = "sync_state"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    high_water_mark: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    failed_ids: Mapped[List[int]] = mapped_column(ARRAY(Integer), default=list, server_default="{}")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
@@ -8,12 +8,13 @@ The User model includes:
 - Basic user information (email, optional username)
 - Authentication fields (hashed password)
 - Status flags (active)
+- Token version for revoking issued JWTs
 - Timestamps (creation, updates, last login)
 """
 
 from datetime import datetime
 from uuid import UUID, uuid4
-from sqlalchemy import String, Boolean, DateTime, func
+from sqlalchemy import String, Boolean, DateTime, Integer, event, func, inspect
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, List as PyList
@@ -30,6 +31,8 @@ class User(Base):
         username (str): Username for the user
         hashed_password (str): Bcrypt-hashed password
         is_active (bool): Whether the user account is active
+        token_version (int): Version claim tokens must carry; bumping it
+            revokes every token issued before
         created_at (datetime): Timestamp of account creation
         updated_at (datetime): Timestamp of last account update
         last_login (datetime): Timestamp of last successful login
@@ -41,10 +44,17 @@ class User(Base):
     username: Mapped[str] = mapped_column(String, unique=True)
     hashed_password: Mapped[str] = mapped_column(String)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    token_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     last_login: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Use string reference to avoid circular import
     lists: Mapped[PyList["List"]] = relationship("List", back_populates="user", lazy="selectin")
-    filter_settings: Mapped[PyList["FilterSettings"]] = relationship("FilterSettings", back_populates="user", lazy="selectin") 
\ No newline at end of file
+    filter_settings: Mapped[PyList["FilterSettings"]] = relationship("FilterSettings", back_populates="user", lazy="selectin")
+
+@event.listens_for(User, "before_update")
+def _revoke_tokens_on_password_change(mapper, connection, target: User) -> None:
+    """Invalidate all issued tokens when the password changes."""
+    if inspect(target).attrs.hashed_password.history.has_changes():
+        target.token_version = (target.token_version or 0) + 1
@@ -10,32 +10,47 @@ Features:
 - JWT-based authentication with refresh tokens
 - User session tracking with last login timestamp
 - Protected route for retrieving user profile
+- Deduplication of concurrent refreshes of the same refresh token
 """
 
+import asyncio
 from datetime import datetime
+import hashlib
 import logging
-from typing import Annotated
+from typing import Annotated, Dict
 from fastapi import APIRouter, Depends, HTTPException, status, Form, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from ..database.database import get_db
+from ..database.database import get_db, get_session_maker
+from ..database.queries import user_by_email_query
 from ..models.user import User
-from ..schemas.user import UserCreate, UserResponse
+from ..schemas.user import Principal, UserCreate, UserResponse
 from ..schemas.token import Token
+from ..services import list_service
+from ..core.cache import LRUCache
+from ..core.config import get_settings
 from ..core.security import (
     get_password_hash,
     create_access_token,
     create_refresh_token,
     get_current_user,
     authenticate_user,
+    build_token_claims,
+    resolve_principal,
     verify_token,
     REFRESH_SECRET_KEY
 )
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Token pairs recently minted per refresh token (keyed by its SHA-256), and
+# refreshes still in progress, so parallel requests and tabs that all hit a
+# 401 at once share one refresh instead of each signing a new pair
+_recent_refreshes = LRUCache(maxsize=10000, ttl=settings.REFRESH_GRACE_SECONDS)
+_refreshes_in_flight: Dict[bytes, asyncio.Task] = {}
 
 @router.post("/signup", response_model=UserResponse)
 async def signup(user: UserCreate, db: AsyncSession = Depends(get_db)):
@@ -53,8 +68,7 @@ async def signup(user: UserCreate, db: AsyncSession = Depends(get_db)):
         HTTPException: If email is already registered
     """
     # Check if user exists
-    query = select(User).where(User.email == user.email)
-    result = await db.execute(query)
+    result = await db.execute(user_by_email_query(user.email))
     existing_user = result.scalar_one_or_none()
     
     if existing_user:
@@ -64,7 +78,7 @@ async def signup(user: UserCreate, db: AsyncSession = Depends(get_db)):
         )
 
     # Create new user
-    hashed_password = get_password_hash(user.password) if user.password else None
+    hashed_password = await get_password_hash(user.password) if user.password else None
     db_user = User(
         email=user.email,
         username=user.email.split('@')[0],  # Use email prefix as username
@@ -76,6 +90,9 @@ async def signup(user: UserCreate, db: AsyncSession = Depends(get_db)):
     await db.commit()
     await db.refresh(db_user)
     
+    # Create the default lists up front so their IDs are cached before first use
+    await list_service.get_user_default_lists(db, db_user.id)
+    
     return db_user
 
 @router.post("/login", response_model=Token)
@@ -106,7 +123,7 @@ async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db:
     await db.commit()
     
     # Create both tokens
-    token_data = {"sub": user.email}
+    token_data = build_token_claims(user)
     access_token = create_access_token(data=token_data)
     refresh_token = create_refresh_token(data=token_data)
     
@@ -118,61 +135,28 @@ async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db:
         username=user.email
     )
 
-@router.post("/refresh", response_model=Token)
-async def refresh_token(refresh_token: str = Form(...), db: AsyncSession = Depends(get_db)):
+async def _issue_refreshed_tokens(refresh_token: str) -> Token:
     """
-    Create a new access token using a refresh token.
-    
-    Args:
-        refresh_token: Valid refresh token
-        db: Database session dependency
+    Verify a refresh token and mint a new access and refresh token pair.
     
-    Returns:
-        Token: New access token and refresh token
-        
-    Raises:
-        HTTPException: If refresh token is invalid
+    Runs as a task shared by concurrent refreshes, so it opens its own
+    session instead of borrowing one from the request that started it.
     """
-    logger.info("[Token Refresh] Starting token refresh process")
     try:
-        logger.info("[Token Refresh] Verifying refresh token")
         payload = verify_token(refresh_token, REFRESH_SECRET_KEY, "refresh")
-        email = payload.get("sub")
-        if not email:
-            logger.error("[Token Refresh] Invalid refresh token - no email in payload")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid refresh token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-            
-        # Verify user still exists
-        logger.info(f"[Token Refresh] Verifying user exists for email: {email}")
-        query = select(User).where(User.email == email)
-        result = await db.execute(query)
-        user = result.scalar_one_or_none()
+        # Also upgrades legacy email-subject tokens to the current claims
+        async with get_session_maker()() as db:
+            principal = await resolve_principal(payload, db)
         
-        if not user:
-            logger.error(f"[Token Refresh] User not found for email: {email}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-            
-        # Create new tokens
-        logger.info(f"[Token Refresh] Creating new tokens for user: {email}")
-        token_data = {"sub": email}
+        token_data = build_token_claims(principal)
         new_access_token = create_access_token(data=token_data)
         new_refresh_token = create_refresh_token(data=token_data)
         
-        logger.info("[Token Refresh] Successfully created new tokens")
-        # Return both tokens
         return Token(
             access_token=new_access_token,
             refresh_token=new_refresh_token,
             token_type="bearer",
-            username=email
+            username=principal.email
         )
         
     except HTTPException:
@@ -185,13 +169,56 @@ async def refresh_token(refresh_token: str = Form(...), db: AsyncSession = Depen
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+async def _refresh_shared(key: bytes, refresh_token: str) -> Token:
+    """Refresh once for every waiter and remember the result for the grace period."""
+    try:
+        tokens = await _issue_refreshed_tokens(refresh_token)
+        _recent_refreshes.set(key, tokens)
+        return tokens
+    finally:
+        _refreshes_in_flight.pop(key, None)
+
+@router.post("/refresh", response_model=Token)
+async def refresh_token(refresh_token: str = Form(...)):
+    """
+    Create a new access token using a refresh token.
+    
+    Args:
+        refresh_token: Valid refresh token
+    
+    Returns:
+        Token: New access token and refresh token
+        
+    Raises:
+        HTTPException: If refresh token is invalid or revoked
+    
+    Notes:
+        - Concurrent refreshes of the same token wait for a single refresh
+        - For REFRESH_GRACE_SECONDS afterwards, the same token gets the same
+          new pair back instead of a freshly signed one
+        - Every request, including the one that started the refresh, awaits
+          it shielded, so a cancelled request never cancels it for the others
+    """
+    key = hashlib.sha256(refresh_token.encode()).digest()
+    recent = _recent_refreshes.get(key)
+    if recent is not None:
+        return recent
+    
+    task = _refreshes_in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_refresh_shared(key, refresh_token))
+        # Retrieve the outcome even if every waiter was cancelled
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        _refreshes_in_flight[key] = task
+    return await asyncio.shield(task)
+
 @router.get("/me", response_model=UserResponse)
-async def read_users_me(current_user: Annotated[User, Depends(get_current_user)]):
+async def read_users_me(current_user: Annotated[Principal, Depends(get_current_user)]):
     """
     Retrieve the current authenticated user's profile.
     
     Args:
-        current_user: User object from the JWT token dependency
+        current_user: Principal from the JWT token dependency
     
     Returns:
         UserSchema: Current user's profile information
@@ -199,7 +226,7 @@ async def read_users_me(current_user: Annotated[User, Depends(get_current_user)]
     return current_user 
 
 @router.get("/test-auth", response_model=dict)
-async def test_auth(current_user: Annotated[User, Depends(get_current_user)]):
+async def test_auth(current_user: Annotated[Principal, Depends(get_current_user)]):
     """
     Test endpoint to verify authentication and token refresh.
     Returns timestamp to verify the request was successful.
@@ -211,7 +238,7 @@ async def test_auth(current_user: Annotated[User, Depends(get_current_user)]):
     } 
 
 @router.get("/test-auth-expiry")
-async def test_auth_expiry(request: Request, current_user: Annotated[User, Depends(get_current_user)]):
+async def test_auth_expiry(request: Request, current_user: Annotated[Principal, Depends(get_current_user)]):
     """
     Test endpoint that simulates token expiration by validating with a shorter expiry time.
     Only forces expiry on the first attempt, allows retry with refreshed token.
@@ -7,25 +7,27 @@ reading, updating, and deleting filter settings.
 
 from typing import List, Optional, Annotated
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, func, values, column, Integer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from uuid import UUID
-import logging
 
 from ..database.database import get_db
-from ..models.user import User
+from ..database.session import get_read_db
+from ..database.queries import homepage_filters_query
+from ..schemas.user import Principal
 from ..models.filter_settings import FilterSettings
 from ..schemas.filter_schemas import FilterSettingsCreate, FilterSettingsUpdate, FilterSettings as FilterSettingsSchema
 from ..core.security import get_current_user
+from ..core.structured_logging import get_logger
 
 router = APIRouter()
-logger = logging.getLogger(__name__)
+log = get_logger(__name__)
 
 @router.post("", response_model=FilterSettingsSchema)
 async def create_filter_setting(
     filter_setting: FilterSettingsCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -50,8 +52,8 @@ async def create_filter_setting(
 
 @router.get("", response_model=List[FilterSettingsSchema])
 async def get_filter_settings(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all filter settings for the current user.
@@ -63,17 +65,16 @@ async def get_filter_settings(
     Returns:
         List[FilterSettingsSchema]: List of user's filter settings
     """
-    logger.info(f"Fetching filter settings for user {current_user.id}")
     query = select(FilterSettings).where(FilterSettings.user_id == current_user.id)
     result = await db.execute(query)
     filters = result.scalars().all()
-    logger.info(f"Found {len(filters)} filter settings for user {current_user.id}")
+    log.debug("filter_settings_loaded", user_id=current_user.id, count=len(filters))
     return filters
 
 @router.get("/homepage", response_model=List[FilterSettingsSchema])
 async def get_homepage_filters(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all filter settings enabled for homepage display, ordered by homepage_display_order.
@@ -85,76 +86,79 @@ async def get_homepage_filters(
     Returns:
         List[FilterSettingsSchema]: List of homepage-enabled filter settings
     """
-    query = (
-        select(FilterSettings)
-        .where(
-            FilterSettings.user_id == current_user.id,
-            FilterSettings.is_homepage_enabled == True
-        )
-        .order_by(FilterSettings.homepage_display_order.nulls_last(), FilterSettings.created_at)
-    )
-    result = await db.execute(query)
+    result = await db.execute(homepage_filters_query(current_user.id))
     filters = result.scalars().all()
     return filters
 
 @router.put("/homepage/reorder", response_model=List[FilterSettingsSchema])
 async def reorder_homepage_filters(
     filter_ids: List[int],
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Update the display order of homepage filters.
     
+    The new order is written with a single UPDATE ... FROM (VALUES ...)
+    that also checks ownership; RETURNING reports which IDs were updated.
+    
     Args:
         filter_ids: List of filter IDs in desired order
         current_user: Current authenticated user
         db: Database session
     
     Returns:
-        List[FilterSettingsSchema]: Updated list of homepage filters
-    """
-    # First, verify all filters belong to the user
-    query = select(FilterSettings).where(
-        FilterSettings.user_id == current_user.id,
-        FilterSettings.id.in_(filter_ids)
-    )
-    result = await db.execute(query)
-    existing_filters = result.scalars().all()
+        List[FilterSettingsSchema]: All of the user's homepage filters in
+        their new order, including any not passed in
     
-    if len(existing_filters) != len(filter_ids):
+    Raises:
+        HTTPException: If an ID is duplicated, missing or owned by another user
+    """
+    if len(set(filter_ids)) != len(filter_ids):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid filter IDs provided"
+            detail="Duplicate filter IDs provided"
         )
     
-    # Update the order
-    for index, filter_id in enumerate(filter_ids):
-        await db.execute(
-            update(FilterSettings)
-            .where(FilterSettings.id == filter_id)
-            .values(homepage_display_order=index)
-        )
+    if not filter_ids:
+        return await get_homepage_filters(current_user, db)
     
-    await db.commit()
+    # Apply the whole ordering in one statement; the user_id predicate makes
+    # the ownership check part of the same UPDATE
+    new_order = values(
+        column("id", Integer),
+        column("display_order", Integer),
+        name="new_order"
+    ).data([(filter_id, index) for index, filter_id in enumerate(filter_ids)])
     
-    # Return the updated list
-    query = (
-        select(FilterSettings)
+    statement = (
+        update(FilterSettings)
         .where(
-            FilterSettings.user_id == current_user.id,
-            FilterSettings.is_homepage_enabled == True
+            FilterSettings.id == new_order.c.id,
+            FilterSettings.user_id == current_user.id
         )
-        .order_by(FilterSettings.homepage_display_order.nulls_last(), FilterSettings.created_at)
+        .values(homepage_display_order=new_order.c.display_order)
+        .returning(FilterSettings.id)
     )
-    result = await db.execute(query)
-    return result.scalars().all()
+    result = await db.execute(statement)
+    updated_ids = result.scalars().all()
+    
+    if len(updated_ids) != len(filter_ids):
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid filter IDs provided"
+        )
+    
+    await db.commit()
+    
+    return await get_homepage_filters(current_user, db)
 
 @router.get("/{filter_setting_id}", response_model=FilterSettingsSchema)
 async def get_filter_setting(
     filter_setting_id: int,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific filter setting by ID.
@@ -189,7 +193,7 @@ async def get_filter_setting(
 async def update_filter_setting(
     filter_setting_id: int,
     filter_setting_update: FilterSettingsUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -231,7 +235,7 @@ async def update_filter_setting(
 @router.delete("/{filter_setting_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_filter_setting(
     filter_setting_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
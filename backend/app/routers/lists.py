@@ -4,39 +4,54 @@ Lists Router
 This module handles all list-related endpoints including creating, updating, and managing movie lists.
 """
 
-from typing import Annotated, List
+from typing import Annotated, Dict, List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import and_, delete
-from ..database.session import get_db
-from ..models.user import User
+from ..database.session import get_db, get_read_db
+from ..schemas.user import Principal
 from ..models.list_models import List as ListModel, ListItem
 from ..schemas.list_schemas import (
     ListCreate,
     List as ListSchema,
     ListItemCreate,
     ListItem as ListItemSchema,
+    ListItemPage,
+    ListItemBulkRequest,
+    ListItemBulkResponse,
     ListStatusResponse,
+    ListStatusBulkRequest,
+    ListSummary,
+    MovieListMembership,
     ListUpdate
 )
 from ..core.security import get_current_user
 from ..services import list_service
+from ..services.recommendations import recommender
 
 router = APIRouter()
 
 @router.get("", response_model=List[ListSchema])
 async def get_user_lists(
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: AsyncSession = Depends(get_db)
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all lists for the current user."""
     return await list_service.get_user_lists(db, current_user.id)
 
+@router.get("/summary", response_model=List[ListSummary])
+async def get_user_list_summaries(
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get name, item count and last activity of the current user's lists, without items."""
+    return await list_service.get_user_list_summaries(db, current_user.id)
+
 @router.post("", response_model=ListSchema)
 async def create_list(
     list_data: ListCreate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new list for the current user."""
@@ -50,58 +65,150 @@ async def create_list(
     await db.refresh(db_list)
     return db_list
 
+@router.post("/status", response_model=Dict[str, MovieListMembership])
+async def get_movies_list_status(
+    request: ListStatusBulkRequest,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db)
+):
+    """Get watched, watchlist and custom list membership for many movies at once."""
+    movie_ids = list(dict.fromkeys(request.movie_ids))
+    return await list_service.get_movies_list_status(db, current_user.id, movie_ids)
+
 @router.post("/watched/{movie_id}", response_model=ListStatusResponse)
 async def toggle_watched_status(
     movie_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db)
 ):
     """Toggle whether a movie is marked as watched by the current user."""
-    return await list_service.toggle_watched_status(db, current_user.id, movie_id)
+    status = await list_service.toggle_watched_status(db, current_user.id, movie_id)
+    recommender.invalidate(current_user.id)
+    return status
 
 @router.post("/watchlist/{movie_id}", response_model=ListStatusResponse)
 async def toggle_watchlist_status(
     movie_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db)
 ):
     """Toggle whether a movie is in the current user's watchlist."""
-    return await list_service.toggle_watchlist_status(db, current_user.id, movie_id)
+    status = await list_service.toggle_watchlist_status(db, current_user.id, movie_id)
+    recommender.invalidate(current_user.id)
+    return status
+
+@router.get("/{list_id}/items", response_model=ListItemPage)
+async def get_list_items(
+    list_id: UUID,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_read_db),
+    after: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    limit: int = Query(50, ge=1, le=200)
+):
+    """Get one page of a list's items, most recently added first."""
+    # Verify list ownership
+    owner_id = await list_service.get_list_owner_id(db, list_id)
+    if owner_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="List not found"
+        )
+    
+    try:
+        position = list_service.decode_item_cursor(after) if after else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    
+    items, next_cursor = await list_service.get_list_items_page(db, list_id, position, limit)
+    return {"items": items, "next_cursor": next_cursor}
 
 @router.post("/{list_id}/items", response_model=ListItemSchema)
 async def add_movie_to_list(
     list_id: UUID,
     item_data: ListItemCreate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db)
 ):
     """Add a movie to a list."""
     # Verify list ownership
-    db_list = await list_service.get_list_by_id(db, list_id)
-    if not db_list or db_list.user_id != current_user.id:
+    owner_id = await list_service.get_list_owner_id(db, list_id)
+    if owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="List not found"
         )
     
-    return await list_service.add_movie_to_list(
+    item = await list_service.add_movie_to_list(
         db,
         list_id,
         item_data.movie_id,
         item_data.notes
     )
+    recommender.invalidate(current_user.id)
+    return item
+
+@router.post("/{list_id}/items/bulk", response_model=ListItemBulkResponse)
+async def add_movies_to_list(
+    list_id: UUID,
+    request: ListItemBulkRequest,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db)
+):
+    """Add many movies to a list in one transaction."""
+    # Verify list ownership
+    owner_id = await list_service.get_list_owner_id(db, list_id)
+    if owner_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="List not found"
+        )
+    
+    movie_ids = list(dict.fromkeys(request.movie_ids))
+    results = await list_service.add_movies_to_list(db, list_id, movie_ids)
+    recommender.invalidate(current_user.id)
+    return {
+        "results": results,
+        "changed": sum(1 for result in results if result["status"] == "added")
+    }
+
+@router.post("/{list_id}/items/bulk-delete", response_model=ListItemBulkResponse)
+async def remove_movies_from_list(
+    list_id: UUID,
+    request: ListItemBulkRequest,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db)
+):
+    """Remove many movies from a list in one transaction."""
+    # Verify list ownership
+    owner_id = await list_service.get_list_owner_id(db, list_id)
+    if owner_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="List not found"
+        )
+    
+    movie_ids = list(dict.fromkeys(request.movie_ids))
+    results = await list_service.remove_movies_from_list(db, list_id, movie_ids)
+    recommender.invalidate(current_user.id)
+    return {
+        "results": results,
+        "changed": sum(1 for result in results if result["status"] == "removed")
+    }
 
 @router.delete("/{list_id}/items/{movie_id}")
 async def remove_movie_from_list(
     list_id: UUID,
     movie_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db)
 ):
     """Remove a movie from a list."""
     # Verify list ownership
-    db_list = await list_service.get_list_by_id(db, list_id)
-    if not db_list or db_list.user_id != current_user.id:
+    owner_id = await list_service.get_list_owner_id(db, list_id)
+    if owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="List not found"
@@ -116,13 +223,14 @@ async def remove_movie_from_list(
     )
     await db.execute(query)
     await db.commit()
+    recommender.invalidate(current_user.id)
     return {"status": "success"}
 
 @router.put("/{list_id}", response_model=ListSchema)
 async def update_list(
     list_id: UUID,
     list_data: ListUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db)
 ):
     """Update an existing list's name and/or description."""
@@ -167,7 +275,7 @@ async def update_list(
 @router.delete("/{list_id}")
 async def delete_list(
     list_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a list and all its items."""
@@ -0,0 +1,144 @@
+"""
+Metrics Router
+
+This module exposes in-process runtime metrics as JSON. Every uvicorn worker
+keeps its own numbers, so each response is tagged with the worker's PID.
+
+The metrics expose pool internals, auth queue depth and sync errors, so
+every route requires METRICS_HEADER to carry METRICS_TOKEN. Without a
+configured token the routes answer 404.
+
+Features:
+- Live connection pool usage for the primary and each read replica
+- Checkout latency and wait time histograms
+- Password hashing pool queue depth and latency
+- Movie catalog write-through backlog and changes sync progress
+- Movie search latency by result source
+- Title autocomplete index size and memory
+- Local discover snapshot size and hit rate
+- Similar movies index size and neighbour cache hit rate
+- Recommendation model size and per-user cache hit rate
+"""
+
+import hmac
+import os
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from app.core.config import get_settings
+from app.core.password_hashing import password_hash_pool
+from app.database.database import get_async_engine, get_replica_engines, get_pool_stats
+from app.services.catalog_service import catalog_writer
+from app.services.catalog_sync import catalog_sync
+from app.services.search_service import search_latency
+from app.services.autocomplete import title_index
+from app.services.discover_engine import discover_engine
+from app.services.similarity import similarity_index
+from app.services.recommendations import recommender
+
+settings = get_settings()
+
+async def require_metrics_token(request: Request) -> None:
+    """
+    Allow a metrics request only if it carries the configured token.
+    
+    Raises:
+        HTTPException: 404 if metrics are disabled, 401 if the token is
+        missing or wrong
+    """
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    supplied = request.headers.get(settings.METRICS_HEADER, "")
+    if not hmac.compare_digest(supplied.encode(), settings.METRICS_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+
+router = APIRouter(dependencies=[Depends(require_metrics_token)])
+
+@router.get("/db-pool")
+async def get_db_pool_metrics():
+    """
+    Report connection pool metrics for this worker.
+    
+    Returns:
+        dict: Worker PID and per-engine pool statistics, keyed by
+        'primary' and 'replica-<n>'
+    """
+    pools = {"primary": get_pool_stats(get_async_engine())}
+    for index, engine in enumerate(get_replica_engines()):
+        pools[f"replica-{index}"] = get_pool_stats(engine)
+    return {"pid": os.getpid(), "pools": pools}
+
+@router.get("/password-hashing")
+async def get_password_hashing_metrics():
+    """
+    Report password hashing pool metrics for this worker.
+    
+    Returns:
+        dict: Worker PID, pool limits, live queue depth, rejections and
+        wait/run time histograms
+    """
+    return {"pid": os.getpid(), **password_hash_pool.stats()}
+
+@router.get("/catalog")
+async def get_catalog_metrics():
+    """
+    Report movie catalog write-through and sync counters for this worker.
+    
+    Returns:
+        dict: Worker PID, pending writes, rows written, dropped or failed,
+        and the changes sync's counters under 'sync'
+    """
+    return {"pid": os.getpid(), **catalog_writer.stats(), "sync": catalog_sync.stats()}
+
+@router.get("/search")
+async def get_search_metrics():
+    """
+    Report movie search latency for this worker.
+    
+    Returns:
+        dict: Worker PID and latency histograms for searches answered by
+        the local catalog and by TMDB
+    """
+    return {"pid": os.getpid(), **{source: histogram.snapshot() for source, histogram in search_latency.items()}}
+
+@router.get("/autocomplete")
+async def get_autocomplete_metrics():
+    """
+    Report title autocomplete index metrics for this worker.
+    
+    Returns:
+        dict: Worker PID, indexed titles and keys, overlay size, estimated
+        memory and last build time
+    """
+    return {"pid": os.getpid(), **title_index.stats()}
+
+@router.get("/discover")
+async def get_discover_metrics():
+    """
+    Report local discover engine metrics for this worker.
+    
+    Returns:
+        dict: Worker PID, snapshot size and memory, and queries served
+        locally or declined to TMDB
+    """
+    return {"pid": os.getpid(), **discover_engine.stats()}
+
+@router.get("/similar")
+async def get_similar_metrics():
+    """
+    Report similar movies index metrics for this worker.
+    
+    Returns:
+        dict: Worker PID, indexed movies and features, memory, neighbour
+        cache size and hit counts, and last refresh time
+    """
+    return {"pid": os.getpid(), **similarity_index.stats()}
+
+@router.get("/recommendations")
+async def get_recommendation_metrics():
+    """
+    Report recommendation model metrics for this worker.
+    
+    Returns:
+        dict: Worker PID, model size and memory, users in the last build,
+        per-user cache size and hit counts, and last build time
+    """
+    return {"pid": os.getpid(), **recommender.stats()}
@@ -7,30 +7,50 @@ and implementing custom movie news scraping functionality.
 Features:
 - Popular, top-rated, and upcoming movies listings
 - Movie search functionality
+- Title autocomplete from an in-memory index
+- Filtered and saved-filter discovery from an in-memory catalog snapshot
 - Detailed movie information retrieval
 - Cast and crew information
+- Similar movies from catalog content vectors
+- Personalized recommendations from list co-occurrence
 - Movie trailers and videos
 - Movie news aggregation from various sources
 - Watch providers information
+- Batched movie details for list hydration
 
 All movie data is sourced from TMDB API, while news is scraped from configured news sources.
 Responses maintain TMDB's original structure for consistency and completeness.
+Every TMDB movie response is written through to the local catalog, which
+then serves movie details while they are fresh and answers searches it
+has enough matches for.
 """
 
+import asyncio
+import time
 from fastapi import APIRouter, HTTPException, Request, Query, Depends
 from typing import Optional, Tuple
 import httpx
 from app.utils.tmdb import get_tmdb_url, HEADERS
 from app.utils.scraper import scrape_movie_news
-import logging
 from datetime import datetime, timedelta
 import json
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.database import get_db
 from app.models.filter_settings import FilterSettings
 from sqlalchemy import select
+from app.core.config import get_settings
+from app.core.security import get_current_user
+from app.schemas.user import Principal
+from app.core.structured_logging import get_logger, lazy
+from app.services import catalog_service, search_service
+from app.services.autocomplete import title_index
+from app.services.catalog_service import catalog_writer
+from app.services.discover_engine import discover_engine
+from app.services.similarity import similarity_index
+from app.services.recommendations import recommender
 
-logger = logging.getLogger(__name__)
+log = get_logger(__name__)
+settings = get_settings()
 router = APIRouter()
 
 @router.get("/genres")
@@ -42,7 +62,7 @@ async def get_movie_genres():
         try:
             url = get_tmdb_url("genre/movie/list")
             params = {"language": "en-US"}
-            logger.info(f"Fetching genres from TMDB: {url} with params {params}")
+            log.debug("tmdb_request", url=url, params=params)
             
             response = await client.get(
                 url,
@@ -51,21 +71,21 @@ async def get_movie_genres():
             )
             
             if not response.is_success:
-                logger.error(f"TMDB API error response: {response.status_code} - {response.text}")
+                log.error("tmdb_error_response", endpoint="get_movie_genres", status=response.status_code, body=response.text)
                 raise HTTPException(
                     status_code=response.status_code,
                     detail=f"TMDB API error: {response.text}"
                 )
                 
             data = response.json()
-            logger.info(f"Successfully fetched {len(data.get('genres', []))} genres from TMDB")
+            log.debug("tmdb_response", endpoint="get_movie_genres", genres=lazy(lambda: len(data.get("genres", []))))
             return data
             
         except httpx.HTTPError as e:
-            logger.error(f"TMDB API error in get_movie_genres: {str(e)}")
+            log.error("tmdb_error", endpoint="get_movie_genres", error=e)
             raise HTTPException(status_code=500, detail=f"TMDB API error: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error in get_movie_genres: {str(e)}")
+            log.error("unexpected_error", endpoint="get_movie_genres", error=e)
             raise HTTPException(status_code=500, detail="Internal server error")
 
 def parse_range_param(param: Optional[str]) -> Optional[Tuple]:
@@ -85,7 +105,7 @@ def parse_range_param(param: Optional[str]) -> Optional[Tuple]:
         min_val, max_val = map(float, cleaned.split(','))
         return (min_val, max_val)
     except Exception as e:
-        logger.error(f"Error parsing range parameter {param}: {str(e)}")
+        log.error("range_parse_error", param=param, error=e)
         return None
 
 @router.get("/popular")
@@ -133,9 +153,11 @@ async def get_popular_movies(
                 headers=HEADERS
             )
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            catalog_writer.record_listings(data.get("results"))
+            return data
         except httpx.HTTPError as e:
-            logger.error(f"TMDB API error in get_popular_movies: {str(e)}")
+            log.error("tmdb_error", endpoint="get_popular_movies", error=e)
             raise HTTPException(status_code=500, detail=f"TMDB API error: {str(e)}")
 
 @router.get("/top_rated")
@@ -183,9 +205,11 @@ async def get_top_rated_movies(
                 headers=HEADERS
             )
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            catalog_writer.record_listings(data.get("results"))
+            return data
         except httpx.HTTPError as e:
-            logger.error(f"TMDB API error in get_top_rated_movies: {str(e)}")
+            log.error("tmdb_error", endpoint="get_top_rated_movies", error=e)
             raise HTTPException(status_code=500, detail=f"TMDB API error: {str(e)}")
 
 @router.get("/upcoming")
@@ -237,9 +261,11 @@ async def get_upcoming_movies(
                 headers=HEADERS
             )
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            catalog_writer.record_listings(data.get("results"))
+            return data
         except httpx.HTTPError as e:
-            logger.error(f"TMDB API error in get_upcoming_movies: {str(e)}")
+            log.error("tmdb_error", endpoint="get_upcoming_movies", error=e)
             raise HTTPException(status_code=500, detail=f"TMDB API error: {str(e)}")
 
 @router.get("/now_playing")
@@ -291,11 +317,40 @@ async def get_now_playing_movies(
                 headers=HEADERS
             )
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            catalog_writer.record_listings(data.get("results"))
+            return data
         except httpx.HTTPError as e:
-            logger.error(f"TMDB API error in get_now_playing_movies: {str(e)}")
+            log.error("tmdb_error", endpoint="get_now_playing_movies", error=e)
             raise HTTPException(status_code=500, detail=f"TMDB API error: {str(e)}")
 
+async def discover_from_catalog(db: AsyncSession, params: dict, endpoint: str) -> Optional[dict]:
+    """
+    Answer a discover query from the local catalog snapshot.
+    
+    Args:
+        db: Database session used to read the page's movies
+        params: TMDB discover/movie params
+        endpoint: Name of the calling endpoint, for logging
+    
+    Returns:
+        Optional[dict]: TMDB-shaped discover response, or None if the query
+        should go to TMDB
+    """
+    if not settings.DISCOVER_LOCAL_ENABLED:
+        return None
+    try:
+        found = discover_engine.discover(params, settings.DISCOVER_LOCAL_MIN_RESULTS)
+        if found is None:
+            return None
+        results = await catalog_service.get_listings(db, found.pop("ids"))
+    except Exception as e:
+        log.warning("local_discover_failed", endpoint=endpoint, error=e)
+        await db.rollback()
+        return None
+    log.debug("local_discover", endpoint=endpoint, total_results=found["total_results"])
+    return {**found, "results": results}
+
 def add_filter_params(
     params, 
     start_year, 
@@ -427,22 +482,36 @@ async def get_hidden_gems(
             )
             
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            catalog_writer.record_listings(data.get("results"))
+            return data
             
         except httpx.HTTPError as e:
-            logger.error(f"TMDB API error in get_hidden_gems: {str(e)}")
+            log.error("tmdb_error", endpoint="get_hidden_gems", error=e)
             raise HTTPException(status_code=500, detail=f"TMDB API error: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error in get_hidden_gems: {str(e)}")
+            log.error("unexpected_error", endpoint="get_hidden_gems", error=e)
             raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/search")
-async def search_movies(query: str):
+async def search_movies(
+    query: str,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=20, le=100, multiple_of=20),
+    year: Optional[int] = None,
+    primary_release_year: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
+):
     """
     Search for movies by title or keywords.
     
     Args:
         query: Search term(s) to find movies
+        page: Page number, starting at 1
+        page_size: Results per page; 20, 40, 60, 80 or 100
+        year: Optional year of any release of the movie
+        primary_release_year: Optional year of the movie's first release
+        db: Database session
     
     Returns:
         dict: JSON response containing:
@@ -450,14 +519,58 @@ async def search_movies(query: str):
             - results: List of matching movies
             - total_pages: Total number of available pages
             - total_results: Total number of matching movies
+    
+    Notes:
+        - Every page of a query is served from the local catalog when it
+          holds a full page of strong matches for the query (not for year
+          searches, which the catalog cannot answer), and from TMDB
+          otherwise, so pagination never switches source
+        - TMDB pages are cached per query and written through to the catalog
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            get_tmdb_url("search/movie"),
-            params={"query": query, "include_adult": "false"},
-            headers=HEADERS
-        )
-        return response.json()
+    started = time.perf_counter()
+    if year is None:
+        try:
+            local = await search_service.search_catalog(db, query, page, page_size, primary_release_year)
+        except Exception as e:
+            log.warning("catalog_search_failed", query=query, error=e)
+            await db.rollback()
+            local = None
+        if local is not None:
+            search_service.search_latency["catalog"].observe((time.perf_counter() - started) * 1000)
+            return local
+
+    try:
+        data = await search_service.search_tmdb(query, page, page_size, year, primary_release_year)
+    except httpx.HTTPError as e:
+        log.error("tmdb_error", endpoint="search_movies", error=e)
+        raise HTTPException(status_code=500, detail=f"TMDB API error: {str(e)}")
+    search_service.search_latency["tmdb"].observe((time.perf_counter() - started) * 1000)
+    return data
+
+@router.get("/autocomplete")
+async def autocomplete_movies(
+    q: str = Query(..., max_length=100),
+    limit: int = Query(10, ge=1, le=20)
+):
+    """
+    Suggest movies for a partially typed title.
+    
+    Args:
+        q: Text typed so far
+        limit: Maximum number of suggestions
+    
+    Returns:
+        dict: JSON response containing:
+            - query: The text that was completed
+            - results: Suggestions with id, title, release_year, poster_path
+              and popularity, most popular first
+    
+    Notes:
+        - Served from this worker's in-memory title index; never touches
+          the database or TMDB
+        - Results are empty until the index's first build finishes
+    """
+    return {"query": q, "results": title_index.complete(q, limit)}
 
 @router.get("/filtered")
 async def get_filtered_movies(
@@ -480,10 +593,14 @@ async def get_filtered_movies(
     watch_region: str = "US",
     include_keywords: Optional[str] = None,
     exclude_keywords: Optional[str] = None,
-    release_types: Optional[str] = None
+    release_types: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get a filtered list of movies based on various criteria.
+    
+    Served from the local catalog snapshot when it can evaluate every
+    filter, otherwise from TMDB discover.
     """
     params = {
         "page": str(page),
@@ -552,7 +669,11 @@ async def get_filtered_movies(
     if release_types:
         params["with_release_type"] = release_types.replace(",", "|")
 
-    logger.info(f"Filtered movies params: {params}")
+    log.debug("tmdb_discover_params", endpoint="get_filtered_movies", params=params)
+
+    local = await discover_from_catalog(db, params, "get_filtered_movies")
+    if local is not None:
+        return local
 
     async with httpx.AsyncClient() as client:
         try:
@@ -562,18 +683,105 @@ async def get_filtered_movies(
                 headers=HEADERS
             )
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            catalog_writer.record_listings(data.get("results"))
+            return data
         except httpx.HTTPError as e:
-            logger.error(f"TMDB API error in get_filtered_movies: {str(e)}")
+            log.error("tmdb_error", endpoint="get_filtered_movies", error=e)
             raise HTTPException(status_code=500, detail=f"TMDB API error: {str(e)}")
 
+@router.get("/batch")
+async def get_movies_batch(
+    ids: str = Query(..., description="Comma-separated TMDB IDs, at most 100"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Retrieve details of many movies at once, e.g. to hydrate a list.
+    
+    Args:
+        ids: Comma-separated TMDB IDs
+        db: Database session
+    
+    Returns:
+        dict: {"results": [...]} with one details object per found movie,
+        in request order
+    
+    Notes:
+        - Fresh details come from the local catalog in one query
+        - Only the rest are fetched from TMDB, a few at a time, and
+          written through to the catalog
+        - Movies TMDB fails to return are left out rather than failing
+          the whole batch
+    """
+    try:
+        movie_ids = list(dict.fromkeys(int(part) for part in ids.split(",") if part.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    if not movie_ids or len(movie_ids) > 100:
+        raise HTTPException(status_code=400, detail="Provide between 1 and 100 ids")
+    
+    found = await catalog_service.get_fresh_details_many(db, movie_ids)
+    missing = [movie_id for movie_id in movie_ids if movie_id not in found]
+    if missing:
+        semaphore = asyncio.Semaphore(8)
+        async with httpx.AsyncClient() as client:
+            async def fetch(movie_id: int):
+                async with semaphore:
+                    try:
+                        response = await client.get(
+                            get_tmdb_url(f"movie/{movie_id}"),
+                            params=catalog_service.DETAILS_PARAMS,
+                            headers=HEADERS
+                        )
+                    except httpx.HTTPError as e:
+                        log.warning("tmdb_error", endpoint="get_movies_batch", movie_id=movie_id, error=e)
+                        return
+                if response.is_success:
+                    data = response.json()
+                    catalog_writer.record_details(data)
+                    found[movie_id] = catalog_service.details_payload(data)
+            await asyncio.gather(*(fetch(movie_id) for movie_id in missing))
+    return {"results": [found[movie_id] for movie_id in movie_ids if movie_id in found]}
+
+@router.get("/recommended")
+async def get_recommended_movies(
+    limit: int = Query(20, ge=1, le=100),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Recommend movies to the current user.
+    
+    Args:
+        limit: Maximum number of movies
+        current_user: Current authenticated user
+        db: Database session
+    
+    Returns:
+        dict: TMDB-shaped list response (page, results, total_pages,
+        total_results), best match first
+    
+    Notes:
+        - Movies are scored by how often other users list them alongside
+          the user's Watched and Watchlist movies
+        - Users with too little history get the most listed movies
+        - Results are empty until the first model build; movies missing
+          from the catalog are left out
+    """
+    if not settings.RECOMMENDATIONS_ENABLED:
+        raise HTTPException(status_code=404, detail="Recommendations are disabled")
+    movie_ids = await recommender.recommend(db, current_user.id, limit)
+    results = await catalog_service.get_listings(db, movie_ids)
+    return {"page": 1, "results": results, "total_pages": 1, "total_results": len(results)}
+
 @router.get("/{movie_id}")
-async def get_movie_details(movie_id: int):
+async def get_movie_details(movie_id: int, db: AsyncSession = Depends(get_db)):
     """
     Retrieve detailed information about a specific movie.
     
     Args:
         movie_id: TMDB ID of the movie
+        db: Database session
     
     Returns:
         dict: Comprehensive movie details including:
@@ -582,13 +790,26 @@ async def get_movie_details(movie_id: int):
             - Associated companies and countries
             - Genres and spoken languages
             - Ratings and vote counts
+    
+    Notes:
+        - Served from the local catalog while its copy is fresh; otherwise
+          fetched from TMDB and written through
     """
+    details = await catalog_service.get_fresh_details(db, movie_id)
+    if details is not None:
+        return details
+    
     async with httpx.AsyncClient() as client:
         response = await client.get(
             get_tmdb_url(f"movie/{movie_id}"),
+            params=catalog_service.DETAILS_PARAMS,
             headers=HEADERS
         )
-        return response.json()
+        data = response.json()
+        if response.is_success:
+            catalog_writer.record_details(data)
+            data = catalog_service.details_payload(data)
+        return data
 
 @router.get("/{movie_id}/credits")
 async def get_movie_credits(movie_id: int):
@@ -614,6 +835,43 @@ async def get_movie_credits(movie_id: int):
         )
         return response.json()
 
+@router.get("/{movie_id}/similar")
+async def get_similar_movies(movie_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Retrieve movies similar to a specific movie.
+    
+    Args:
+        movie_id: TMDB ID of the movie
+        db: Database session
+    
+    Returns:
+        dict: TMDB-shaped list response (page, results, total_pages,
+        total_results) with the most similar movies first
+    
+    Notes:
+        - Movies whose keywords and credits are in the catalog are matched
+          locally by genres, keywords, cast, crew and original language
+        - Other movies fall back to TMDB's similar movies
+    """
+    similar_ids = similarity_index.similar(movie_id) if settings.SIMILAR_LOCAL_ENABLED else None
+    if similar_ids is not None:
+        results = await catalog_service.get_listings(db, similar_ids)
+        return {"page": 1, "results": results, "total_pages": 1, "total_results": len(results)}
+
+    async with httpx.AsyncClient() as client:
+        try:
+            response = await client.get(
+                get_tmdb_url(f"movie/{movie_id}/similar"),
+                headers=HEADERS
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            log.error("tmdb_error", endpoint="get_similar_movies", error=e)
+            raise HTTPException(status_code=500, detail=f"TMDB API error: {str(e)}")
+        data = response.json()
+        catalog_writer.record_listings(data.get("results"))
+        return data
+
 @router.get("/{movie_id}/videos")
 async def get_movie_videos(movie_id: int):
     """
@@ -696,34 +954,30 @@ async def get_filter_setting_movies(
     release_types: Optional[str] = None,
     db: AsyncSession = Depends(get_db)
 ):
-    """Get movies based on a saved filter setting."""
-    logger.info("=" * 80)
-    logger.info("Entering get_filter_setting_movies endpoint")
-    logger.info(f"Request path: /filter-settings/{filter_id}/movies")
-    logger.info(f"Request parameters: {locals()}")
+    """
+    Get movies based on a saved filter setting.
     
+    Served from the local catalog snapshot when it can evaluate every
+    filter, otherwise from TMDB discover.
+    """
     try:
-        # Log database connection status
-        logger.info(f"Database session: {db}")
-        logger.info(f"Database session state: {db.is_active}")
-
         # Get the filter setting from the database
         query = select(FilterSettings).where(FilterSettings.id == filter_id)
-        logger.info(f"Executing database query: {query}")
-        logger.info(f"SQL Query: {query.compile(compile_kwargs={'literal_binds': True})}")
         
         try:
             result = await db.execute(query)
             filter_setting = result.scalar_one_or_none()
             
             if not filter_setting:
-                logger.error(f"Filter setting not found for ID: {filter_id}")
-                logger.info("Available columns in FilterSettings:")
-                for column in FilterSettings.__table__.columns:
-                    logger.info(f"  - {column.name}: {column.type}")
+                log.warning("filter_setting_not_found", filter_id=filter_id)
                 raise HTTPException(status_code=404, detail="Filter setting not found")
 
-            logger.info(f"Found filter setting: {filter_setting.__dict__}")
+            if log.debug_enabled():
+                log.debug(
+                    "filter_setting_loaded",
+                    filter_id=filter_id,
+                    columns={column.name: getattr(filter_setting, column.key) for column in FilterSettings.__table__.columns},
+                )
             
             # Combine saved filter settings with any additional filters passed in the request
             params = {
@@ -756,11 +1010,11 @@ async def get_filter_setting_movies(
 
                 # Handle genres
                 if filter_setting.genres:
-                    params["with_genres"] = filter_setting.genres
+                    params["with_genres"] = "|".join(map(str, filter_setting.genres))
 
                 # Handle watch providers
                 if filter_setting.watch_providers:
-                    params["with_watch_providers"] = filter_setting.watch_providers
+                    params["with_watch_providers"] = "|".join(map(str, filter_setting.watch_providers))
 
                 # Handle watch region
                 if filter_setting.watch_region:
@@ -770,9 +1024,17 @@ async def get_filter_setting_movies(
 
                 # Handle keywords
                 if filter_setting.include_keywords:
-                    params["with_keywords"] = filter_setting.include_keywords
+                    params["with_keywords"] = "|".join(map(str, filter_setting.include_keywords))
                 if filter_setting.exclude_keywords:
-                    params["without_keywords"] = filter_setting.exclude_keywords
+                    params["without_keywords"] = "|".join(map(str, filter_setting.exclude_keywords))
+
+                # Handle companies, cast and crew
+                if filter_setting.companies:
+                    params["with_companies"] = "|".join(map(str, filter_setting.companies))
+                if filter_setting.cast:
+                    params["with_cast"] = "|".join(map(str, filter_setting.cast))
+                if filter_setting.crew:
+                    params["with_crew"] = "|".join(map(str, filter_setting.crew))
 
                 # Handle vote count range
                 if filter_setting.vote_count_gte is not None:
@@ -788,14 +1050,14 @@ async def get_filter_setting_movies(
 
                 # Handle release types
                 if filter_setting.release_types:
-                    params["with_release_type"] = filter_setting.release_types
+                    params["with_release_type"] = "|".join(map(str, filter_setting.release_types))
 
                 # Handle sort by
                 if filter_setting.sort_by:
                     params["sort_by"] = filter_setting.sort_by
 
             except Exception as e:
-                logger.error(f"Error processing filter settings: {str(e)}")
+                log.error("filter_setting_params_error", filter_id=filter_id, error=e)
                 raise HTTPException(status_code=500, detail=f"Error processing filter settings: {str(e)}")
             
             # Override with request parameters if provided
@@ -844,12 +1106,15 @@ async def get_filter_setting_movies(
             if exclude_keywords:
                 params["without_keywords"] = exclude_keywords.replace(",", "|")
             
-            logger.info(f"Final TMDB API parameters: {params}")
+            log.debug("tmdb_discover_params", endpoint="get_filter_setting_movies", params=params)
+            
+            local = await discover_from_catalog(db, params, "get_filter_setting_movies")
+            if local is not None:
+                return local
             
             async with httpx.AsyncClient() as client:
                 try:
                     tmdb_url = get_tmdb_url("discover/movie")
-                    logger.info(f"Making TMDB API request to: {tmdb_url}")
                     response = await client.get(
                         tmdb_url,
                         params=params,
@@ -857,16 +1122,15 @@ async def get_filter_setting_movies(
                     )
                     response.raise_for_status()
                     data = response.json()
-                    logger.info(f"TMDB API response received. Total results: {data.get('total_results', 0)}")
+                    catalog_writer.record_listings(data.get("results"))
+                    log.debug("tmdb_response", endpoint="get_filter_setting_movies", total_results=lazy(lambda: data.get("total_results", 0)))
                     return data
                 except httpx.HTTPError as e:
-                    logger.error(f"TMDB API error: {str(e)}")
+                    log.error("tmdb_error", endpoint="get_filter_setting_movies", error=e)
                     raise HTTPException(status_code=500, detail=f"TMDB API error: {str(e)}")
         except Exception as e:
-            logger.error(f"Error executing database query: {str(e)}")
+            log.error("database_error", endpoint="get_filter_setting_movies", error=e)
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
-    finally:
-        logger.info("=" * 80) 
\ No newline at end of file
+        log.error("unexpected_error", endpoint="get_filter_setting_movies", error=e)
+        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
\ No newline at end of file
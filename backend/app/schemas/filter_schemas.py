@@ -1,13 +1,41 @@
-from typing import Optional
-from pydantic import BaseModel
+import json
+from typing import Any, List, Optional
+from pydantic import BaseModel, field_validator
 from datetime import datetime
 
+# Fields stored as Postgres integer[] / text[] columns
+INTEGER_ARRAY_FIELDS = (
+    "genres", "release_types", "watch_providers", "companies",
+    "cast", "crew", "include_keywords", "exclude_keywords",
+)
+TEXT_ARRAY_FIELDS = ("spoken_languages", "watch_monetization_types", "origin_countries")
+
+def _split_legacy_list(value: Any) -> Any:
+    """
+    Convert a legacy string value into a list.
+
+    Accepts JSON arrays ("[28,12]") and comma or pipe separated strings
+    ("28,12" or "28|12"), the formats clients sent before these fields
+    became arrays. Anything else is returned unchanged for normal validation.
+    """
+    if not isinstance(value, str):
+        return value
+    value = value.strip()
+    if not value:
+        return None
+    if value.startswith("["):
+        try:
+            return json.loads(value)
+        except ValueError:
+            value = value.strip("[]")
+    return [part.strip().strip('"') for part in value.replace("|", ",").split(",") if part.strip()]
+
 
 class FilterSettingsBase(BaseModel):
     """Base schema for filter settings."""
     name: str
     search_text: Optional[str] = None
-    genres: Optional[str] = None
+    genres: Optional[List[int]] = None
     is_homepage_enabled: bool = False
     homepage_display_order: Optional[int] = None
     
@@ -33,31 +61,37 @@ class FilterSettingsBase(BaseModel):
     
     # Language filters
     original_language: Optional[str] = None
-    spoken_languages: Optional[str] = None
+    spoken_languages: Optional[List[str]] = None
     
     # Release types
-    release_types: Optional[str] = None
+    release_types: Optional[List[int]] = None
     
     # Watch providers
-    watch_providers: Optional[str] = None
+    watch_providers: Optional[List[int]] = None
     watch_region: Optional[str] = None
-    watch_monetization_types: Optional[str] = None
+    watch_monetization_types: Optional[List[str]] = None
     
     # Companies and countries
-    companies: Optional[str] = None
-    origin_countries: Optional[str] = None
+    companies: Optional[List[int]] = None
+    origin_countries: Optional[List[str]] = None
     
     # Cast and crew
-    cast: Optional[str] = None
-    crew: Optional[str] = None
+    cast: Optional[List[int]] = None
+    crew: Optional[List[int]] = None
     
     # Keywords
-    include_keywords: Optional[str] = None
-    exclude_keywords: Optional[str] = None
+    include_keywords: Optional[List[int]] = None
+    exclude_keywords: Optional[List[int]] = None
     
     # Sorting
     sort_by: Optional[str] = None
 
+    @field_validator(*INTEGER_ARRAY_FIELDS, *TEXT_ARRAY_FIELDS, mode="before")
+    @classmethod
+    def accept_legacy_strings(cls, value: Any) -> Any:
+        """Accept the old comma-separated and JSON string forms during the transition."""
+        return _split_legacy_list(value)
+
 
 class FilterSettingsCreate(FilterSettingsBase):
     """Schema for creating filter settings."""
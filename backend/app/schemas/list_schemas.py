@@ -14,6 +14,16 @@ List Item-related:
 - ListItemBase: Common item fields (movie_id, notes)
 - ListItemCreate: Used for adding movies to lists
 - ListItem: Complete list item representation
+- ListItemPage: One keyset-paginated page of list items
+
+Bulk operations:
+- ListItemBulkRequest: Movie IDs to add to or remove from a list
+- ListItemBulkResponse: Per-movie outcome of a bulk operation
+
+Status-related:
+- ListStatusResponse: Default list status for a single movie
+- ListStatusBulkRequest: Movie IDs to look up in one call
+- MovieListMembership: Default and custom list membership for a movie
 
 Features:
 - Nested schema relationships
@@ -23,9 +33,9 @@ Features:
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, List as TypeList
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 class ListItemBase(BaseModel):
     """
@@ -69,6 +79,18 @@ class ListItem(ListItemBase):
     class Config:
         from_attributes = True
 
+class ListItemPage(BaseModel):
+    """
+    One page of list items for keyset pagination.
+    
+    Attributes:
+        items (List[ListItem]): Items on this page, most recently added first
+        next_cursor (str, optional): Value to pass as 'after' for the next page,
+            or None if this is the last page
+    """
+    items: List[ListItem]
+    next_cursor: Optional[str] = None
+
 class ListBase(BaseModel):
     """
     Base schema for movie lists.
@@ -131,7 +153,84 @@ class List(ListBase):
     class Config:
         from_attributes = True
 
+class ListSummary(BaseModel):
+    """
+    Lightweight list representation without items.
+    
+    Attributes:
+        id (UUID): Unique identifier for the list
+        name (str): Name of the list
+        description (str, optional): Description of the list
+        is_default (bool): Whether this is a system-generated list
+        item_count (int): Number of movies in the list
+        last_item_added_at (datetime, optional): When the newest movie was added
+        updated_at (datetime): When the list was last modified
+    """
+    id: UUID
+    name: str
+    description: Optional[str] = None
+    is_default: bool
+    item_count: int
+    last_item_added_at: Optional[datetime] = None
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
 class ListStatusResponse(BaseModel):
     """Response model for toggle operations that return both watched and watchlist status."""
     is_watched: bool
-    in_watchlist: bool 
\ No newline at end of file
+    in_watchlist: bool
+
+class ListStatusBulkRequest(BaseModel):
+    """
+    Request body for looking up list membership of many movies at once.
+    
+    Attributes:
+        movie_ids (List[str]): TMDB IDs of the movies, e.g. one page of a movie grid
+    """
+    movie_ids: TypeList[str] = Field(..., min_length=1, max_length=200)
+
+class MovieListMembership(BaseModel):
+    """
+    List membership of a single movie for the current user.
+    
+    Attributes:
+        is_watched (bool): Whether the movie is in the Watched list
+        in_watchlist (bool): Whether the movie is in the Watchlist
+        list_ids (List[UUID]): IDs of the custom lists containing the movie
+    """
+    is_watched: bool = False
+    in_watchlist: bool = False
+    list_ids: TypeList[UUID] = []
+
+class ListItemBulkRequest(BaseModel):
+    """
+    Request body for adding or removing many movies in one call.
+    
+    Attributes:
+        movie_ids (List[str]): TMDB IDs of the movies
+    """
+    movie_ids: TypeList[str] = Field(..., min_length=1, max_length=1000)
+
+class ListItemBulkResult(BaseModel):
+    """
+    Outcome of a bulk operation for a single movie.
+    
+    Attributes:
+        movie_id (str): TMDB ID of the movie
+        status (str): 'added', 'exists', 'removed' or 'not_found'
+    """
+    movie_id: str
+    status: str
+
+class ListItemBulkResponse(BaseModel):
+    """
+    Response model for bulk add and remove operations.
+    
+    Attributes:
+        results (List[ListItemBulkResult]): Outcome per requested movie, in request order
+        changed (int): Number of movies actually added or removed
+    """
+    results: TypeList[ListItemBulkResult]
+    changed: int
@@ -4,7 +4,7 @@ User Schema Module
 This module defines Pydantic models for user-related operations.
 """
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional
 from uuid import UUID
 
@@ -24,4 +24,20 @@ class UserResponse(UserBase):
 
     class Config:
         """Pydantic config for ORM mode."""
-        from_attributes = True  # New name for orm_mode in Pydantic v2 
\ No newline at end of file
+        from_attributes = True  # New name for orm_mode in Pydantic v2
+
+class Principal(BaseModel):
+    """
+    Lean identity of an authenticated user.
+    
+    Returned by get_current_user instead of the User ORM object, so it can
+    be cached and shared between workers, and resolving it never loads the
+    user's lists or filters.
+    """
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: UUID
+    email: str
+    username: str
+    is_active: bool = True
+    token_version: int = 0
@@ -0,0 +1,299 @@
+"""
+Autocomplete Service Module
+
+This module answers title typeahead queries from an in-process prefix
+index, so the search bar can suggest movies on every keystroke without a
+database or TMDB round trip.
+
+Features:
+- Sorted arrays of normalized title keys searched with bisect; every word
+  start of a title is a key, so "wars" finds "Star Wars"
+- Accent-, case- and punctuation-insensitive matching
+- Suggestions ranked by popularity; top results of broad prefixes are
+  memoized per index snapshot
+- Built from the local catalog at startup and rebuilt periodically
+- Incremental updates from catalog write-through kept in a small sorted
+  overlay until the next rebuild
+- Memory budget: only the AUTOCOMPLETE_MAX_TITLES most popular movies are
+  indexed, and the overlay is capped at AUTOCOMPLETE_MAX_PENDING movies
+
+Each worker process keeps its own index.
+"""
+
+import asyncio
+import bisect
+from dataclasses import dataclass, field
+import heapq
+import re
+import sys
+import time
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.core.structured_logging import get_logger
+from app.database.database import get_session_maker
+from app.models.movie import Movie
+from app.services.catalog_service import catalog_writer
+
+log = get_logger(__name__)
+settings = get_settings()
+
+# Word starts of a title that become index keys
+MAX_WORD_STARTS = 4
+
+# Prefix ranges up to this many keys are ranked on every query; broader
+# ranges are ranked once per snapshot and memoized
+SCAN_LIMIT = 256
+
+# Ranked IDs kept per memoized prefix; more than any page of suggestions so
+# entries superseded by the overlay can be skipped
+TOP_SIZE = 50
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+# (title, popularity, release year, poster path)
+Entry = Tuple[str, float, Optional[int], Optional[str]]
+
+def normalize_title(text: str) -> str:
+    """
+    Normalize a title or query for prefix matching.
+
+    Args:
+        text: Title or partial query
+
+    Returns:
+        str: Lowercase text without accents or punctuation, words separated
+        by single spaces
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_WORD.sub(" ", stripped.casefold()).strip()
+
+def title_keys(title: str) -> List[str]:
+    """Return the index keys of a title: the normalized title from each of its first word starts."""
+    words = normalize_title(title).split(" ")
+    if not words or not words[0]:
+        return []
+    return [" ".join(words[start:]) for start in range(min(len(words), MAX_WORD_STARTS))]
+
+def _entry(title: str, popularity: Optional[float], release_date: Any, poster_path: Optional[str]) -> Entry:
+    return (title, popularity or 0.0, release_date.year if release_date else None, poster_path)
+
+@dataclass
+class _Snapshot:
+    """Immutable sorted key arrays plus the memo of ranked broad prefixes."""
+    keys: List[str] = field(default_factory=list)
+    ids: List[int] = field(default_factory=list)
+    entries: Dict[int, Entry] = field(default_factory=dict)
+    top: Dict[str, List[int]] = field(default_factory=dict)
+    memory_bytes: int = 0
+
+def _build_snapshot(rows: Iterable[Tuple]) -> _Snapshot:
+    """Build a snapshot from (id, title, popularity, release_date, poster_path) rows."""
+    entries: Dict[int, Entry] = {}
+    pairs = []
+    for movie_id, title, popularity, release_date, poster_path in rows:
+        entries[movie_id] = _entry(title, popularity, release_date, poster_path)
+        pairs.extend((key, movie_id) for key in title_keys(title))
+    pairs.sort()
+    keys = [key for key, _ in pairs]
+    ids = [movie_id for _, movie_id in pairs]
+    memory_bytes = (
+        sys.getsizeof(keys) + sys.getsizeof(ids) + sys.getsizeof(entries)
+        + sum(sys.getsizeof(key) for key in keys)
+        + sum(sys.getsizeof(entry) + sys.getsizeof(entry[0]) for entry in entries.values())
+    )
+    return _Snapshot(keys=keys, ids=ids, entries=entries, memory_bytes=memory_bytes)
+
+def _prefix_range(keys: List[str], prefix: str) -> Tuple[int, int]:
+    return bisect.bisect_left(keys, prefix), bisect.bisect_left(keys, prefix + "\uffff")
+
+class TitleIndex:
+    """
+    Prefix index over catalog titles for typeahead.
+
+    Attributes:
+        max_titles: Most popular movies indexed per rebuild
+        max_pending: Movies held in the update overlay before new ones are
+            dropped until the next rebuild
+        rebuild_seconds: Time between rebuilds from the catalog
+        ready: Whether the first build has finished
+
+    Notes:
+        - Queries and updates run on the event loop; only the snapshot
+          build runs in a thread
+        - Overlay entries supersede the snapshot's entry for the same movie
+    """
+
+    def __init__(self, max_titles: int = 100000, max_pending: int = 5000, rebuild_seconds: float = 900):
+        self.max_titles = max_titles
+        self.max_pending = max_pending
+        self.rebuild_seconds = rebuild_seconds
+        self.ready = False
+        self.dropped = 0
+        self.last_build_ms: Optional[float] = None
+        self._base = _Snapshot()
+        self._pending: Dict[int, Tuple[int, Entry, List[str]]] = {}
+        self._pending_keys: List[Tuple[str, int]] = []
+        self._seq = 0
+        self._rebuild_now = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def load(self, rows: Iterable[Tuple]) -> None:
+        """Replace the index with (id, title, popularity, release_date, poster_path) rows."""
+        self._base = _build_snapshot(rows)
+        self._pending.clear()
+        self._pending_keys.clear()
+        self.ready = True
+
+    def update(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Apply catalog rows written since the last rebuild.
+
+        Args:
+            rows: Row dicts as produced by catalog_service.movie_row
+        """
+        for row in rows:
+            movie_id = row["id"]
+            entry = _entry(row["title"], row.get("popularity"), row.get("release_date"), row.get("poster_path"))
+            previous = self._pending.get(movie_id)
+            current = self._base.entries.get(movie_id)
+            if previous is None and current is not None and current[0::2] == entry[0::2]:
+                # Only popularity moved; the next rebuild picks it up
+                continue
+            if previous is None and current is None and len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                self._rebuild_now.set()
+                continue
+            if previous is not None:
+                for key in previous[2]:
+                    index = bisect.bisect_left(self._pending_keys, (key, movie_id))
+                    del self._pending_keys[index]
+            keys = title_keys(row["title"])
+            for key in keys:
+                bisect.insort(self._pending_keys, (key, movie_id))
+            self._seq += 1
+            self._pending[movie_id] = (self._seq, entry, keys)
+        if len(self._pending) >= self.max_pending:
+            self._rebuild_now.set()
+
+    def _base_top(self, prefix: str) -> List[int]:
+        """Return base snapshot IDs under a prefix, most popular first."""
+        snapshot = self._base
+        ranked = snapshot.top.get(prefix)
+        if ranked is not None:
+            return ranked
+        lo, hi = _prefix_range(snapshot.keys, prefix)
+        entries = snapshot.entries
+        ranked = heapq.nlargest(TOP_SIZE, set(snapshot.ids[lo:hi]), key=lambda movie_id: entries[movie_id][1])
+        if hi - lo > SCAN_LIMIT:
+            snapshot.top[prefix] = ranked
+        return ranked
+
+    def complete(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Suggest movies whose title has a word sequence starting with query.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            List[dict]: Suggestions with id, title, release_year, poster_path
+            and popularity, most popular first
+        """
+        prefix = normalize_title(query)
+        if not prefix:
+            return []
+        candidates: Dict[int, Entry] = {}
+        base_entries = self._base.entries
+        for movie_id in self._base_top(prefix):
+            if movie_id not in self._pending:
+                candidates[movie_id] = base_entries[movie_id]
+        lo = bisect.bisect_left(self._pending_keys, (prefix,))
+        hi = bisect.bisect_left(self._pending_keys, (prefix + "\uffff",))
+        for _, movie_id in self._pending_keys[lo:hi]:
+            candidates[movie_id] = self._pending[movie_id][1]
+        best = heapq.nlargest(limit, candidates.items(), key=lambda item: item[1][1])
+        return [
+            {
+                "id": movie_id,
+                "title": title,
+                "release_year": year,
+                "poster_path": poster_path,
+                "popularity": popularity,
+            }
+            for movie_id, (title, popularity, year, poster_path) in best
+        ]
+
+    async def rebuild(self) -> None:
+        """Rebuild the snapshot from the catalog and drop overlay entries it covers."""
+        started = time.perf_counter()
+        seq = self._seq
+        async with get_session_maker()() as session:
+            result = await session.execute(
+                select(Movie.id, Movie.title, Movie.popularity, Movie.release_date, Movie.poster_path)
+                .order_by(Movie.popularity.desc().nulls_last())
+                .limit(self.max_titles)
+            )
+            rows = result.all()
+        self._base = await asyncio.to_thread(_build_snapshot, rows)
+        # Overlay entries queued before the catalog was read are in the new snapshot
+        self._pending = {
+            movie_id: pending for movie_id, pending in self._pending.items() if pending[0] > seq
+        }
+        self._pending_keys = sorted(
+            (key, movie_id) for movie_id, pending in self._pending.items() for key in pending[2]
+        )
+        self.ready = True
+        self.last_build_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    async def _run(self) -> None:
+        while True:
+            self._rebuild_now.clear()
+            try:
+                await self.rebuild()
+            except Exception as e:
+                log.error("autocomplete_rebuild_failed", error=e)
+            try:
+                await asyncio.wait_for(self._rebuild_now.wait(), self.rebuild_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Build the index and keep rebuilding it in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background rebuilds."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index size, memory estimate and build timings."""
+        return {
+            "ready": self.ready,
+            "titles": len(self._base.entries),
+            "keys": len(self._base.keys),
+            "memoized_prefixes": len(self._base.top),
+            "pending": len(self._pending),
+            "dropped": self.dropped,
+            "memory_bytes": self._base.memory_bytes,
+            "last_build_ms": self.last_build_ms,
+        }
+
+title_index = TitleIndex(
+    max_titles=settings.AUTOCOMPLETE_MAX_TITLES,
+    max_pending=settings.AUTOCOMPLETE_MAX_PENDING,
+    rebuild_seconds=settings.AUTOCOMPLETE_REBUILD_SECONDS,
+)
+catalog_writer.add_listener(title_index.update)
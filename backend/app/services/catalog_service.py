@@ -0,0 +1,402 @@
+"""
+Catalog Service Module
+
+This module maintains the local movie catalog (the movies table) from TMDB
+responses and serves fresh entries back out of it.
+
+Features:
+- Write-through of TMDB detail and listing responses, batched into
+  multi-row upserts by a background task so requests never wait on it
+- Upserts split into slices that stay under the bind parameter limit;
+  a failed slice leaves the slices after it in the backlog
+- Per-movie dedupe of pending writes; newest payload wins
+- Bounded backlog: when full, new writes are dropped and counted
+- Listeners notified of the rows of every committed flush
+- Immediate details upserts for background jobs
+- Keyword, cast, crew and company IDs extracted from details responses
+  for the posting index
+- Freshness-checked reads of full details, single or batched
+- Listing reads by ID in TMDB list result shape
+
+Listing rows (discover, search) only refresh listing columns and never
+replace a stored details payload or runtime.
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.database.database import get_session_maker
+from app.models.movie import Movie
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Columns refreshed by any TMDB response that includes the movie
+LISTING_COLUMNS = (
+    "title", "original_title", "original_language", "overview", "release_date",
+    "vote_average", "vote_count", "popularity", "genre_ids", "poster_path",
+    "backdrop_path", "fetched_at",
+)
+
+# Columns read to answer list queries (search, discover) from the catalog
+LISTING_SELECT = (
+    Movie.id, Movie.title, Movie.original_title, Movie.original_language,
+    Movie.overview, Movie.release_date, Movie.vote_average, Movie.vote_count,
+    Movie.popularity, Movie.genre_ids, Movie.poster_path, Movie.backdrop_path,
+)
+
+# Facet ID columns filled from details responses
+FACET_COLUMNS = ("keyword_ids", "cast_ids", "crew_ids", "company_ids")
+
+# Sub-responses appended to every details fetch; their IDs are kept in the
+# catalog's facet columns, not in the stored payload
+DETAILS_PARAMS = {"append_to_response": "keywords,credits"}
+APPENDED_KEYS = ("keywords", "credits")
+
+# Bind parameters asyncpg accepts in one statement
+MAX_BIND_PARAMS = 32767
+
+# Credits kept per movie: top-billed cast and the crew jobs people filter on
+CAST_LIMIT = 20
+KEY_CREW_JOBS = {
+    "Director", "Screenplay", "Writer", "Story", "Novel", "Producer",
+    "Original Music Composer", "Director of Photography", "Editor",
+}
+
+def details_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a TMDB details response without the appended sub-responses."""
+    return {key: value for key, value in data.items() if key not in APPENDED_KEYS}
+
+def _ids(items: Iterable[Dict[str, Any]]) -> List[int]:
+    return sorted({item["id"] for item in items if item.get("id") is not None})
+
+def _facets(data: Dict[str, Any]) -> Dict[str, Optional[List[int]]]:
+    """Extract facet IDs from a details response; None where it has no data."""
+    keywords = data.get("keywords")
+    credits = data.get("credits")
+    companies = data.get("production_companies")
+    return {
+        "keyword_ids": _ids(keywords.get("keywords") or []) if isinstance(keywords, dict) else None,
+        "cast_ids": _ids((credits.get("cast") or [])[:CAST_LIMIT]) if isinstance(credits, dict) else None,
+        "crew_ids": _ids(
+            member for member in credits.get("crew") or [] if member.get("job") in KEY_CREW_JOBS
+        ) if isinstance(credits, dict) else None,
+        "company_ids": _ids(companies) if isinstance(companies, list) else None,
+    }
+
+def _parse_date(value: Any) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+def movie_row(data: Dict[str, Any], details: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Convert a TMDB movie object into a movies row.
+    
+    Args:
+        data: Movie object from a TMDB details, discover or search response
+        details: Whether data is a full details response, possibly with
+            appended keywords and credits
+    
+    Returns:
+        Optional[dict]: Row values, or None if data is not a usable movie
+    """
+    if not isinstance(data, dict) or not data.get("id") or not data.get("title"):
+        return None
+    genre_ids = data.get("genre_ids")
+    if genre_ids is None:
+        genre_ids = [genre["id"] for genre in data.get("genres") or [] if "id" in genre]
+    now = datetime.now(timezone.utc)
+    row = {
+        "id": int(data["id"]),
+        "title": data["title"],
+        "original_title": data.get("original_title"),
+        "original_language": data.get("original_language"),
+        "overview": data.get("overview"),
+        "release_date": _parse_date(data.get("release_date")),
+        "vote_average": data.get("vote_average"),
+        "vote_count": data.get("vote_count"),
+        "popularity": data.get("popularity"),
+        "genre_ids": genre_ids,
+        "poster_path": data.get("poster_path"),
+        "backdrop_path": data.get("backdrop_path"),
+        "payload": data,
+        "fetched_at": now,
+    }
+    if details:
+        row["payload"] = details_payload(data)
+        row["runtime"] = data.get("runtime")
+        row["details_fetched_at"] = now
+        row.update(_facets(data))
+    return row
+
+class CatalogWriter:
+    """
+    Batches catalog upserts off the request path.
+    
+    Attributes:
+        batch_size: Pending movies that trigger an immediate flush
+        flush_seconds: Longest time a pending write waits
+        max_pending: Pending movies kept before new writes are dropped
+        written: Rows upserted since start
+        dropped: Writes dropped because the backlog was full
+        failed: Rows lost to failed flushes
+    
+    Notes:
+        - record_* methods are synchronous and never touch the database
+        - Pending writes are keyed by movie ID, so repeats collapse
+    """
+
+    def __init__(self, batch_size: int = 500, flush_seconds: float = 1.0, max_pending: int = 10000):
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.max_pending = max_pending
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self._details: Dict[int, Dict[str, Any]] = {}
+        self._listings: Dict[int, Dict[str, Any]] = {}
+        self._listeners: List[Callable[[List[Dict[str, Any]]], None]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._details) + len(self._listings)
+
+    def _add(self, pending: Dict[int, Dict[str, Any]], row: Optional[Dict[str, Any]]) -> None:
+        if row is None:
+            return
+        if row["id"] not in pending and self.pending >= self.max_pending:
+            self.dropped += 1
+            return
+        pending[row["id"]] = row
+        if self.pending >= self.batch_size:
+            self._wakeup.set()
+
+    def add_listener(self, listener: Callable[[List[Dict[str, Any]]], None]) -> None:
+        """Call listener with the rows of every flush once they are committed."""
+        self._listeners.append(listener)
+
+    def record_details(self, data: Dict[str, Any]) -> None:
+        """Queue a TMDB details response for the catalog."""
+        self._add(self._details, movie_row(data, details=True))
+
+    def record_listings(self, results: Optional[Iterable[Dict[str, Any]]]) -> None:
+        """Queue the movies of a TMDB discover or search response for the catalog."""
+        for data in results or ():
+            self._add(self._listings, movie_row(data))
+
+    async def flush(self) -> None:
+        """
+        Upsert everything pending, one statement per slice of batch_size rows.
+        
+        Each slice commits on its own. When a slice fails its rows are counted
+        as failed and the slices not yet run go back to the backlog.
+        """
+        listings, self._listings = self._listings, {}
+        details, self._details = self._details, {}
+        slices = [
+            (pending, upsert, rows)
+            for pending, upsert, queued in (
+                (self._listings, _listing_upsert, listings),
+                (self._details, _details_upsert, details),
+            )
+            for rows in _slices(list(queued.values()), self.batch_size)
+        ]
+        for index, (pending, upsert, rows) in enumerate(slices):
+            try:
+                async with get_session_maker()() as session:
+                    await session.execute(upsert(rows))
+                    await session.commit()
+            except Exception as e:
+                self.failed += len(rows)
+                logger.error(f"Catalog write-through failed for {len(rows)} movies: {str(e)}")
+                for later_pending, _, later_rows in slices[index + 1:]:
+                    for row in later_rows:
+                        # A newer payload recorded meanwhile wins
+                        later_pending.setdefault(row["id"], row)
+                return
+            self.written += len(rows)
+            for listener in self._listeners:
+                try:
+                    listener(rows)
+                except Exception as e:
+                    logger.error(f"Catalog write listener failed: {str(e)}")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and flush what is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        """Return backlog and throughput counters."""
+        return {
+            "pending": self.pending,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+def _slices(rows: List[Dict[str, Any]], size: int) -> List[List[Dict[str, Any]]]:
+    """Split rows into upsert slices of at most size rows and MAX_BIND_PARAMS parameters."""
+    if not rows:
+        return []
+    size = max(1, min(size, MAX_BIND_PARAMS // len(rows[0])))
+    return [rows[start:start + size] for start in range(0, len(rows), size)]
+
+def _listing_upsert(rows: List[Dict[str, Any]]):
+    stmt = insert(Movie).values(rows)
+    excluded = stmt.excluded
+    return stmt.on_conflict_do_update(
+        index_elements=[Movie.id],
+        set_={
+            **{name: excluded[name] for name in LISTING_COLUMNS},
+            # Keep the richer details payload once we have one
+            "payload": case((Movie.details_fetched_at.is_(None), excluded.payload), else_=Movie.payload),
+        },
+    )
+
+def _details_upsert(rows: List[Dict[str, Any]]):
+    stmt = insert(Movie).values(rows)
+    excluded = stmt.excluded
+    return stmt.on_conflict_do_update(
+        index_elements=[Movie.id],
+        set_={
+            **{name: excluded[name] for name in LISTING_COLUMNS},
+            "payload": excluded.payload,
+            "runtime": excluded.runtime,
+            "details_fetched_at": excluded.details_fetched_at,
+            # Keep known facets when a response came without them
+            **{name: func.coalesce(excluded[name], getattr(Movie, name)) for name in FACET_COLUMNS},
+        },
+    )
+
+async def write_details(session: AsyncSession, payloads: Iterable[Dict[str, Any]]) -> int:
+    """
+    Upsert TMDB details responses into the catalog right away.
+    
+    Args:
+        session: Database session; the caller commits
+        payloads: TMDB details responses
+    
+    Returns:
+        int: Number of movies written
+    """
+    rows = {}
+    for data in payloads:
+        row = movie_row(data, details=True)
+        if row is not None:
+            rows[row["id"]] = row
+    for chunk in _slices(list(rows.values()), settings.CATALOG_WRITE_BATCH_SIZE):
+        await session.execute(_details_upsert(chunk))
+    return len(rows)
+
+catalog_writer = CatalogWriter(
+    batch_size=settings.CATALOG_WRITE_BATCH_SIZE,
+    flush_seconds=settings.CATALOG_WRITE_FLUSH_SECONDS,
+    max_pending=settings.CATALOG_WRITE_MAX_PENDING,
+)
+
+def _details_cutoff() -> datetime:
+    return datetime.now(timezone.utc) - timedelta(seconds=settings.CATALOG_DETAILS_MAX_AGE_SECONDS)
+
+async def get_fresh_details(db: AsyncSession, movie_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Get a movie's stored TMDB details if they are fresh enough.
+    
+    Args:
+        db: Database session
+        movie_id: TMDB ID of the movie
+    
+    Returns:
+        Optional[dict]: Details payload fetched within
+        CATALOG_DETAILS_MAX_AGE_SECONDS, or None
+    """
+    result = await db.execute(
+        select(Movie.payload).where(Movie.id == movie_id, Movie.details_fetched_at >= _details_cutoff())
+    )
+    return result.scalar_one_or_none()
+
+async def get_fresh_details_many(db: AsyncSession, movie_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Get the fresh stored details of many movies in one query.
+    
+    Args:
+        db: Database session
+        movie_ids: TMDB IDs of the movies
+    
+    Returns:
+        dict: Details payload by movie ID, for the movies that have fresh details
+    """
+    ids = list(set(movie_ids))
+    if not ids:
+        return {}
+    result = await db.execute(
+        select(Movie.id, Movie.payload).where(Movie.id.in_(ids), Movie.details_fetched_at >= _details_cutoff())
+    )
+    return {movie_id: payload for movie_id, payload in result.all()}
+
+def listing_result(row) -> Dict[str, Any]:
+    """Shape a row of LISTING_SELECT like a movie in a TMDB list response."""
+    return {
+        "id": row.id,
+        "title": row.title,
+        "original_title": row.original_title,
+        "original_language": row.original_language,
+        "overview": row.overview,
+        "release_date": row.release_date.isoformat() if row.release_date else "",
+        "vote_average": row.vote_average,
+        "vote_count": row.vote_count,
+        "popularity": row.popularity,
+        "genre_ids": row.genre_ids,
+        "poster_path": row.poster_path,
+        "backdrop_path": row.backdrop_path,
+    }
+
+async def get_listings(db: AsyncSession, movie_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Get catalog movies in TMDB list result shape.
+    
+    Args:
+        db: Database session
+        movie_ids: TMDB IDs of the movies, in the order wanted
+    
+    Returns:
+        List[dict]: The movies found, in the order of movie_ids
+    """
+    if not movie_ids:
+        return []
+    result = await db.execute(select(*LISTING_SELECT).where(Movie.id.in_(movie_ids)))
+    by_id = {row.id: listing_result(row) for row in result}
+    return [by_id[movie_id] for movie_id in movie_ids if movie_id in by_id]
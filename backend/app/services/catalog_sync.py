@@ -0,0 +1,325 @@
+"""
+Catalog Sync Service Module
+
+This module keeps the local movie catalog current with TMDB's changes feed
+(movie/changes) instead of waiting for cached details to go stale.
+
+Features:
+- Incremental sync: only movies TMDB reports as changed are refetched,
+  and only if they are already in the catalog
+- High-water mark persisted in sync_state, so a restart resumes where the
+  last completed window ended
+- IDs whose refetch failed are persisted with the mark and retried at the
+  start of the next run
+- Bounded concurrency and the low-priority TMDB rate budget, leaving the
+  rest of the budget to user-facing requests
+- Session-level Postgres advisory lock, held on a dedicated autocommit
+  connection, so only one worker process syncs at a time
+- Movies TMDB no longer serves (404) are removed from the catalog
+
+TMDB reports changes per day, in windows of at most 14 days. Each run
+walks from the high-water mark to now one window at a time and moves the
+mark after every window, so the current day is revisited by the next run.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+import httpx
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import get_settings
+from app.core.structured_logging import get_logger
+from app.database.database import get_session_maker
+from app.models.movie import Movie
+from app.models.sync_state import SyncState
+from app.services.catalog_service import DETAILS_PARAMS, write_details
+from app.utils.tmdb import HEADERS, RateLimiter, get_tmdb_url, low_priority_limiter
+
+log = get_logger(__name__)
+settings = get_settings()
+
+SYNC_NAME = "tmdb_movie_changes"
+
+# Longest date range TMDB accepts for movie/changes
+MAX_WINDOW = timedelta(days=14)
+
+# Where the first run starts when no high-water mark is stored yet; rows
+# written before that were fetched recently enough by write-through
+INITIAL_LOOKBACK = timedelta(days=1)
+
+# Arbitrary constant identifying the sync job's advisory lock
+ADVISORY_LOCK_KEY = 740_043
+
+# Catalog lookups and refetches are done this many IDs at a time
+ID_CHUNK_SIZE = 500
+
+# Retries of a refetch after TMDB answers 429
+MAX_RATE_LIMIT_RETRIES = 3
+
+class CatalogSync:
+    """
+    Periodically applies TMDB's movie changes feed to the catalog.
+
+    Attributes:
+        interval_seconds: Time between runs
+        concurrency: Refetches in flight at once
+        runs: Completed runs since start
+        skipped: Runs skipped because another process held the lock
+        changed: Changed movie IDs read from the feed
+        refreshed: Catalog movies refetched and written
+        removed: Catalog movies deleted because TMDB no longer serves them
+        failed: Refetches that failed; their IDs are retried on the next run
+
+    Notes:
+        - session_maker and transport exist so tests can point the job at a
+          test database and a local TMDB stand-in
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 3600,
+        concurrency: int = 4,
+        limiter: Optional[RateLimiter] = None,
+        session_maker=None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.interval_seconds = interval_seconds
+        self.concurrency = concurrency
+        self.limiter = limiter or low_priority_limiter
+        self.session_maker = session_maker
+        self.transport = transport
+        self.runs = 0
+        self.skipped = 0
+        self.changed = 0
+        self.refreshed = 0
+        self.removed = 0
+        self.failed = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_run_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _sessions(self):
+        return (self.session_maker or get_session_maker())()
+
+    @asynccontextmanager
+    async def _lock(self) -> AsyncIterator[bool]:
+        """Hold the job's advisory lock on a dedicated connection; yields whether it was taken."""
+        async with self._sessions() as session:
+            if session.get_bind().dialect.name != "postgresql":
+                yield True
+                return
+            # Autocommit, so the connection does not sit idle in a transaction for the whole run
+            conn = await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+            locked = bool(await conn.scalar(select(func.pg_try_advisory_lock(ADVISORY_LOCK_KEY))))
+            try:
+                yield locked
+            finally:
+                if locked:
+                    try:
+                        await conn.scalar(select(func.pg_advisory_unlock(ADVISORY_LOCK_KEY)))
+                    except Exception:
+                        # A pooled connection must not keep the lock
+                        await conn.invalidate()
+
+    async def get_high_water_mark(self) -> Optional[datetime]:
+        """Return the stored high-water mark, or None before the first run."""
+        async with self._sessions() as session:
+            return await session.scalar(
+                select(SyncState.high_water_mark).where(SyncState.name == SYNC_NAME)
+            )
+
+    async def get_failed_ids(self) -> List[int]:
+        """Return the IDs whose refetch failed in earlier runs."""
+        async with self._sessions() as session:
+            failed_ids = await session.scalar(
+                select(SyncState.failed_ids).where(SyncState.name == SYNC_NAME)
+            )
+            return list(failed_ids or [])
+
+    async def _save_state(self, mark: datetime, failed_ids: Set[int]) -> None:
+        async with self._sessions() as session:
+            stmt = insert(SyncState).values(name=SYNC_NAME, high_water_mark=mark, failed_ids=sorted(failed_ids))
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[SyncState.name],
+                    set_={
+                        "high_water_mark": stmt.excluded.high_water_mark,
+                        "failed_ids": stmt.excluded.failed_ids,
+                        "updated_at": func.now(),
+                    },
+                )
+            )
+            await session.commit()
+
+    async def _get(self, client: httpx.AsyncClient, endpoint: str, params: Optional[Dict] = None) -> httpx.Response:
+        """GET a TMDB endpoint within the rate budget, honouring 429 Retry-After."""
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await self.limiter.acquire()
+            response = await client.get(get_tmdb_url(endpoint), params=params, headers=HEADERS)
+            if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                return response
+            try:
+                retry_after = float(response.headers.get("Retry-After", 1))
+            except ValueError:
+                retry_after = 1.0
+            await asyncio.sleep(retry_after)
+        return response
+
+    async def _changed_ids(self, client: httpx.AsyncClient, start: datetime, end: datetime) -> Set[int]:
+        """Read every page of the changes feed for a window."""
+        ids: Set[int] = set()
+        page, total_pages = 1, 1
+        while page <= total_pages:
+            response = await self._get(client, "movie/changes", {
+                "start_date": start.date().isoformat(),
+                "end_date": end.date().isoformat(),
+                "page": page,
+            })
+            response.raise_for_status()
+            data = response.json()
+            ids.update(int(item["id"]) for item in data.get("results", []) if item.get("id"))
+            total_pages = data.get("total_pages") or 1
+            page += 1
+        return ids
+
+    async def _catalog_ids(self, ids: List[int]) -> List[int]:
+        """Keep only the IDs that are in the catalog."""
+        async with self._sessions() as session:
+            result = await session.execute(select(Movie.id).where(Movie.id.in_(ids)))
+            return sorted(result.scalars().all())
+
+    async def _fetch_details(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        movie_id: int,
+    ) -> Tuple[int, Optional[Dict[str, Any]], bool]:
+        """Refetch one movie; returns (id, details or None, removed)."""
+        async with semaphore:
+            try:
+                response = await self._get(client, f"movie/{movie_id}", DETAILS_PARAMS)
+            except httpx.HTTPError as e:
+                log.warning("catalog_sync_fetch_failed", movie_id=movie_id, error=e)
+                return movie_id, None, False
+        if response.status_code == 404:
+            return movie_id, None, True
+        if not response.is_success:
+            log.warning("catalog_sync_fetch_status", movie_id=movie_id, status=response.status_code)
+            return movie_id, None, False
+        return movie_id, response.json(), False
+
+    async def _refresh(self, client: httpx.AsyncClient, movie_ids: Iterable[int]) -> Set[int]:
+        """Refetch movies and write them to the catalog a chunk at a time; returns the failed IDs."""
+        failed: Set[int] = set()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        movie_ids = list(movie_ids)
+        for offset in range(0, len(movie_ids), ID_CHUNK_SIZE):
+            results = await asyncio.gather(*(
+                self._fetch_details(client, semaphore, movie_id)
+                for movie_id in movie_ids[offset:offset + ID_CHUNK_SIZE]
+            ))
+            payloads = [data for _, data, _ in results if data is not None]
+            removed = [movie_id for movie_id, _, gone in results if gone]
+            async with self._sessions() as session:
+                written = await write_details(session, payloads)
+                if removed:
+                    await session.execute(delete(Movie).where(Movie.id.in_(removed)))
+                await session.commit()
+            self.refreshed += written
+            self.removed += len(removed)
+            failed.update(movie_id for movie_id, data, gone in results if data is None and not gone)
+        self.failed += len(failed)
+        return failed
+
+    async def _refresh_catalog(self, client: httpx.AsyncClient, movie_ids: List[int]) -> Set[int]:
+        """Refetch the given movies that are in the catalog; returns the failed IDs."""
+        failed: Set[int] = set()
+        for offset in range(0, len(movie_ids), ID_CHUNK_SIZE):
+            chunk = movie_ids[offset:offset + ID_CHUNK_SIZE]
+            failed |= await self._refresh(client, await self._catalog_ids(chunk))
+        return failed
+
+    async def run_once(self, now: Optional[datetime] = None) -> bool:
+        """
+        Apply the changes feed from the high-water mark up to now.
+
+        Args:
+            now: End of the sync; defaults to the current time
+
+        Returns:
+            bool: False if another process was already syncing
+        """
+        now = now or datetime.now(timezone.utc)
+        started = time.perf_counter()
+        async with self._lock() as locked:
+            if not locked:
+                self.skipped += 1
+                return False
+            async with httpx.AsyncClient(transport=self.transport, timeout=30.0) as client:
+                start = await self.get_high_water_mark() or now - INITIAL_LOOKBACK
+                retry = await self.get_failed_ids()
+                failed = await self._refresh_catalog(client, retry)
+                if retry:
+                    await self._save_state(start, failed)
+                while start < now:
+                    end = min(now, start + MAX_WINDOW)
+                    changed = sorted(await self._changed_ids(client, start, end))
+                    self.changed += len(changed)
+                    # Earlier failures refetched in this window are settled either way
+                    failed = (failed - set(changed)) | await self._refresh_catalog(client, changed)
+                    await self._save_state(end, failed)
+                    start = end
+        self.runs += 1
+        self.last_run_at = now
+        self.last_run_ms = round((time.perf_counter() - started) * 1000, 3)
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                log.error("catalog_sync_failed", error=e)
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start syncing in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background sync."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return run and throughput counters."""
+        return {
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "changed": self.changed,
+            "refreshed": self.refreshed,
+            "removed": self.removed,
+            "failed": self.failed,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_run_ms": self.last_run_ms,
+            "last_error": self.last_error,
+        }
+
+catalog_sync = CatalogSync(
+    interval_seconds=settings.CATALOG_SYNC_INTERVAL_SECONDS,
+    concurrency=settings.CATALOG_SYNC_CONCURRENCY,
+)
@@ -0,0 +1,509 @@
+"""
+Discover Engine Module
+
+This module answers TMDB discover/movie queries from an in-memory columnar
+snapshot of the local catalog, so saved filters and the filtered listing
+can be served without a TMDB round trip.
+
+Features:
+- One NumPy array per filterable column (popularity, rating, vote count,
+  runtime, release date, original language, adult/video flags)
+- Genres as a 64-bit mask per movie; any-of ("|") and all-of (",")
+  genre filters are single bitwise operations
+- Queries are the same discover params dict that would be sent to TMDB,
+  evaluated as vectorized boolean masks
+- Keyword, cast, crew and company filters answered from posting lists
+  (see posting_index), combined with AND/OR/NOT set algebra
+- Top-k for sort_by with a partition, so only the requested pages are
+  fully sorted; ties are ordered by ID so paging is stable
+- Snapshot rebuilt periodically from the catalog with a streamed query
+- Listeners handed every new snapshot, so derived indexes can reuse it
+
+Params the engine cannot evaluate (watch providers, release types,
+unsupported sorts) make it decline, and the caller asks TMDB. So do facet
+filters while too few candidate movies have that facet's data.
+Each worker process keeps its own snapshot.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import date
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.core.structured_logging import get_logger
+from app.database.database import get_session_maker
+from app.models.movie import Movie
+from app.services.posting_index import PostingList, build_posting_list, difference, intersection
+
+log = get_logger(__name__)
+settings = get_settings()
+
+PAGE_SIZE = 20
+
+# TMDB never serves pages past this one
+MAX_PAGE = 500
+
+_EPOCH = date(1970, 1, 1)
+
+# Release day of movies without a release date
+NO_DATE = np.iinfo(np.int32).min
+
+# Discover params that never change the result set
+_IGNORED_PARAMS = {"page", "language", "sort_by", "include_adult", "include_video", "watch_region"}
+
+# (column, lower or upper bound) for each range param
+_RANGE_PARAMS = {
+    "vote_average.gte": ("vote_average", True),
+    "vote_average.lte": ("vote_average", False),
+    "popularity.gte": ("popularity", True),
+    "popularity.lte": ("popularity", False),
+    "vote_count.gte": ("vote_count", True),
+    "vote_count.lte": ("vote_count", False),
+    "with_runtime.gte": ("runtime", True),
+    "with_runtime.lte": ("runtime", False),
+    "primary_release_date.gte": ("release_day", True),
+    "primary_release_date.lte": ("release_day", False),
+    "release_date.gte": ("release_day", True),
+    "release_date.lte": ("release_day", False),
+}
+
+# Facet filter param -> (facet, whether matches are excluded)
+_FACET_PARAMS = {
+    "with_keywords": ("keyword_ids", False),
+    "without_keywords": ("keyword_ids", True),
+    "with_cast": ("cast_ids", False),
+    "with_crew": ("crew_ids", False),
+    "with_companies": ("company_ids", False),
+    "without_companies": ("company_ids", True),
+}
+
+_SUPPORTED_PARAMS = _IGNORED_PARAMS | set(_RANGE_PARAMS) | set(_FACET_PARAMS) | {
+    "with_genres", "without_genres", "with_original_language",
+}
+
+# sort_by field -> column
+_SORT_COLUMNS = {
+    "popularity": "popularity",
+    "vote_average": "vote_average",
+    "vote_count": "vote_count",
+    "primary_release_date": "release_day",
+    "release_date": "release_day",
+}
+
+# Facet columns, in row tuple order after the ten scalar columns
+FACETS = ("keyword_ids", "cast_ids", "crew_ids", "company_ids")
+
+class UnsupportedQuery(ValueError):
+    """Raised for discover params the engine cannot evaluate."""
+
+def _day(value: Optional[date]) -> int:
+    return (value - _EPOCH).days if value else NO_DATE
+
+@dataclass
+class CatalogColumns:
+    """
+    Columnar snapshot of the catalog, one array element per movie, in ID order.
+
+    Attributes:
+        ids: TMDB IDs (int64)
+        popularity, vote_average: float32, 0 when unknown
+        vote_count: int32, 0 when unknown
+        runtime: float32 minutes, NaN when unknown so range filters exclude it
+        release_day: int32 days since 1970-01-01, NO_DATE when unknown
+        genre_mask: uint64 bitmask over genre_bits
+        language: int16 code into languages, -1 when unknown
+        adult, video: bool flags from the TMDB payload
+        postings: Posting list per facet column (keyword_ids, cast_ids,
+            crew_ids, company_ids) over row positions
+    """
+    ids: np.ndarray
+    popularity: np.ndarray
+    vote_average: np.ndarray
+    vote_count: np.ndarray
+    runtime: np.ndarray
+    release_day: np.ndarray
+    genre_mask: np.ndarray
+    language: np.ndarray
+    adult: np.ndarray
+    video: np.ndarray
+    genre_bits: Dict[int, int] = field(default_factory=dict)
+    languages: Dict[str, int] = field(default_factory=dict)
+    postings: Dict[str, PostingList] = field(default_factory=dict)
+    sort_keys: Dict[Tuple[str, bool], np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [
+            self.ids, self.popularity, self.vote_average, self.vote_count, self.runtime,
+            self.release_day, self.genre_mask, self.language, self.adult, self.video,
+        ]
+        return (
+            sum(array.nbytes for array in arrays + list(self.sort_keys.values()))
+            + sum(postings.nbytes for postings in self.postings.values())
+        )
+
+    def genre_mask_of(self, genre_ids: Iterable[int]) -> Tuple[int, bool]:
+        """Return the mask of genre IDs and whether every ID has a bit."""
+        mask, complete = 0, True
+        for genre_id in genre_ids:
+            bit = self.genre_bits.get(genre_id)
+            if bit is None:
+                complete = False
+            else:
+                mask |= 1 << bit
+        return mask, complete
+
+    def sort_key(self, column: str, descending: bool) -> np.ndarray:
+        """Return a float64 key where larger sorts first; unknown dates sort last."""
+        key = self.sort_keys.get((column, descending))
+        if key is None:
+            values = getattr(self, column).astype(np.float64)
+            key = values if descending else -values
+            if column == "release_day":
+                key[self.release_day == NO_DATE] = -np.inf
+            self.sort_keys[(column, descending)] = key
+        return key
+
+def build_columns(rows: Iterable[Tuple]) -> CatalogColumns:
+    """
+    Build a snapshot from catalog rows.
+
+    Args:
+        rows: (id, popularity, vote_average, vote_count, runtime,
+            release_date, genre_ids, original_language, adult, video,
+            keyword_ids, cast_ids, crew_ids, company_ids) tuples
+
+    Returns:
+        CatalogColumns: The snapshot
+
+    Raises:
+        ValueError: If the catalog uses more than 64 distinct genres
+    """
+    rows = sorted(rows, key=lambda row: row[0])
+    genre_bits: Dict[int, int] = {}
+    languages: Dict[str, int] = {}
+    masks = np.zeros(len(rows), dtype=np.uint64)
+    language = np.full(len(rows), -1, dtype=np.int16)
+    for index, row in enumerate(rows):
+        mask = 0
+        for genre_id in row[6] or ():
+            bit = genre_bits.setdefault(genre_id, len(genre_bits))
+            if bit >= 64:
+                raise ValueError("More than 64 genres in the catalog")
+            mask |= 1 << bit
+        masks[index] = mask
+        if row[7]:
+            language[index] = languages.setdefault(row[7], len(languages))
+    return CatalogColumns(
+        ids=np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows)),
+        popularity=np.fromiter((row[1] or 0.0 for row in rows), dtype=np.float32, count=len(rows)),
+        vote_average=np.fromiter((row[2] or 0.0 for row in rows), dtype=np.float32, count=len(rows)),
+        vote_count=np.fromiter((row[3] or 0 for row in rows), dtype=np.int32, count=len(rows)),
+        runtime=np.fromiter((np.nan if row[4] is None else row[4] for row in rows), dtype=np.float32, count=len(rows)),
+        release_day=np.fromiter((_day(row[5]) for row in rows), dtype=np.int32, count=len(rows)),
+        genre_mask=masks,
+        language=language,
+        adult=np.fromiter((bool(row[8]) for row in rows), dtype=bool, count=len(rows)),
+        video=np.fromiter((bool(row[9]) for row in rows), dtype=bool, count=len(rows)),
+        genre_bits=genre_bits,
+        languages=languages,
+        postings={
+            facet: build_posting_list([row[index] for row in rows])
+            for index, facet in enumerate(FACETS, start=10)
+        },
+    )
+
+def _split_ids(value: str) -> Tuple[List[int], bool]:
+    """Parse a TMDB ID list; returns the IDs and whether it is all-of (",")."""
+    if "," in value and "|" in value:
+        raise UnsupportedQuery("Mixed AND/OR ID list")
+    separator = "," if "," in value else "|"
+    return [int(part) for part in value.split(separator) if part.strip()], separator == ","
+
+def _bound(column: str, value: str) -> float:
+    if column == "release_day":
+        return _day(date.fromisoformat(value))
+    return float(value)
+
+def _apply_facets(
+    columns: CatalogColumns,
+    params: Dict[str, Any],
+    mask: np.ndarray,
+    min_facet_coverage: float,
+) -> np.ndarray:
+    """
+    Narrow a candidate mask with the facet filters in params.
+
+    Notes:
+        - with_*: "," requires every ID (AND), "|" any of them (OR)
+        - without_*: excludes movies with any of the IDs (NOT)
+        - Movies whose facet data is unknown never match a facet filter;
+          if they are more than (1 - min_facet_coverage) of the candidates,
+          the query is declined instead
+    """
+    positions = np.flatnonzero(mask)
+    for name, (facet, exclude) in _FACET_PARAMS.items():
+        if params.get(name) in (None, ""):
+            continue
+        postings = columns.postings.get(facet)
+        if postings is None:
+            raise UnsupportedQuery(f"No {facet} postings")
+        candidates = postings.known[positions]
+        if len(positions) and candidates.mean() < min_facet_coverage:
+            raise UnsupportedQuery(f"Too few candidates with {facet}")
+        positions = positions[candidates]
+        term_ids, all_of = _split_ids(str(params[name]).replace(",", "|") if exclude else str(params[name]))
+        if exclude:
+            positions = difference(positions, postings.any_of(term_ids))
+        else:
+            matches = postings.all_of(term_ids) if all_of else postings.any_of(term_ids)
+            positions = intersection(positions, matches)
+    narrowed = np.zeros(len(columns), dtype=bool)
+    narrowed[positions] = True
+    return narrowed
+
+def evaluate(
+    columns: CatalogColumns,
+    params: Dict[str, Any],
+    min_facet_coverage: float = 0.95,
+) -> Tuple[List[int], int]:
+    """
+    Evaluate discover params against a snapshot.
+
+    Args:
+        columns: Catalog snapshot
+        params: TMDB discover/movie params
+        min_facet_coverage: Share of candidate movies that must have a
+            facet's data before a filter on that facet is evaluated
+
+    Returns:
+        Tuple[List[int], int]: Movie IDs of the requested page in sort order,
+        and the number of matching movies
+
+    Raises:
+        UnsupportedQuery: If params use anything the engine cannot evaluate
+    """
+    unsupported = set(params) - _SUPPORTED_PARAMS
+    if unsupported:
+        raise UnsupportedQuery(f"Unsupported params: {sorted(unsupported)}")
+    sort_field, _, direction = str(params.get("sort_by") or "popularity.desc").partition(".")
+    if sort_field not in _SORT_COLUMNS or direction not in ("asc", "desc"):
+        raise UnsupportedQuery(f"Unsupported sort: {params.get('sort_by')}")
+    try:
+        page = int(params.get("page", 1))
+        mask = np.ones(len(columns), dtype=bool)
+        if str(params.get("include_adult", "false")).lower() != "true":
+            mask &= ~columns.adult
+        if str(params.get("include_video", "false")).lower() != "true":
+            mask &= ~columns.video
+        for name, (column, lower) in _RANGE_PARAMS.items():
+            if params.get(name) in (None, ""):
+                continue
+            values = getattr(columns, column)
+            bound = _bound(column, str(params[name]))
+            mask &= (values >= bound) if lower else (values <= bound)
+            if column == "release_day":
+                mask &= values != NO_DATE
+        if params.get("with_genres"):
+            genre_ids, all_of = _split_ids(str(params["with_genres"]))
+            wanted, complete = columns.genre_mask_of(genre_ids)
+            if all_of and not complete:
+                mask[:] = False
+            elif all_of:
+                mask &= (columns.genre_mask & np.uint64(wanted)) == np.uint64(wanted)
+            else:
+                mask &= (columns.genre_mask & np.uint64(wanted)) != 0
+        if params.get("without_genres"):
+            genre_ids, _ = _split_ids(str(params["without_genres"]).replace(",", "|"))
+            unwanted, _ = columns.genre_mask_of(genre_ids)
+            mask &= (columns.genre_mask & np.uint64(unwanted)) == 0
+        if params.get("with_original_language"):
+            code = columns.languages.get(str(params["with_original_language"]))
+            if code is None:
+                mask[:] = False
+            else:
+                mask &= columns.language == code
+        if any(params.get(name) not in (None, "") for name in _FACET_PARAMS):
+            mask = _apply_facets(columns, params, mask, min_facet_coverage)
+    except ValueError as e:
+        raise UnsupportedQuery(str(e)) from e
+
+    matched = np.flatnonzero(mask)
+    total = len(matched)
+    start = (page - 1) * PAGE_SIZE
+    if page < 1 or page > MAX_PAGE or start >= total:
+        return [], total
+    needed = min(page * PAGE_SIZE, total)
+    keys = columns.sort_key(_SORT_COLUMNS[sort_field], direction == "desc")[matched]
+    if needed < total:
+        # Key of the needed-th best movie; ties at it are taken in ID order
+        # so consecutive pages neither repeat nor skip movies
+        kth = np.partition(keys, total - needed)[total - needed]
+        above = np.flatnonzero(keys > kth)
+        ties = np.flatnonzero(keys == kth)[:needed - len(above)]
+        top = np.sort(np.concatenate((above, ties)))
+    else:
+        top = np.arange(total)
+    # Rows are in ID order, so a stable sort breaks ties by ID
+    order = top[np.argsort(-keys[top], kind="stable")]
+    return columns.ids[matched[order[start:needed]]].tolist(), total
+
+class DiscoverEngine:
+    """
+    Serves discover queries from a periodically rebuilt catalog snapshot.
+
+    Attributes:
+        min_movies: Snapshot size below which the engine declines every query
+        rebuild_seconds: Time between snapshot rebuilds
+        min_facet_coverage: Share of candidates that must have a facet's
+            data for a keyword, cast, crew or company filter to run locally
+        served: Queries answered locally since start
+        declined: Queries handed back to the caller for TMDB
+
+    Notes:
+        - Queries run synchronously on the event loop; a query costs a few
+          vectorized passes over the snapshot
+    """
+
+    def __init__(
+        self,
+        min_movies: int = 50000,
+        rebuild_seconds: float = 600,
+        build_batch_size: int = 20000,
+        min_facet_coverage: float = 0.95,
+    ):
+        self.min_movies = min_movies
+        self.rebuild_seconds = rebuild_seconds
+        self.min_facet_coverage = min_facet_coverage
+        self.build_batch_size = build_batch_size
+        self.served = 0
+        self.declined = 0
+        self.last_build_ms: Optional[float] = None
+        self._columns: Optional[CatalogColumns] = None
+        self._listeners: List[Callable[[CatalogColumns], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def add_listener(self, listener: Callable[[CatalogColumns], None]) -> None:
+        """Call listener with every new snapshot."""
+        self._listeners.append(listener)
+
+    def _publish(self, columns: CatalogColumns) -> None:
+        self._columns = columns
+        for listener in self._listeners:
+            try:
+                listener(columns)
+            except Exception as e:
+                log.error("discover_snapshot_listener_failed", error=e)
+
+    def load(self, rows: Iterable[Tuple]) -> None:
+        """Replace the snapshot with catalog rows (see build_columns)."""
+        self._publish(build_columns(rows))
+
+    def discover(self, params: Dict[str, Any], min_results: int = 1) -> Optional[Dict[str, Any]]:
+        """
+        Answer a discover query from the snapshot.
+
+        Args:
+            params: TMDB discover/movie params
+            min_results: Matches below which the query is declined
+
+        Returns:
+            Optional[dict]: page, ids (the page's movie IDs in order),
+            total_pages and total_results; None if the snapshot is missing
+            or too small, the params are unsupported, or too few movies match
+        """
+        columns = self._columns
+        if columns is None or len(columns) < self.min_movies:
+            self.declined += 1
+            return None
+        try:
+            ids, total = evaluate(columns, params, self.min_facet_coverage)
+        except UnsupportedQuery:
+            self.declined += 1
+            return None
+        if total < min_results:
+            self.declined += 1
+            return None
+        self.served += 1
+        return {
+            "page": int(params.get("page", 1)),
+            "ids": ids,
+            "total_pages": min(math.ceil(total / PAGE_SIZE), MAX_PAGE),
+            "total_results": total,
+        }
+
+    async def rebuild(self) -> None:
+        """Rebuild the snapshot from the catalog, streaming rows in batches."""
+        started = time.perf_counter()
+        rows: List[Tuple] = []
+        async with get_session_maker()() as session:
+            result = await session.stream(
+                select(
+                    Movie.id, Movie.popularity, Movie.vote_average, Movie.vote_count, Movie.runtime,
+                    Movie.release_date, Movie.genre_ids, Movie.original_language,
+                    Movie.payload["adult"].as_boolean(), Movie.payload["video"].as_boolean(),
+                    Movie.keyword_ids, Movie.cast_ids, Movie.crew_ids, Movie.company_ids,
+                ).execution_options(yield_per=self.build_batch_size)
+            )
+            async for partition in result.partitions():
+                rows.extend(tuple(row) for row in partition)
+        self._publish(await asyncio.to_thread(build_columns, rows))
+        self.last_build_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.rebuild()
+            except Exception as e:
+                log.error("discover_snapshot_rebuild_failed", error=e)
+            await asyncio.sleep(self.rebuild_seconds)
+
+    def start(self) -> None:
+        """Build the snapshot and keep rebuilding it in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background rebuilds."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return snapshot size, memory and query counters."""
+        columns = self._columns
+        return {
+            "movies": len(columns) if columns is not None else 0,
+            "memory_bytes": columns.nbytes if columns is not None else 0,
+            "genres": len(columns.genre_bits) if columns is not None else 0,
+            "facets": {
+                facet: {
+                    "terms": len(postings.terms),
+                    "postings": len(postings.postings),
+                    "known": int(postings.known.sum()),
+                }
+                for facet, postings in (columns.postings.items() if columns is not None else ())
+            },
+            "served": self.served,
+            "declined": self.declined,
+            "last_build_ms": self.last_build_ms,
+        }
+
+discover_engine = DiscoverEngine(
+    min_movies=settings.DISCOVER_LOCAL_MIN_MOVIES,
+    rebuild_seconds=settings.DISCOVER_REBUILD_SECONDS,
+    min_facet_coverage=settings.DISCOVER_FACET_MIN_COVERAGE,
+)
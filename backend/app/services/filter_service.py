@@ -1,9 +1,14 @@
-from typing import Optional
+from typing import List, Optional, Union
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.filter_settings import FilterSettings
-from app.schemas.filter_schemas import FilterSettingsCreate, FilterSettingsUpdate
+from app.schemas.filter_schemas import (
+    FilterSettingsCreate,
+    FilterSettingsUpdate,
+    INTEGER_ARRAY_FIELDS,
+    TEXT_ARRAY_FIELDS,
+)
 
 
 async def create_filter_settings(
@@ -28,6 +33,24 @@ async def get_filter_settings(
     return result.scalar_one_or_none()
 
 
+async def get_filter_settings_referencing(
+    db: AsyncSession,
+    field: str,
+    value: Union[int, str]
+) -> List[FilterSettings]:
+    """
+    Get every filter whose array field contains a value.
+
+    Uses the field's GIN index, e.g. field="genres", value=27 finds all
+    filters that reference genre 27.
+    """
+    if field not in INTEGER_ARRAY_FIELDS + TEXT_ARRAY_FIELDS:
+        raise ValueError(f"{field} is not an array filter field")
+    query = select(FilterSettings).where(getattr(FilterSettings, field).contains([value]))
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
 async def update_filter_settings(
     db: AsyncSession,
     db_filter_settings: FilterSettings,
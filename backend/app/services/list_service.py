@@ -7,23 +7,37 @@ It handles all database operations related to creating, retrieving, and modifyin
 Key Features:
 - List creation and management
 - Default list handling for new users
-- Movie addition to lists
+- Movie addition to lists, singly or in bulk
 - Watched status tracking
+- Cached default list IDs for hot toggle paths
 - Efficient database queries with joins
+- Keyset pagination of list items
 - Transaction management
 
 The service layer abstracts database operations from the API routes and
 ensures consistent business logic across the application.
 """
 
-from uuid import UUID
-from sqlalchemy import select, and_, delete
-from sqlalchemy.orm import joinedload
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID, uuid4
+from sqlalchemy import select, and_, delete, event, any_, bindparam, String, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.orm import joinedload, noload
 from sqlalchemy.ext.asyncio import AsyncSession
+from ..core.cache import LRUCache
+from ..core.config import get_settings
+from ..database.queries import default_lists_query, default_list_status_query
 from ..models.list_models import List, ListItem
 from ..models.user import User
 from typing import Dict, List as TypeList, Optional, Tuple
 
+settings = get_settings()
+
+# user_id -> (watched_list_id, watchlist_id)
+_default_list_ids = LRUCache(maxsize=settings.DEFAULT_LISTS_CACHE_SIZE)
+
 async def create_list(db: AsyncSession, user_id: UUID, name: str, description: str = None) -> List:
     """
     Create a new custom movie list for a user.
@@ -63,20 +77,17 @@ async def get_user_default_lists(db: AsyncSession, user_id: UUID) -> Tuple[List,
     
     Returns:
         Tuple[List, List]: A tuple containing (watched_list, watchlist)
+    
+    Notes:
+        - Seeds the default list ID cache once both lists are committed
     """
     # Query both lists in a single database call
-    query = select(List).where(
-        and_(
-            List.user_id == user_id,
-            List.is_default == True,
-            List.name.in_(["Watched", "Watchlist"])
-        )
-    )
-    result = await db.execute(query)
+    result = await db.execute(default_lists_query(user_id))
     existing_lists = result.scalars().all()
     
     watched_list = next((l for l in existing_lists if l.name == "Watched"), None)
     watchlist = next((l for l in existing_lists if l.name == "Watchlist"), None)
+    created = []
     
     # Create any missing default lists
     if not watched_list:
@@ -87,6 +98,7 @@ async def get_user_default_lists(db: AsyncSession, user_id: UUID) -> Tuple[List,
             is_default=True
         )
         db.add(watched_list)
+        created.append(watched_list)
     
     if not watchlist:
         watchlist = List(
@@ -96,16 +108,78 @@ async def get_user_default_lists(db: AsyncSession, user_id: UUID) -> Tuple[List,
             is_default=True
         )
         db.add(watchlist)
+        created.append(watchlist)
     
-    if not watched_list or not watchlist:
+    if created:
         await db.commit()
-        if not watched_list:
-            await db.refresh(watched_list)
-        if not watchlist:
-            await db.refresh(watchlist)
+        for db_list in created:
+            await db.refresh(db_list)
     
+    _default_list_ids.set(user_id, (watched_list.id, watchlist.id))
     return watched_list, watchlist
 
+async def get_user_default_list_ids(db: AsyncSession, user_id: UUID) -> Tuple[UUID, UUID]:
+    """
+    Get the IDs of a user's default lists, hitting the database only on a cache miss.
+    
+    Args:
+        db: Database session
+        user_id: UUID of the user
+    
+    Returns:
+        Tuple[UUID, UUID]: A tuple containing (watched_list_id, watchlist_id)
+    
+    Notes:
+        - Default lists cannot be renamed or deleted, so their IDs never change
+        - Missing lists are created on first use via get_user_default_lists
+    """
+    cached = _default_list_ids.get(user_id)
+    if cached is not None:
+        return cached
+    
+    watched_list, watchlist = await get_user_default_lists(db, user_id)
+    return watched_list.id, watchlist.id
+
+def invalidate_user_default_lists(user_id: UUID) -> None:
+    """
+    Drop a user's cached default list IDs.
+    
+    Args:
+        user_id: UUID of the user
+    """
+    _default_list_ids.pop(user_id)
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_user(mapper, connection, target: User) -> None:
+    """Evict cached default list IDs when a user row is deleted through the ORM."""
+    invalidate_user_default_lists(target.id)
+
+async def _get_default_list_status(
+    db: AsyncSession,
+    watched_list_id: UUID,
+    watchlist_id: UUID,
+    movie_id: str
+) -> Dict[str, bool]:
+    """
+    Look up which default lists contain a movie.
+    
+    Args:
+        db: Database session
+        watched_list_id: UUID of the user's Watched list
+        watchlist_id: UUID of the user's Watchlist
+        movie_id: TMDB ID of the movie
+    
+    Returns:
+        Dict[str, bool]: Dictionary with 'is_watched' and 'in_watchlist' status
+    """
+    result = await db.execute(default_list_status_query(movie_id, watched_list_id, watchlist_id))
+    list_ids = set(result.scalars().all())
+    
+    return {
+        'is_watched': watched_list_id in list_ids,
+        'in_watchlist': watchlist_id in list_ids
+    }
+
 async def get_movie_list_status(
     db: AsyncSession,
     user_id: UUID,
@@ -122,22 +196,59 @@ async def get_movie_list_status(
     Returns:
         Dict[str, bool]: Dictionary with 'is_watched' and 'in_watchlist' status
     """
-    watched_list, watchlist = await get_user_default_lists(db, user_id)
+    watched_list_id, watchlist_id = await get_user_default_list_ids(db, user_id)
+    return await _get_default_list_status(db, watched_list_id, watchlist_id, movie_id)
+
+async def get_movies_list_status(
+    db: AsyncSession,
+    user_id: UUID,
+    movie_ids: TypeList[str]
+) -> Dict[str, Dict]:
+    """
+    Get list membership for many movies in a single query.
     
-    # Query both statuses in a single database call
-    query = select(ListItem).where(
-        and_(
-            ListItem.movie_id == movie_id,
-            ListItem.list_id.in_([watched_list.id, watchlist.id])
+    Args:
+        db: Database session
+        user_id: UUID of the user
+        movie_ids: TMDB IDs of the movies to look up
+    
+    Returns:
+        Dict[str, Dict]: Mapping of movie ID to 'is_watched', 'in_watchlist'
+        and 'list_ids' (custom lists containing the movie)
+    
+    Notes:
+        - Matches with movie_id = ANY(:ids) so the statement text is the same
+          for every batch size
+        - Every requested ID is present in the result, even if in no list
+    """
+    watched_list_id, watchlist_id = await get_user_default_list_ids(db, user_id)
+    
+    query = (
+        select(ListItem.movie_id, ListItem.list_id)
+        .join(List, List.id == ListItem.list_id)
+        .where(
+            and_(
+                List.user_id == user_id,
+                ListItem.movie_id == any_(bindparam("movie_ids", movie_ids, type_=ARRAY(String)))
+            )
         )
     )
     result = await db.execute(query)
-    items = result.scalars().all()
     
-    return {
-        'is_watched': any(item.list_id == watched_list.id for item in items),
-        'in_watchlist': any(item.list_id == watchlist.id for item in items)
+    statuses = {
+        movie_id: {'is_watched': False, 'in_watchlist': False, 'list_ids': []}
+        for movie_id in movie_ids
     }
+    for movie_id, list_id in result.all():
+        status = statuses[movie_id]
+        if list_id == watched_list_id:
+            status['is_watched'] = True
+        elif list_id == watchlist_id:
+            status['in_watchlist'] = True
+        else:
+            status['list_ids'].append(list_id)
+    
+    return statuses
 
 async def toggle_watched_status(
     db: AsyncSession,
@@ -155,10 +266,10 @@ async def toggle_watched_status(
     Returns:
         Dict[str, bool]: Dictionary with updated 'is_watched' and 'in_watchlist' status
     """
-    watched_list, watchlist = await get_user_default_lists(db, user_id)
+    watched_list_id, watchlist_id = await get_user_default_list_ids(db, user_id)
     
     # Get current status
-    status = await get_movie_list_status(db, user_id, movie_id)
+    status = await _get_default_list_status(db, watched_list_id, watchlist_id, movie_id)
     
     try:
         if status['is_watched']:
@@ -166,7 +277,7 @@ async def toggle_watched_status(
             await db.execute(
                 delete(ListItem).where(
                     and_(
-                        ListItem.list_id == watched_list.id,
+                        ListItem.list_id == watched_list_id,
                         ListItem.movie_id == movie_id
                     )
                 )
@@ -174,14 +285,14 @@ async def toggle_watched_status(
             new_status = {'is_watched': False, 'in_watchlist': status['in_watchlist']}
         else:
             # Add to watched list
-            db.add(ListItem(list_id=watched_list.id, movie_id=movie_id))
+            db.add(ListItem(list_id=watched_list_id, movie_id=movie_id))
             
             # Remove from watchlist if present
             if status['in_watchlist']:
                 await db.execute(
                     delete(ListItem).where(
                         and_(
-                            ListItem.list_id == watchlist.id,
+                            ListItem.list_id == watchlist_id,
                             ListItem.movie_id == movie_id
                         )
                     )
@@ -210,10 +321,10 @@ async def toggle_watchlist_status(
     Returns:
         Dict[str, bool]: Dictionary with updated 'is_watched' and 'in_watchlist' status
     """
-    watched_list, watchlist = await get_user_default_lists(db, user_id)
+    watched_list_id, watchlist_id = await get_user_default_list_ids(db, user_id)
     
     # Get current status
-    status = await get_movie_list_status(db, user_id, movie_id)
+    status = await _get_default_list_status(db, watched_list_id, watchlist_id, movie_id)
     
     try:
         if status['in_watchlist']:
@@ -221,7 +332,7 @@ async def toggle_watchlist_status(
             await db.execute(
                 delete(ListItem).where(
                     and_(
-                        ListItem.list_id == watchlist.id,
+                        ListItem.list_id == watchlist_id,
                         ListItem.movie_id == movie_id
                     )
                 )
@@ -230,7 +341,7 @@ async def toggle_watchlist_status(
         else:
             # Add to watchlist if not already watched
             if not status['is_watched']:
-                db.add(ListItem(list_id=watchlist.id, movie_id=movie_id))
+                db.add(ListItem(list_id=watchlist_id, movie_id=movie_id))
                 new_status = {'is_watched': False, 'in_watchlist': True}
             else:
                 new_status = {'is_watched': True, 'in_watchlist': False}
@@ -274,6 +385,93 @@ async def add_movie_to_list(
     await db.refresh(list_item)
     return list_item
 
+async def add_movies_to_list(
+    db: AsyncSession,
+    list_id: UUID,
+    movie_ids: TypeList[str]
+) -> TypeList[Dict[str, str]]:
+    """
+    Add many movies to a list in a single statement.
+    
+    Args:
+        db: Database session
+        list_id: UUID of the target list
+        movie_ids: TMDB IDs of the movies to add, without duplicates
+    
+    Returns:
+        list[dict]: Per-movie outcome in request order, with status
+        'added' or 'exists'
+    
+    Notes:
+        - Uses a multi-row INSERT ... ON CONFLICT DO NOTHING on uix_list_movie
+        - RETURNING reports which rows were actually inserted
+        - List ownership should be verified before calling
+    """
+    statement = (
+        insert(ListItem)
+        .values([
+            {"id": uuid4(), "list_id": list_id, "movie_id": movie_id}
+            for movie_id in movie_ids
+        ])
+        .on_conflict_do_nothing(constraint="uix_list_movie")
+        .returning(ListItem.movie_id)
+    )
+    try:
+        result = await db.execute(statement)
+        added = set(result.scalars().all())
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    
+    return [
+        {"movie_id": movie_id, "status": "added" if movie_id in added else "exists"}
+        for movie_id in movie_ids
+    ]
+
+async def remove_movies_from_list(
+    db: AsyncSession,
+    list_id: UUID,
+    movie_ids: TypeList[str]
+) -> TypeList[Dict[str, str]]:
+    """
+    Remove many movies from a list in a single statement.
+    
+    Args:
+        db: Database session
+        list_id: UUID of the target list
+        movie_ids: TMDB IDs of the movies to remove, without duplicates
+    
+    Returns:
+        list[dict]: Per-movie outcome in request order, with status
+        'removed' or 'not_found'
+    
+    Notes:
+        - List ownership should be verified before calling
+    """
+    statement = (
+        delete(ListItem)
+        .where(
+            and_(
+                ListItem.list_id == list_id,
+                ListItem.movie_id == any_(bindparam("movie_ids", movie_ids, type_=ARRAY(String)))
+            )
+        )
+        .returning(ListItem.movie_id)
+    )
+    try:
+        result = await db.execute(statement)
+        removed = set(result.scalars().all())
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    
+    return [
+        {"movie_id": movie_id, "status": "removed" if movie_id in removed else "not_found"}
+        for movie_id in movie_ids
+    ]
+
 async def get_or_create_watched_list(db: AsyncSession, user_id: UUID) -> List:
     """
     Retrieve or create the special "Watched" list for a user.
@@ -290,7 +488,14 @@ async def get_or_create_watched_list(db: AsyncSession, user_id: UUID) -> List:
         - Marked as a default list (is_default=True)
         - Used by the watched status toggle feature
         - Ensures exactly one Watched list per user
+        - Uses a primary key lookup when the list ID is cached
     """
+    cached = _default_list_ids.get(user_id)
+    if cached is not None:
+        watched_list = await db.get(List, cached[0])
+        if watched_list:
+            return watched_list
+    
     query = select(List).where(
         (List.user_id == user_id) & (List.name == "Watched")
     )
@@ -326,7 +531,14 @@ async def get_or_create_watchlist(db: AsyncSession, user_id: UUID) -> List:
         - Marked as a default list (is_default=True)
         - Used by the watchlist toggle feature
         - Ensures exactly one Watchlist per user
+        - Uses a primary key lookup when the list ID is cached
     """
+    cached = _default_list_ids.get(user_id)
+    if cached is not None:
+        watchlist = await db.get(List, cached[1])
+        if watchlist:
+            return watchlist
+    
     query = select(List).where(
         (List.user_id == user_id) & (List.name == "Watchlist")
     )
@@ -369,6 +581,99 @@ async def get_list_by_id(db: AsyncSession, list_id: UUID) -> List:
     result = await db.execute(query)
     return result.unique().scalar_one_or_none()
 
+async def get_list_owner_id(db: AsyncSession, list_id: UUID) -> Optional[UUID]:
+    """
+    Look up the owner of a list without loading the list or its items.
+    
+    Args:
+        db: Database session
+        list_id: UUID of the list
+    
+    Returns:
+        Optional[UUID]: UUID of the owning user, or None if the list doesn't exist
+    """
+    result = await db.execute(select(List.user_id).where(List.id == list_id))
+    return result.scalar_one_or_none()
+
+def encode_item_cursor(item: ListItem) -> str:
+    """
+    Build the keyset cursor pointing just past a list item.
+    
+    Args:
+        item: Last list item of the current page
+    
+    Returns:
+        str: Opaque URL-safe cursor (base64 of "<added_at ISO 8601>,<item id>")
+    
+    Notes:
+        - The cursor contains no "+" or "/", so it survives a query string
+          without percent-encoding
+    """
+    raw = f"{item.added_at.isoformat()},{item.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_item_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Parse a keyset cursor produced by encode_item_cursor.
+    
+    Args:
+        cursor: Cursor string
+    
+    Returns:
+        Tuple[datetime, UUID]: The (added_at, id) position of the cursor
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Malformed cursor") from e
+    added_at, item_id = raw.rsplit(",", 1)
+    return datetime.fromisoformat(added_at), UUID(item_id)
+
+async def get_list_items_page(
+    db: AsyncSession,
+    list_id: UUID,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    limit: int = 50
+) -> Tuple[TypeList[ListItem], Optional[str]]:
+    """
+    Retrieve one page of a list's items, most recently added first.
+    
+    Args:
+        db: Database session
+        list_id: UUID of the list
+        after: Optional (added_at, id) position to continue from
+        limit: Maximum number of items to return
+    
+    Returns:
+        Tuple[list[ListItem], Optional[str]]: The page of items and the cursor
+        for the next page, or None on the last page
+    
+    Notes:
+        - Seeks on the (list_id, added_at, id) index, so cost is O(page)
+          regardless of list size
+        - The parent list relationship is not loaded
+        - List ownership should be verified before calling
+    """
+    query = (
+        select(ListItem)
+        .options(noload(ListItem.list))
+        .where(ListItem.list_id == list_id)
+    )
+    if after is not None:
+        query = query.where(tuple_(ListItem.added_at, ListItem.id) < after)
+    query = query.order_by(ListItem.added_at.desc(), ListItem.id.desc()).limit(limit + 1)
+    
+    result = await db.execute(query)
+    items = result.scalars().all()
+    
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, encode_item_cursor(items[-1])
+
 async def validate_list_name(db: AsyncSession, user_id: UUID, name: str, exclude_list_id: UUID = None) -> bool:
     """
     Check if a list name is available for a user.
@@ -485,4 +790,36 @@ async def get_user_lists(db: AsyncSession, user_id: UUID) -> TypeList[List]:
         .where(List.user_id == user_id)
     )
     result = await db.execute(query)
-    return result.unique().scalars().all() 
\ No newline at end of file
+    return result.unique().scalars().all()
+
+async def get_user_list_summaries(db: AsyncSession, user_id: UUID) -> TypeList:
+    """
+    Retrieve name, item count and last activity of each of a user's lists.
+    
+    Args:
+        db: Database session
+        user_id: UUID of the user whose lists to retrieve
+    
+    Returns:
+        list[Row]: One row per list with the ListSummary columns
+    
+    Notes:
+        - Reads the trigger-maintained counters; no list_items rows are loaded
+        - Selects columns rather than List entities so the eager
+          items/user relationships never fire
+    """
+    query = (
+        select(
+            List.id,
+            List.name,
+            List.description,
+            List.is_default,
+            List.item_count,
+            List.last_item_added_at,
+            List.updated_at,
+        )
+        .where(List.user_id == user_id)
+        .order_by(List.is_default.desc(), List.created_at)
+    )
+    result = await db.execute(query)
+    return result.all()
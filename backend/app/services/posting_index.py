@@ -0,0 +1,110 @@
+"""
+Posting Index Module
+
+This module provides inverted indexes from keyword, person and company IDs
+to the movies that carry them, for filters a column scan cannot evaluate.
+
+Features:
+- One posting list per facet in CSR layout: a sorted term array, offsets,
+  and a single int32 array of movie row positions, sorted per term
+- Per-facet "known" flags, so movies whose facet data has not been
+  fetched yet can be told apart from movies without any terms
+- Set algebra over sorted position arrays: union (OR), intersection
+  (AND) and difference (NOT)
+
+Positions refer to rows of the discover engine's catalog snapshot; the
+engine builds the posting lists together with its columns.
+"""
+
+from dataclasses import dataclass
+from functools import reduce
+import itertools
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+_EMPTY = np.zeros(0, dtype=np.int32)
+
+def union(*position_lists: np.ndarray) -> np.ndarray:
+    """OR: positions in any of the lists, sorted."""
+    if not position_lists:
+        return _EMPTY
+    return np.unique(np.concatenate(position_lists))
+
+def intersection(*position_lists: np.ndarray) -> np.ndarray:
+    """AND: positions in every list, sorted; starts from the shortest list."""
+    if not position_lists:
+        return _EMPTY
+    ordered = sorted(position_lists, key=len)
+    return reduce(lambda acc, other: np.intersect1d(acc, other, assume_unique=True), ordered[1:], ordered[0])
+
+def difference(positions: np.ndarray, excluded: np.ndarray) -> np.ndarray:
+    """NOT: positions not in excluded, sorted."""
+    return np.setdiff1d(positions, excluded, assume_unique=True)
+
+@dataclass
+class PostingList:
+    """
+    Inverted index of one facet.
+
+    Attributes:
+        terms: Sorted unique term IDs (int64)
+        offsets: Start of each term's postings, plus the total at the end
+        postings: Row positions (int32), grouped by term and sorted per term
+        known: Per row, whether the facet's data is present
+    """
+    terms: np.ndarray
+    offsets: np.ndarray
+    postings: np.ndarray
+    known: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return self.terms.nbytes + self.offsets.nbytes + self.postings.nbytes + self.known.nbytes
+
+    def get(self, term: int) -> np.ndarray:
+        """Return the sorted row positions of a term."""
+        index = np.searchsorted(self.terms, term)
+        if index == len(self.terms) or self.terms[index] != term:
+            return _EMPTY
+        return self.postings[self.offsets[index]:self.offsets[index + 1]]
+
+    def any_of(self, terms: Iterable[int]) -> np.ndarray:
+        """Row positions carrying at least one of the terms."""
+        return union(*(self.get(term) for term in terms))
+
+    def all_of(self, terms: Iterable[int]) -> np.ndarray:
+        """Row positions carrying every one of the terms."""
+        return intersection(*(self.get(term) for term in terms))
+
+def build_posting_list(values: Sequence[Optional[Sequence[int]]]) -> PostingList:
+    """
+    Build a facet's posting list.
+
+    Args:
+        values: Per snapshot row, the row's term IDs, or None if unknown
+
+    Returns:
+        PostingList: The inverted index
+    """
+    known = np.fromiter((value is not None for value in values), dtype=bool, count=len(values))
+    lengths = np.fromiter((len(value) if value else 0 for value in values), dtype=np.int64, count=len(values))
+    rows = np.repeat(np.arange(len(values), dtype=np.int32), lengths)
+    terms = np.fromiter(
+        itertools.chain.from_iterable(value for value in values if value),
+        dtype=np.int64,
+        count=int(lengths.sum()),
+    )
+    order = np.lexsort((rows, terms))
+    terms, rows = terms[order], rows[order]
+    if len(terms):
+        distinct = np.ones(len(terms), dtype=bool)
+        distinct[1:] = (terms[1:] != terms[:-1]) | (rows[1:] != rows[:-1])
+        terms, rows = terms[distinct], rows[distinct]
+    unique_terms, starts = np.unique(terms, return_index=True)
+    return PostingList(
+        terms=unique_terms,
+        offsets=np.append(starts, len(terms)).astype(np.int64),
+        postings=rows,
+        known=known,
+    )
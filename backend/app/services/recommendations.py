@@ -0,0 +1,372 @@
+"""
+Recommendations Module
+
+This module recommends movies to a user from what other users keep on
+their lists, by item-item co-occurrence over every user's Watched and
+Watchlist items.
+
+Features:
+- Periodic batch job streaming list items through a server-side cursor,
+  one user at a time, so memory holds one user's movies plus the pair
+  counts
+- Pair counts accumulated in NumPy chunks and merged with np.unique; when
+  they exceed the pair budget the rarest pairs are pruned
+- Cosine similarity of co-occurrence (pair count over the square root of
+  both movies' user counts), keeping the top neighbours per movie in CSR
+  layout
+- A user's watched set scored against the neighbours with one
+  np.bincount; results topped up with the most listed movies
+- Results cached per user and model build, dropped when the user toggles
+  a movie
+
+Each worker process keeps its own model and cache; another worker's cached
+results for a user expire after RECOMMENDATIONS_CACHE_TTL_SECONDS.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+from app.core.structured_logging import get_logger
+from app.database.database import get_session_maker
+from app.models.list_models import List as ListModel, ListItem
+
+log = get_logger(__name__)
+settings = get_settings()
+
+# Default lists whose movies count as a user's interest
+PROFILE_LISTS = ("Watched", "Watchlist")
+
+# Pairs buffered before they are merged into the running counts
+CHUNK_PAIRS = 1 << 21
+
+_LOW_BITS = np.int64(0xFFFFFFFF)
+
+def _movie_id(value: str) -> Optional[int]:
+    return int(value) if value.isdigit() else None
+
+@dataclass
+class ItemNeighbours:
+    """
+    Top co-occurring movies of each movie.
+
+    Attributes:
+        movie_ids: TMDB ID of each item index, sorted
+        user_counts: int32 number of users listing each movie
+        offsets: Start of each item's neighbours, plus the total at the end
+        neighbours: int32 item indexes, most similar first per item
+        scores: float32 cosine similarity of each neighbour
+        popular: Item indexes by user count, most listed first
+    """
+    movie_ids: np.ndarray
+    user_counts: np.ndarray
+    offsets: np.ndarray
+    neighbours: np.ndarray
+    scores: np.ndarray
+    popular: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.movie_ids, self.user_counts, self.offsets, self.neighbours, self.scores, self.popular]
+        return sum(array.nbytes for array in arrays)
+
+    def recommend(self, profile: Iterable[int], limit: int) -> List[int]:
+        """
+        Score movies against a user's profile.
+
+        Args:
+            profile: TMDB IDs of the user's movies; never recommended back
+            limit: Maximum number of movies
+
+        Returns:
+            List[int]: TMDB IDs, best first; movies similar to the profile,
+            then the most listed movies if there are too few
+        """
+        wanted = np.unique(np.fromiter(profile, dtype=np.int64))
+        positions = np.searchsorted(self.movie_ids, wanted)
+        found = positions < len(self.movie_ids)
+        found[found] = self.movie_ids[positions[found]] == wanted[found]
+        items = positions[found]
+
+        starts, ends = self.offsets[items], self.offsets[items + 1]
+        scores = np.zeros(len(self.movie_ids))
+        if len(items):
+            neighbours = np.concatenate([self.neighbours[start:end] for start, end in zip(starts, ends)])
+            weights = np.concatenate([self.scores[start:end] for start, end in zip(starts, ends)])
+            scores = np.bincount(neighbours, weights=weights, minlength=len(self.movie_ids))
+            scores[items] = 0.0
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        # Item indexes are in ID order, so a stable sort breaks ties by ID
+        ranked = np.sort(candidates)
+        ranked = ranked[np.argsort(-scores[ranked], kind="stable")].tolist()
+        if len(ranked) < limit:
+            excluded = set(ranked) | set(items.tolist())
+            for item in self.popular.tolist():
+                if len(ranked) == limit:
+                    break
+                if item not in excluded:
+                    ranked.append(item)
+        return self.movie_ids[ranked].tolist() if ranked else []
+
+class CooccurrenceBuilder:
+    """
+    Accumulates movie pair counts from (user, movie) rows grouped by user.
+
+    Attributes:
+        max_basket: Movies per user counted; the rest are ignored
+        max_pairs: Distinct pairs kept; rarer pairs are pruned past this
+        pruned_below: Pair count below which pairs were pruned, 0 if none
+
+    Notes:
+        - Rows must arrive grouped by user, most relevant movies first
+        - Pruning is approximate: a pruned pair seen again later restarts
+          from zero
+    """
+
+    def __init__(self, max_basket: int = 500, max_pairs: int = 20_000_000, chunk_pairs: int = CHUNK_PAIRS):
+        self.max_basket = max_basket
+        self.max_pairs = max_pairs
+        self.chunk_pairs = chunk_pairs
+        self.pruned_below = 0
+        self.users = 0
+        self._items: Dict[int, int] = {}
+        self._user_counts: List[int] = []
+        self._user: Any = None
+        self._basket: List[int] = []
+        self._chunks: List[np.ndarray] = []
+        self._buffered = 0
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._counts = np.zeros(0, dtype=np.int64)
+
+    def add(self, rows: Iterable[Tuple[Any, int]]) -> None:
+        """Add (user, TMDB movie ID) rows."""
+        for user, movie_id in rows:
+            if user != self._user:
+                self._flush_basket()
+                self._user = user
+            if len(self._basket) < self.max_basket:
+                item = self._items.setdefault(movie_id, len(self._items))
+                if item == len(self._user_counts):
+                    self._user_counts.append(0)
+                self._basket.append(item)
+
+    def _flush_basket(self) -> None:
+        items = np.unique(np.array(self._basket, dtype=np.int64))
+        self._basket = []
+        if not len(items):
+            return
+        self.users += 1
+        for item in items.tolist():
+            self._user_counts[item] += 1
+        if len(items) < 2:
+            return
+        first, second = np.triu_indices(len(items), 1)
+        self._chunks.append((items[first] << 32) | items[second])
+        self._buffered += len(first)
+        if self._buffered >= self.chunk_pairs:
+            self._merge()
+
+    def _merge(self) -> None:
+        if not self._chunks:
+            return
+        keys = np.concatenate([self._keys] + self._chunks)
+        weights = np.concatenate([self._counts] + [np.ones(len(chunk), dtype=np.int64) for chunk in self._chunks])
+        self._chunks, self._buffered = [], 0
+        self._keys, inverse = np.unique(keys, return_inverse=True)
+        self._counts = np.bincount(inverse, weights=weights).astype(np.int64)
+        if len(self._keys) > self.max_pairs:
+            # Smallest count threshold that brings the pairs within budget
+            threshold = int(np.partition(self._counts, len(self._counts) - self.max_pairs)[len(self._counts) - self.max_pairs])
+            if np.count_nonzero(self._counts >= threshold) > self.max_pairs:
+                threshold += 1
+            keep = self._counts >= threshold
+            self._keys, self._counts = self._keys[keep], self._counts[keep]
+            self.pruned_below = max(self.pruned_below, threshold)
+
+    def finish(self, neighbours: int = 50) -> ItemNeighbours:
+        """
+        Turn the counts into per-movie neighbour lists.
+
+        Args:
+            neighbours: Neighbours kept per movie
+
+        Returns:
+            ItemNeighbours: The model
+        """
+        self._flush_basket()
+        self._merge()
+        movie_ids = np.fromiter(self._items, dtype=np.int64, count=len(self._items))
+        order = np.argsort(movie_ids)
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        user_counts = np.array(self._user_counts, dtype=np.int32)[order]
+
+        first, second = rank[self._keys >> 32], rank[self._keys & _LOW_BITS]
+        similarity = self._counts / np.sqrt(user_counts[first].astype(np.float64) * user_counts[second])
+        rows = np.concatenate((first, second))
+        columns = np.concatenate((second, first))
+        scores = np.concatenate((similarity, similarity))
+        by_row = np.lexsort((columns, -scores, rows))
+        rows, columns, scores = rows[by_row], columns[by_row], scores[by_row]
+        starts = np.searchsorted(rows, np.arange(len(movie_ids)))
+        keep = np.arange(len(rows)) - starts[rows] < neighbours
+        rows, columns, scores = rows[keep], columns[keep], scores[keep]
+        return ItemNeighbours(
+            movie_ids=movie_ids[order],
+            user_counts=user_counts,
+            offsets=np.searchsorted(rows, np.arange(len(movie_ids) + 1)),
+            neighbours=columns.astype(np.int32),
+            scores=scores.astype(np.float32),
+            popular=np.argsort(-user_counts, kind="stable")[:1000],
+        )
+
+class Recommender:
+    """
+    Serves per-user recommendations from a periodically rebuilt model.
+
+    Attributes:
+        neighbours: Neighbours kept per movie
+        max_basket: Movies counted per user
+        max_pairs: Distinct movie pairs kept while building
+        rebuild_seconds: Time between model rebuilds
+        build_batch_size: Rows fetched per round trip of the build cursor
+    """
+
+    def __init__(
+        self,
+        neighbours: int = 50,
+        max_basket: int = 500,
+        max_pairs: int = 20_000_000,
+        rebuild_seconds: float = 3600,
+        build_batch_size: int = 20000,
+        cache_size: int = 10000,
+        cache_ttl: Optional[float] = 300,
+    ):
+        self.neighbours = neighbours
+        self.max_basket = max_basket
+        self.max_pairs = max_pairs
+        self.rebuild_seconds = rebuild_seconds
+        self.build_batch_size = build_batch_size
+        self.hits = 0
+        self.misses = 0
+        self.last_build_ms: Optional[float] = None
+        self._model: Optional[ItemNeighbours] = None
+        self._version = 0
+        self._build_stats: Dict[str, Any] = {}
+        self._cache = LRUCache(maxsize=cache_size, ttl=cache_ttl)
+        self._task: Optional[asyncio.Task] = None
+
+    def load(self, model: ItemNeighbours) -> None:
+        """Replace the model; cached results of the previous one are no longer served."""
+        self._model = model
+        self._version += 1
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop a user's cached recommendations, e.g. after a list toggle."""
+        self._cache.pop((user_id, self._version))
+
+    async def recommend(self, db: AsyncSession, user_id: UUID, limit: int = 20) -> List[int]:
+        """
+        Recommend movies to a user.
+
+        Args:
+            db: Database session used to read the user's lists
+            user_id: UUID of the user
+            limit: Maximum number of movies
+
+        Returns:
+            List[int]: TMDB IDs, best first; empty until the first model build
+        """
+        model = self._model
+        if model is None:
+            return []
+        key = (user_id, self._version)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] >= limit:
+            self.hits += 1
+            return cached[1][:limit]
+        self.misses += 1
+        result = await db.execute(
+            select(ListItem.movie_id)
+            .join(ListModel, ListModel.id == ListItem.list_id)
+            .where(ListModel.user_id == user_id, ListModel.is_default, ListModel.name.in_(PROFILE_LISTS))
+        )
+        profile = [movie_id for movie_id in map(_movie_id, result.scalars()) if movie_id is not None]
+        movie_ids = model.recommend(profile, limit)
+        self._cache.set(key, (limit, movie_ids))
+        return movie_ids
+
+    async def rebuild(self) -> None:
+        """Rebuild the model, streaming every user's list items grouped by user."""
+        started = time.perf_counter()
+        builder = CooccurrenceBuilder(max_basket=self.max_basket, max_pairs=self.max_pairs)
+        async with get_session_maker()() as session:
+            result = await session.stream(
+                select(ListModel.user_id, ListItem.movie_id)
+                .join(ListModel, ListModel.id == ListItem.list_id)
+                .where(ListModel.is_default, ListModel.name.in_(PROFILE_LISTS))
+                .order_by(ListModel.user_id, ListItem.added_at.desc())
+                .execution_options(yield_per=self.build_batch_size)
+            )
+            async for partition in result.partitions():
+                rows = [(user_id, _movie_id(movie_id)) for user_id, movie_id in partition]
+                await asyncio.to_thread(builder.add, [row for row in rows if row[1] is not None])
+        self.load(await asyncio.to_thread(builder.finish, self.neighbours))
+        self._build_stats = {"users": builder.users, "pruned_below": builder.pruned_below}
+        self.last_build_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.rebuild()
+            except Exception as e:
+                log.error("recommendations_rebuild_failed", error=e)
+            await asyncio.sleep(self.rebuild_seconds)
+
+    def start(self) -> None:
+        """Build the model and keep rebuilding it in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background rebuilds."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return model size, memory and cache counters."""
+        model = self._model
+        return {
+            "movies": len(model.movie_ids) if model is not None else 0,
+            "neighbours": len(model.neighbours) if model is not None else 0,
+            "memory_bytes": model.nbytes if model is not None else 0,
+            **self._build_stats,
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "last_build_ms": self.last_build_ms,
+        }
+
+recommender = Recommender(
+    neighbours=settings.RECOMMENDATIONS_NEIGHBOURS,
+    max_basket=settings.RECOMMENDATIONS_MAX_BASKET,
+    max_pairs=settings.RECOMMENDATIONS_MAX_PAIRS,
+    rebuild_seconds=settings.RECOMMENDATIONS_REBUILD_SECONDS,
+    cache_size=settings.RECOMMENDATIONS_CACHE_SIZE,
+    cache_ttl=settings.RECOMMENDATIONS_CACHE_TTL_SECONDS,
+)
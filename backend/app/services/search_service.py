@@ -0,0 +1,216 @@
+"""
+Search Service Module
+
+This module searches movies by title, from the local catalog where it can
+and from TMDB's search/movie otherwise.
+
+Features:
+- Prefix full-text matching on title and original title (tsvector)
+- Fuzzy matching for typos with pg_trgm similarity
+- Ranking by text relevance weighted by popularity
+- Results shaped like TMDB search results
+- TMDB search in logical pages of 20 to 100 results, built from
+  consecutive TMDB pages fetched concurrently and deduplicated in order
+- Per-query cache of TMDB search pages
+- Latency histograms per result source
+
+The movies router falls back to TMDB unless the catalog holds a full page
+of strong matches for the query; TMDB's results are written through to
+the catalog, so later searches for the same titles are served locally.
+"""
+
+import asyncio
+import math
+import re
+from typing import Any, Dict, List, Optional
+
+import httpx
+from sqlalchemy import extract, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+from app.core.metrics import Histogram
+from app.models.movie import Movie
+from app.services.catalog_service import LISTING_SELECT, catalog_writer, listing_result
+from app.utils.tmdb import HEADERS, get_tmdb_url
+
+settings = get_settings()
+
+# Results per TMDB search page, and the last page TMDB will serve
+TMDB_PAGE_SIZE = 20
+TMDB_MAX_PAGE = 500
+
+# TMDB search pages by (query, year, primary_release_year, page)
+_tmdb_pages = LRUCache(maxsize=settings.SEARCH_CACHE_SIZE, ttl=settings.SEARCH_CACHE_TTL_SECONDS)
+
+# Search latency in milliseconds by where the results came from
+search_latency: Dict[str, Histogram] = {"catalog": Histogram(), "tmdb": Histogram()}
+
+_WORD = re.compile(r"\w+")
+
+def prefix_tsquery(query: str) -> Optional[str]:
+    """
+    Build a tsquery that matches every word of a query as a prefix.
+
+    Args:
+        query: Raw search text
+
+    Returns:
+        Optional[str]: Query such as 'star:* & wa:*', or None if the text
+        has no words
+    """
+    words = _WORD.findall(query.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+async def search_catalog(
+    db: AsyncSession,
+    query: str,
+    page: int = 1,
+    page_size: int = 20,
+    primary_release_year: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Search the catalog by title, if it can answer the query on its own.
+
+    Args:
+        db: Database session
+        query: Search text as typed by the user
+        page: Page number, starting at 1
+        page_size: Results per page
+        primary_release_year: Optional year the movie was first released in
+
+    Returns:
+        Optional[dict]: TMDB search response shape (page, results,
+        total_pages, total_results), or None when the catalog holds fewer
+        than a page of strong matches for the query
+
+    Notes:
+        - Matches use the GIN indexes on search_vector and title
+        - Score is (ts_rank + trigram similarity) * ln(2 + popularity)
+        - A strong match has a relevance (ts_rank + trigram similarity) of
+          at least SEARCH_LOCAL_MIN_RELEVANCE; the decision depends on the
+          query only, so every page of a query comes from the same source
+    """
+    query = query.strip()
+    if not query:
+        return None
+    similarity = func.similarity(Movie.title, query)
+    conditions = [Movie.title.op("%")(query)]
+    relevance = similarity
+    tsquery_text = prefix_tsquery(query)
+    if tsquery_text:
+        tsquery = func.to_tsquery("simple", tsquery_text)
+        conditions.append(Movie.search_vector.op("@@")(tsquery))
+        relevance = relevance + func.ts_rank(Movie.search_vector, tsquery)
+    score = relevance * func.ln(2 + func.coalesce(Movie.popularity, 0))
+    stmt = (
+        select(
+            *LISTING_SELECT,
+            func.count().over().label("total_results"),
+            func.count().filter(relevance >= settings.SEARCH_LOCAL_MIN_RELEVANCE).over().label("strong_results"),
+        )
+        .where(or_(*conditions))
+        .order_by(score.desc(), Movie.id)
+    )
+    if primary_release_year is not None:
+        stmt = stmt.where(extract("year", Movie.release_date) == primary_release_year)
+    rows = (await db.execute(stmt.offset((page - 1) * page_size).limit(page_size))).all()
+    counts = rows[0] if rows else None
+    if counts is None and page > 1:
+        # Past the last page; the counts still decide the source
+        counts = (await db.execute(stmt.limit(1))).first()
+    if counts is None or counts.strong_results < page_size:
+        return None
+    return {
+        "page": page,
+        "results": [listing_result(row) for row in rows],
+        "total_pages": math.ceil(counts.total_results / page_size),
+        "total_results": counts.total_results,
+    }
+
+async def _tmdb_search_page(
+    client: httpx.AsyncClient,
+    query: str,
+    page: int,
+    year: Optional[int],
+    primary_release_year: Optional[int],
+) -> Dict[str, Any]:
+    """Fetch one TMDB search page, from the page cache when possible."""
+    key = (query.strip().casefold(), year, primary_release_year, page)
+    data = _tmdb_pages.get(key)
+    if data is not None:
+        return data
+    params = {"query": query, "include_adult": "false", "page": str(page)}
+    if year is not None:
+        params["year"] = str(year)
+    if primary_release_year is not None:
+        params["primary_release_year"] = str(primary_release_year)
+    response = await client.get(get_tmdb_url("search/movie"), params=params, headers=HEADERS)
+    response.raise_for_status()
+    data = response.json()
+    catalog_writer.record_listings(data.get("results"))
+    _tmdb_pages.set(key, data)
+    return data
+
+async def search_tmdb(
+    query: str,
+    page: int = 1,
+    page_size: int = TMDB_PAGE_SIZE,
+    year: Optional[int] = None,
+    primary_release_year: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Search TMDB in logical pages of page_size results.
+
+    Args:
+        query: Search text
+        page: Logical page number, starting at 1
+        page_size: Results per logical page; a multiple of 20
+        year: Optional year of any release date
+        primary_release_year: Optional year of the primary release date
+
+    Returns:
+        dict: TMDB search response shape (page, results, total_pages,
+        total_results) counted in logical pages
+
+    Raises:
+        httpx.HTTPError: If the first TMDB page of the logical page fails
+
+    Notes:
+        - Logical page p covers TMDB pages (p-1)*k+1 through p*k, where
+          k = page_size / 20; they are fetched concurrently
+        - Results keep TMDB's order; a movie repeated across TMDB pages is
+          kept at its first position only
+        - If a later TMDB page fails, the results before it are returned
+    """
+    per_page = page_size // TMDB_PAGE_SIZE
+    first = (page - 1) * per_page + 1
+    tmdb_pages = [number for number in range(first, first + per_page) if number <= TMDB_MAX_PAGE]
+    if not tmdb_pages:
+        return {"page": page, "results": [], "total_pages": 0, "total_results": 0}
+
+    async with httpx.AsyncClient() as client:
+        responses = await asyncio.gather(
+            *(_tmdb_search_page(client, query, number, year, primary_release_year) for number in tmdb_pages),
+            return_exceptions=True,
+        )
+    if isinstance(responses[0], BaseException):
+        raise responses[0]
+
+    results: List[Dict[str, Any]] = []
+    seen = set()
+    for data in responses:
+        if isinstance(data, BaseException):
+            break
+        for movie in data.get("results", []):
+            if movie.get("id") not in seen:
+                seen.add(movie.get("id"))
+                results.append(movie)
+
+    total_results = responses[0].get("total_results", 0)
+    tmdb_total_pages = min(responses[0].get("total_pages", 0), TMDB_MAX_PAGE)
+    total_pages = min(math.ceil(total_results / page_size), math.ceil(tmdb_total_pages / per_page))
+    return {"page": page, "results": results, "total_pages": total_pages, "total_results": total_results}
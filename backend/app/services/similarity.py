@@ -0,0 +1,422 @@
+"""
+Similarity Module
+
+This module finds movies similar to a given one from their content, using
+the discover engine's catalog snapshot, so detail pages can show
+recommendations without a TMDB call.
+
+Features:
+- Sparse content vectors over genres, keywords, top-billed cast, key crew
+  and original language, weighted by feature group and inverse document
+  frequency
+- Cosine similarity against the whole catalog in one vectorized pass:
+  the query movie's features are looked up in an inverted index and the
+  dot products accumulated with np.bincount
+- Top-k neighbours cached per movie; the most popular movies are
+  precomputed after every snapshot
+- Incremental refresh: each new snapshot is diffed against the previous
+  one by per-movie content signatures, and cached lists a changed, added
+  or removed movie could enter or leave are dropped
+- Cached lists expire after SIMILAR_CACHE_TTL_SECONDS
+
+Feature weights use inverse document frequency over the whole catalog, so
+every snapshot shifts the scores of unrelated pairs a little. Lists kept
+across a refresh are therefore approximate until they expire.
+
+Only movies whose details (keywords and credits) are in the catalog are
+scored or suggested; for others the caller asks TMDB.
+Each worker process keeps its own index.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.core.cache import LRUCache
+from app.core.config import get_settings
+from app.core.structured_logging import get_logger
+from app.services.discover_engine import CatalogColumns, discover_engine
+
+log = get_logger(__name__)
+settings = get_settings()
+
+# Weight of each feature group before inverse document frequency
+FEATURE_WEIGHTS = {
+    "genres": 1.0,
+    "keyword_ids": 1.0,
+    "cast_ids": 0.8,
+    "crew_ids": 0.8,
+    "language": 0.5,
+}
+
+# Changed movies per snapshot past which the whole cache is dropped
+MAX_CHANGED = 5000
+
+# Golden-ratio multiplier for 64-bit feature hashing
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+@dataclass
+class ContentVectors:
+    """
+    Sparse content vectors of a catalog snapshot in both orientations.
+
+    Attributes:
+        columns: Catalog snapshot the vectors were built from
+        weights: float64 weight per feature
+        feature_offsets, feature_rows: Inverted index, rows of each feature
+        row_offsets, row_features: Forward index, features of each row
+        norms: Euclidean norm of each row's vector
+        eligible: Rows that may be scored or suggested
+        signatures: uint64 hash of each eligible row's features, 0 for
+            ineligible rows; comparable between builds of one process
+    """
+    columns: CatalogColumns
+    weights: np.ndarray
+    feature_offsets: np.ndarray
+    feature_rows: np.ndarray
+    row_offsets: np.ndarray
+    row_features: np.ndarray
+    norms: np.ndarray
+    eligible: np.ndarray
+    signatures: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [
+            self.weights, self.feature_offsets, self.feature_rows,
+            self.row_offsets, self.row_features, self.norms, self.eligible,
+            self.signatures,
+        ]
+        return sum(array.nbytes for array in arrays)
+
+    def position(self, movie_id: int) -> Optional[int]:
+        """Return the snapshot row of a movie, or None if it is not eligible."""
+        ids = self.columns.ids
+        index = int(np.searchsorted(ids, movie_id))
+        if index == len(ids) or ids[index] != movie_id or not self.eligible[index]:
+            return None
+        return index
+
+    def scores(self, position: int) -> np.ndarray:
+        """Cosine similarity of one row against every row."""
+        features = self.row_features[self.row_offsets[position]:self.row_offsets[position + 1]]
+        starts, ends = self.feature_offsets[features], self.feature_offsets[features + 1]
+        rows = np.concatenate([self.feature_rows[start:end] for start, end in zip(starts, ends)])
+        dots = np.bincount(rows, weights=np.repeat(self.weights[features] ** 2, ends - starts), minlength=len(self.norms))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.eligible, dots / (self.norms * self.norms[position]), 0.0)
+
+    def neighbours(self, position: int, k: int) -> Tuple[List[int], float]:
+        """
+        Return the k most similar eligible movies to a row.
+
+        Returns:
+            Tuple[List[int], float]: Movie IDs, most similar first with ties
+            in ID order, and the lowest score among them (0 if fewer than k)
+        """
+        scores = self.scores(position)
+        scores[position] = 0.0
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        # Rows are in ID order, so sorting by position breaks ties by ID
+        candidates = np.sort(candidates)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        floor = float(scores[order[-1]]) if len(order) == k else 0.0
+        return self.columns.ids[order].tolist(), floor
+
+def _feature_groups(columns: CatalogColumns) -> Iterable[Tuple[str, np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield (group, rows, local feature indexes, value of each local feature) per feature group."""
+    genres = sorted(columns.genre_bits, key=columns.genre_bits.get)
+    genre_rows = [np.flatnonzero((columns.genre_mask >> np.uint64(bit)) & np.uint64(1)) for bit in range(len(genres))]
+    yield (
+        "genres",
+        np.concatenate(genre_rows) if genre_rows else np.zeros(0, dtype=np.int64),
+        np.repeat(np.arange(len(genre_rows)), [len(rows) for rows in genre_rows]),
+        np.array(genres, dtype=np.int64),
+    )
+    languages = sorted(columns.languages, key=columns.languages.get)
+    language_rows = np.flatnonzero(columns.language >= 0)
+    yield (
+        "language",
+        language_rows,
+        columns.language[language_rows].astype(np.int64),
+        np.array([hash(language) for language in languages], dtype=np.int64),
+    )
+    for facet in ("keyword_ids", "cast_ids", "crew_ids"):
+        postings = columns.postings[facet]
+        local = np.repeat(np.arange(len(postings.terms)), np.diff(postings.offsets))
+        yield facet, postings.postings, local, np.asarray(postings.terms, dtype=np.int64)
+
+def _hash(values: np.ndarray) -> np.ndarray:
+    """Mix int64 values into well-spread uint64 hashes."""
+    x = values.astype(np.int64).view(np.uint64) * _HASH_MULTIPLIER
+    x ^= x >> np.uint64(29)
+    x *= _HASH_MULTIPLIER
+    return x ^ (x >> np.uint64(32))
+
+def build_vectors(columns: CatalogColumns) -> ContentVectors:
+    """
+    Build content vectors from a catalog snapshot.
+
+    Args:
+        columns: Discover engine snapshot
+
+    Returns:
+        ContentVectors: Vectors of every movie; eligible marks the ones with
+        keywords, credits and at least one feature that are neither adult
+        nor video
+    """
+    count = len(columns)
+    rows, features, weights, keys = [], [], [], []
+    base = 0
+    for number, (group, group_rows, local, values) in enumerate(_feature_groups(columns)):
+        size = len(values)
+        frequency = np.bincount(local, minlength=size)
+        idf = np.log((1 + count) / (1 + frequency)) + 1
+        rows.append(group_rows.astype(np.int32))
+        features.append((local + base).astype(np.int32))
+        weights.append(FEATURE_WEIGHTS[group] * idf)
+        keys.append(_hash(_hash(values).view(np.int64) ^ number))
+        base += size
+    rows = np.concatenate(rows)
+    features = np.concatenate(features)
+    weights = np.concatenate(weights)
+    keys = np.concatenate(keys)
+    norms = np.sqrt(np.bincount(rows, weights=weights[features] ** 2, minlength=count))
+
+    by_feature = np.argsort(features, kind="stable")
+    by_row = np.argsort(rows, kind="stable")
+    row_offsets = np.searchsorted(rows[by_row], np.arange(count + 1))
+    row_features = features[by_row]
+    postings = columns.postings
+    eligible = (
+        postings["keyword_ids"].known & postings["cast_ids"].known
+        & ~columns.adult & ~columns.video & (norms > 0)
+    )
+    # Sum of feature hashes per row, wrapping at 64 bits
+    sums = np.concatenate(([np.uint64(0)], np.cumsum(keys[row_features], dtype=np.uint64)))
+    signatures = np.where(eligible, sums[row_offsets[1:]] - sums[row_offsets[:-1]], np.uint64(0))
+    return ContentVectors(
+        columns=columns,
+        weights=weights,
+        feature_offsets=np.searchsorted(features[by_feature], np.arange(base + 1)),
+        feature_rows=rows[by_feature],
+        row_offsets=row_offsets,
+        row_features=row_features,
+        norms=norms,
+        eligible=eligible,
+        signatures=signatures.astype(np.uint64),
+    )
+
+def changed_movies(previous: ContentVectors, vectors: ContentVectors) -> Set[int]:
+    """
+    Return the movies whose content vector differs between two builds.
+
+    Covers movies added, removed, or with different features or eligibility;
+    movies ineligible in both builds are left out, as they are never scored
+    or suggested.
+    """
+    old_ids, new_ids = previous.columns.ids, vectors.columns.ids
+    common, old_rows, new_rows = np.intersect1d(old_ids, new_ids, assume_unique=True, return_indices=True)
+    changed = set(common[previous.signatures[old_rows] != vectors.signatures[new_rows]].tolist())
+    changed.update(old_ids[previous.eligible & ~np.isin(old_ids, new_ids, assume_unique=True)].tolist())
+    changed.update(new_ids[vectors.eligible & ~np.isin(new_ids, old_ids, assume_unique=True)].tolist())
+    return changed
+
+def _stale(vectors: ContentVectors, changed: Set[int], cached: Dict[int, Tuple[List[int], float]]) -> Set[int]:
+    """
+    Return cached movies whose neighbour lists a changed movie may alter.
+
+    A list is stale if its movie changed or is no longer eligible, if it
+    contains a changed movie (which may have left it), or if a changed movie
+    now scores above its lowest entry (and may enter it).
+    """
+    positions = {movie_id: vectors.position(movie_id) for movie_id in cached}
+    stale = {
+        movie_id for movie_id, (ids, _) in cached.items()
+        if positions[movie_id] is None or movie_id in changed or not changed.isdisjoint(ids)
+    }
+    remaining = [movie_id for movie_id in cached if movie_id not in stale]
+    if not remaining:
+        return stale
+    rows = np.array([positions[movie_id] for movie_id in remaining], dtype=np.int64)
+    floors = np.array([cached[movie_id][1] for movie_id in remaining])
+    entering = np.zeros(len(remaining), dtype=bool)
+    for movie_id in changed:
+        position = vectors.position(movie_id)
+        if position is not None:
+            entering |= vectors.scores(position)[rows] > floors
+    stale.update(np.array(remaining)[entering].tolist())
+    return stale
+
+def _invalidated(
+    previous: ContentVectors,
+    vectors: ContentVectors,
+    cached: Dict[int, Tuple[List[int], float]],
+) -> Set[int]:
+    """Return the cached movies to drop when switching from previous to vectors."""
+    changed = changed_movies(previous, vectors)
+    if len(changed) > MAX_CHANGED:
+        return set(cached)
+    return _stale(vectors, changed, cached) if changed else set()
+
+def _precompute(vectors: ContentVectors, movie_ids: List[int], k: int) -> Dict[int, Tuple[List[int], float]]:
+    found = {}
+    for movie_id in movie_ids:
+        position = vectors.position(movie_id)
+        if position is not None:
+            found[movie_id] = vectors.neighbours(position, k)
+    return found
+
+class SimilarityIndex:
+    """
+    Content-based similar movies over the discover engine's snapshot.
+
+    Attributes:
+        top_k: Neighbours kept per movie
+        cache_ttl_seconds: Lifetime of a cached neighbour list
+        precompute: Most popular movies whose neighbours are computed after
+            every snapshot
+        ready: Whether vectors have been built
+
+    Notes:
+        - Queries run on the event loop; building vectors, refreshing the
+          cache and precomputing run in a thread
+        - Changes are found by diffing each snapshot against the previous
+          one, so writes from any source or worker are seen
+        - Kept lists and their floors were scored with an earlier
+          snapshot's weights; the cache TTL bounds how long they are served
+    """
+
+    def __init__(
+        self,
+        top_k: int = 20,
+        cache_size: int = 20000,
+        cache_ttl_seconds: Optional[float] = 3600,
+        precompute: int = 2000,
+    ):
+        self.top_k = top_k
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.precompute = precompute
+        self.ready = False
+        self.hits = 0
+        self.misses = 0
+        self.last_build_ms: Optional[float] = None
+        self._vectors: Optional[ContentVectors] = None
+        self._cache = LRUCache(maxsize=cache_size, ttl=cache_ttl_seconds)
+        self._columns: Optional[CatalogColumns] = None
+        self._snapshot_ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def on_snapshot(self, columns: CatalogColumns) -> None:
+        """Discover engine listener: queue a new snapshot for vectorizing."""
+        self._columns = columns
+        self._snapshot_ready.set()
+
+    def load(self, columns: CatalogColumns) -> None:
+        """Build vectors from a snapshot synchronously and drop the cache."""
+        self._vectors = build_vectors(columns)
+        self._cache.clear()
+        self.ready = True
+
+    def similar(self, movie_id: int) -> Optional[List[int]]:
+        """
+        Return the IDs of the movies most similar to a movie.
+
+        Args:
+            movie_id: TMDB ID of the movie
+
+        Returns:
+            Optional[List[int]]: Up to top_k movie IDs, most similar first;
+            None if the movie is not in the index
+        """
+        vectors = self._vectors
+        if vectors is None:
+            return None
+        cached = self._cache.get(movie_id)
+        if cached is not None:
+            self.hits += 1
+            return cached[0]
+        position = vectors.position(movie_id)
+        if position is None:
+            return None
+        self.misses += 1
+        neighbours = vectors.neighbours(position, self.top_k)
+        self._cache.set(movie_id, neighbours)
+        return neighbours[0]
+
+    async def refresh(self, columns: CatalogColumns) -> None:
+        """Switch to a new snapshot, keeping cached lists no change affects."""
+        started = time.perf_counter()
+        vectors = await asyncio.to_thread(build_vectors, columns)
+        previous = self._vectors
+        cached = dict(self._cache.items())
+        if previous is None:
+            stale = set(cached)
+        else:
+            stale = await asyncio.to_thread(_invalidated, previous, vectors, cached) if cached else set()
+        # Lists cached while the threads ran were computed on the previous vectors and never checked
+        stale.update(movie_id for movie_id, _ in self._cache.items() if movie_id not in cached)
+        for movie_id in stale:
+            self._cache.pop(movie_id)
+        self._vectors = vectors
+        self.ready = True
+
+        eligible = np.flatnonzero(vectors.eligible)
+        popular = eligible[np.argsort(-columns.popularity[eligible], kind="stable")[:self.precompute]]
+        missing = [movie_id for movie_id in columns.ids[popular].tolist() if movie_id not in self._cache]
+        found = await asyncio.to_thread(_precompute, vectors, missing, self.top_k)
+        if self._vectors is vectors:
+            for movie_id, neighbours in found.items():
+                self._cache.set(movie_id, neighbours)
+        self.last_build_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    async def _run(self) -> None:
+        while True:
+            await self._snapshot_ready.wait()
+            self._snapshot_ready.clear()
+            try:
+                await self.refresh(self._columns)
+            except Exception as e:
+                log.error("similarity_refresh_failed", error=e)
+
+    def start(self) -> None:
+        """Refresh the index whenever the discover engine publishes a snapshot."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background refreshes."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index size, memory and cache counters."""
+        vectors = self._vectors
+        return {
+            "ready": self.ready,
+            "movies": int(vectors.eligible.sum()) if vectors is not None else 0,
+            "features": len(vectors.weights) if vectors is not None else 0,
+            "memory_bytes": vectors.nbytes if vectors is not None else 0,
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "last_build_ms": self.last_build_ms,
+        }
+
+similarity_index = SimilarityIndex(
+    top_k=settings.SIMILAR_TOP_K,
+    cache_size=settings.SIMILAR_CACHE_SIZE,
+    cache_ttl_seconds=settings.SIMILAR_CACHE_TTL_SECONDS,
+    precompute=settings.SIMILAR_PRECOMPUTE_MOVIES,
+)
+discover_engine.add_listener(similarity_index.on_snapshot)
@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import Optional
 from ..core.security import get_password_hash, verify_password
+from ..database.queries import user_by_email_query
 from ..models.user import User
 from ..schemas.user import UserCreate
 
@@ -10,7 +11,7 @@ async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
     return result.scalar_one_or_none()
 
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
-    result = await db.execute(select(User).filter(User.email == email))
+    result = await db.execute(user_by_email_query(email))
     return result.scalar_one_or_none()
 
 async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100):
@@ -18,7 +19,7 @@ async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100):
     return result.scalars().all()
 
 async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
-    hashed_password = get_password_hash(user_create.password)
+    hashed_password = await get_password_hash(user_create.password)
     db_user = User(
         email=user_create.email,
         username=user_create.username or user_create.email.split('@')[0],
@@ -33,6 +34,6 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> Opti
     user = await get_user_by_email(db, email=email)
     if not user or not user.hashed_password:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password(password, user.hashed_password):
         return None
     return user 
\ No newline at end of file
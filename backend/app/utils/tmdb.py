@@ -9,11 +9,15 @@ Features:
 - Bearer token authentication
 - URL generation for API endpoints
 - Standard headers for all requests
+- Rate budget for low-priority background requests
 
 The module uses environment-based configuration through the settings module
 to manage API credentials securely.
 """
 
+import asyncio
+import time
+
 from app.core.config import get_settings
 
 settings = get_settings()
@@ -37,4 +41,40 @@ def get_tmdb_url(endpoint: str) -> str:
     Returns:
         str: Complete TMDB API URL
     """
-    return f"{TMDB_BASE_URL}/{endpoint.lstrip('/')}" 
\ No newline at end of file
+    return f"{TMDB_BASE_URL}/{endpoint.lstrip('/')}"
+
+class RateLimiter:
+    """
+    Token bucket limiting how many requests may start per second.
+    
+    Attributes:
+        rate: Requests allowed per second on average
+        burst: Requests allowed back to back after an idle period
+    
+    Notes:
+        - Intended for use from a single event loop
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a request may start."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+# Share of our TMDB request budget that background jobs may use, leaving
+# the rest of TMDB's limit to user-facing requests
+low_priority_limiter = RateLimiter(
+    rate=settings.TMDB_LOW_PRIORITY_RATE_PER_SECOND,
+    burst=settings.TMDB_LOW_PRIORITY_BURST,
+)
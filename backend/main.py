@@ -21,13 +21,22 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.config import get_settings
 from app.database.database import init_db
+from app.database.routing import replica_router
+from app.services.catalog_service import catalog_writer
+from app.services.catalog_sync import catalog_sync
+from app.services.autocomplete import title_index
+from app.services.discover_engine import discover_engine
+from app.services.similarity import similarity_index
+from app.services.recommendations import recommender
 from app.routers.auth import router as auth_router
 from app.routers.movies import router as movies_router
 from app.routers.proxy import router as proxy_router
 from app.routers.person import router as person_router
 from app.routers.lists import router as lists_router
 from app.routers.filter_settings import router as filter_settings_router
+from app.routers.metrics import router as metrics_router
 from app.core.logging_config import configure_logging
+from app.middleware.logging import RequestLoggingMiddleware
 import logging.config
 import logging
 
@@ -45,9 +54,26 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     await init_db()
+    replica_router.start()
+    catalog_writer.start()
+    title_index.start()
+    if settings.SIMILAR_LOCAL_ENABLED:
+        similarity_index.start()
+    if settings.DISCOVER_LOCAL_ENABLED or settings.SIMILAR_LOCAL_ENABLED:
+        discover_engine.start()
+    if settings.CATALOG_SYNC_ENABLED:
+        catalog_sync.start()
+    if settings.RECOMMENDATIONS_ENABLED:
+        recommender.start()
     yield
     # Shutdown
-    # Add cleanup code here if needed
+    await replica_router.stop()
+    await catalog_sync.stop()
+    await title_index.stop()
+    await discover_engine.stop()
+    await similarity_index.stop()
+    await recommender.stop()
+    await catalog_writer.stop()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -56,6 +82,9 @@ app = FastAPI(
     openapi_url="/api/openapi.json"
 )
 
+# Structured request logging and per-request debug opt-in
+app.add_middleware(RequestLoggingMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -73,4 +102,5 @@ app.include_router(movies_router, prefix="/api/movies", tags=["movies"])
 app.include_router(proxy_router, prefix="/api/proxy", tags=["proxy"])
 app.include_router(person_router, prefix="/api/person", tags=["person"])
 app.include_router(lists_router, prefix="/api/lists", tags=["lists"])
-app.include_router(filter_settings_router, prefix="/api/filter-settings", tags=["filter-settings"])
\ No newline at end of file
+app.include_router(filter_settings_router, prefix="/api/filter-settings", tags=["filter-settings"])
+app.include_router(metrics_router, prefix="/api/metrics", tags=["metrics"])
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Hot Query Benchmark
+
+Measures the client-side CPU cost of building each hot query the old way
+(a fresh select() per call) against the lambda statements in
+app.database.queries. Both variants pay the same cost for a compiled cache
+hit, so the difference is statement construction plus cache key
+generation, which is what the engine does before every execution.
+
+Usage (from the backend directory):
+    python scripts/benchmark_hot_queries.py [iterations]
+
+No database connection is needed.
+"""
+
+import os
+import sys
+import time
+from uuid import uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("TMDB_BEARER_TOKEN", "benchmark")
+
+from sqlalchemy import and_, select
+
+from app.database import queries
+from app.models.filter_settings import FilterSettings
+from app.models.list_models import List, ListItem
+from app.models.user import User
+
+def _fresh_default_lists(user_id):
+    return select(List).where(
+        and_(
+            List.user_id == user_id,
+            List.is_default == True,
+            List.name.in_(["Watched", "Watchlist"])
+        )
+    )
+
+def _fresh_default_list_status(movie_id, watched_list_id, watchlist_id):
+    return select(ListItem.list_id).where(
+        and_(
+            ListItem.movie_id == movie_id,
+            ListItem.list_id.in_([watched_list_id, watchlist_id])
+        )
+    )
+
+def _fresh_user_by_email(email):
+    return select(User).where(User.email == email)
+
+def _fresh_homepage_filters(user_id):
+    return (
+        select(FilterSettings)
+        .where(
+            FilterSettings.user_id == user_id,
+            FilterSettings.is_homepage_enabled == True
+        )
+        .order_by(FilterSettings.homepage_display_order.nulls_last(), FilterSettings.created_at)
+    )
+
+CASES = [
+    ("default lists", _fresh_default_lists, queries.default_lists_query, lambda: (uuid4(),)),
+    ("list status", _fresh_default_list_status, queries.default_list_status_query, lambda: ("550", uuid4(), uuid4())),
+    ("user by email", _fresh_user_by_email, queries.user_by_email_query, lambda: (f"{uuid4().hex}@example.com",)),
+    ("homepage filters", _fresh_homepage_filters, queries.homepage_filters_query, lambda: (uuid4(),)),
+]
+
+def _time_per_call(build, args_list) -> float:
+    """Return mean microseconds to build a statement and generate its cache key."""
+    start = time.process_time()
+    for args in args_list:
+        build(*args)._generate_cache_key()
+    return (time.process_time() - start) / len(args_list) * 1_000_000
+
+def main(iterations: int) -> None:
+    print(f"{'query':<18}{'select() us':>14}{'lambda us':>12}{'saved us':>11}{'saved %':>10}")
+    for name, fresh, cached, make_args in CASES:
+        args_list = [make_args() for _ in range(iterations)]
+        # Warm up both paths so one-time lambda analysis isn't measured
+        _time_per_call(fresh, args_list[:100])
+        _time_per_call(cached, args_list[:100])
+        fresh_us = _time_per_call(fresh, args_list)
+        cached_us = _time_per_call(cached, args_list)
+        saved = fresh_us - cached_us
+        print(f"{name:<18}{fresh_us:>14.1f}{cached_us:>12.1f}{saved:>11.1f}{saved / fresh_us * 100:>9.0f}%")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
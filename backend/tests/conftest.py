@@ -5,6 +5,9 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from typing import Generator, AsyncGenerator
 
+# Keep the background TMDB changes sync out of the test app
+os.environ.setdefault("CATALOG_SYNC_ENABLED", "false")
+
 from app.main import app
 from app.core.config import get_settings
 from app.database.database import get_db, Base
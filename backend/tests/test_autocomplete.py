@@ -0,0 +1,36 @@
+from datetime import date
+
+from app.services.autocomplete import TitleIndex, normalize_title
+from app.services.catalog_service import movie_row
+
+def test_title_index_prefix_matching_and_updates():
+    """
+    Test the in-memory typeahead index
+
+    This test verifies that:
+    1. Any word start of a title matches, ignoring case and accents
+    2. Suggestions are ordered by popularity
+    3. Incremental updates are visible immediately and replace the old title
+    """
+    index = TitleIndex()
+    index.load([
+        (11, "Star Wars", 80.0, date(1977, 5, 25), "/sw.jpg"),
+        (1891, "The Empire Strikes Back", 60.0, date(1980, 5, 20), None),
+        (194, "Amélie", 40.0, date(2001, 4, 25), None),
+        (12, "Starship Troopers", 90.0, date(1997, 11, 7), None),
+    ])
+
+    assert [movie["id"] for movie in index.complete("star")] == [12, 11]
+    assert index.complete("WARS")[0] == {
+        "id": 11, "title": "Star Wars", "release_year": 1977, "poster_path": "/sw.jpg", "popularity": 80.0,
+    }
+    assert [movie["id"] for movie in index.complete("amel")] == [194]
+    assert [movie["id"] for movie in index.complete("strikes b")] == [1891]
+    assert index.complete("  ") == []
+
+    index.update([movie_row({"id": 11, "title": "Star Wars: A New Hope", "popularity": 95.0})])
+    index.update([movie_row({"id": 603, "title": "Stardust", "popularity": 10.0})])
+
+    assert [movie["id"] for movie in index.complete("star")] == [11, 12, 603]
+    assert [movie["id"] for movie in index.complete("new hope")] == [11]
+    assert normalize_title("Amélie: Le Fabuleux_Destin!") == "amelie le fabuleux destin"
@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+from app.core.cache import LRUCache
+
+def test_lru_cache_evicts_least_recently_used():
+    """
+    Test that the cache stays within maxsize
+
+    This test verifies that:
+    1. Reading an entry marks it as recently used
+    2. The least recently used entry is evicted when full
+    """
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+def test_lru_cache_expires_entries():
+    """
+    Test that entries past their ttl are treated as missing
+    """
+    cache = LRUCache(maxsize=10, ttl=5)
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60)
+
+    with patch("app.core.cache.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+def test_lru_cache_pop():
+    """
+    Test explicit invalidation
+    """
+    cache = LRUCache(maxsize=10)
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    assert "a" not in cache
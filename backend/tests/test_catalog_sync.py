@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from sqlalchemy import select
+
+from app.models.movie import Movie
+from app.services.catalog_service import movie_row
+from app.services.catalog_sync import CatalogSync
+from app.utils.tmdb import RateLimiter
+from conftest import TestingSessionLocal
+
+def _tmdb_stand_in(changes, details, requests):
+    """Local stand-in for the TMDB endpoints the sync job calls."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        path = request.url.path
+        if path.endswith("/movie/changes"):
+            page = int(request.url.params["page"])
+            return httpx.Response(200, json={
+                "page": page,
+                "total_pages": len(changes),
+                "results": [{"id": movie_id, "adult": False} for movie_id in changes[page - 1]],
+            })
+        movie_id = int(path.rsplit("/", 1)[-1])
+        if movie_id not in details:
+            return httpx.Response(404, json={"success": False})
+        return httpx.Response(200, json=details[movie_id])
+    return httpx.MockTransport(handler)
+
+async def test_sync_refetches_only_changed_catalog_movies():
+    """
+    Test an incremental catalog sync against a local TMDB stand-in
+
+    This test verifies that:
+    1. Every page of the changes feed is read
+    2. Only changed movies already in the catalog are refetched
+    3. Movies TMDB no longer serves are removed from the catalog
+    4. The high-water mark is stored and the next run resumes from it
+    """
+    async with TestingSessionLocal() as session:
+        for movie_id in (1, 2, 3):
+            session.add(Movie(**movie_row({"id": movie_id, "title": f"Old {movie_id}"})))
+        await session.commit()
+
+    requests = []
+    transport = _tmdb_stand_in(
+        changes=[[1, 500], [3]],
+        details={1: {"id": 1, "title": "New 1", "runtime": 101, "genres": [{"id": 18, "name": "Drama"}]}},
+        requests=requests,
+    )
+    sync = CatalogSync(
+        limiter=RateLimiter(rate=1000, burst=1000),
+        session_maker=TestingSessionLocal,
+        transport=transport,
+    )
+    now = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+
+    assert await sync.run_once(now=now)
+
+    fetched = [r.url.path for r in requests if not r.url.path.endswith("/movie/changes")]
+    assert sorted(fetched) == ["/3/movie/1", "/3/movie/3"]
+    async with TestingSessionLocal() as session:
+        movies = {movie.id: movie for movie in (await session.execute(select(Movie))).scalars()}
+    assert movies[1].title == "New 1"
+    assert movies[1].runtime == 101
+    assert movies[1].genre_ids == [18]
+    assert movies[2].title == "Old 2"
+    assert 3 not in movies
+    assert await sync.get_high_water_mark() == now
+    assert sync.stats()["refreshed"] == 1
+    assert sync.stats()["removed"] == 1
+
+    requests.clear()
+    later = now + timedelta(hours=1)
+    assert await sync.run_once(now=later)
+    change_params = [r.url.params for r in requests if r.url.path.endswith("/movie/changes")]
+    assert change_params[0]["start_date"] == "2026-10-19"
+    assert await sync.get_high_water_mark() == later
+
+async def test_sync_retries_failed_refetches():
+    """
+    Test that refetches that failed are retried on the next run
+
+    This test verifies that:
+    1. The high-water mark still moves past a window with failures
+    2. The failed IDs are stored and refetched by the next run
+    3. A successful retry clears them
+    """
+    async with TestingSessionLocal() as session:
+        session.add(Movie(**movie_row({"id": 1, "title": "Old 1"})))
+        await session.commit()
+
+    requests = []
+    failing = {"status": 500}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/movie/changes"):
+            results = [{"id": 1}] if request.url.params["start_date"] == "2026-10-18" else []
+            return httpx.Response(200, json={"page": 1, "total_pages": 1, "results": results})
+        if failing["status"] != 200:
+            return httpx.Response(failing["status"], json={})
+        return httpx.Response(200, json={"id": 1, "title": "New 1"})
+
+    sync = CatalogSync(
+        limiter=RateLimiter(rate=1000, burst=1000),
+        session_maker=TestingSessionLocal,
+        transport=httpx.MockTransport(handler),
+    )
+    now = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+
+    assert await sync.run_once(now=now)
+    assert await sync.get_high_water_mark() == now
+    assert await sync.get_failed_ids() == [1]
+
+    failing["status"] = 200
+    requests.clear()
+    assert await sync.run_once(now=now + timedelta(hours=1))
+    assert "/3/movie/1" in [r.url.path for r in requests]
+    assert await sync.get_failed_ids() == []
+    async with TestingSessionLocal() as session:
+        assert (await session.get(Movie, 1)).title == "New 1"
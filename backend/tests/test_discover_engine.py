@@ -0,0 +1,72 @@
+from datetime import date
+
+import pytest
+
+from app.services.discover_engine import UnsupportedQuery, build_columns, evaluate
+
+ACTION, DRAMA, COMEDY = 28, 18, 35
+
+HEIST, SEQUEL = 10051, 9663
+
+# (id, popularity, vote_average, vote_count, runtime, release_date, genre_ids, language, adult, video,
+#  keyword_ids, cast_ids, crew_ids, company_ids)
+ROWS = [
+    (1, 90.0, 7.0, 500, 120, date(2010, 5, 1), [ACTION, DRAMA], "en", False, False, [HEIST, SEQUEL], [10, 11], [100], [1]),
+    (2, 80.0, 8.5, 900, 95, date(1999, 3, 1), [DRAMA], "en", False, False, [HEIST], [11], [100], [2]),
+    (3, 70.0, 6.0, 50, None, date(2020, 1, 1), [COMEDY], "fr", False, False, [], [12], [101], [1, 2]),
+    (4, 60.0, 8.5, 300, 150, None, [ACTION], "en", False, False, [SEQUEL], [10], [], []),
+    (5, 99.0, 9.0, 1000, 110, date(2015, 1, 1), [ACTION, DRAMA], "en", True, False, [HEIST], [10], [100], [1]),
+]
+
+def test_discover_params_evaluated_locally():
+    """
+    Test the columnar discover engine
+
+    This test verifies that:
+    1. Adult movies are excluded unless requested
+    2. Range, genre (any-of and all-of) and language filters combine
+    3. Sorts order ties by ID and unknown dates sort last
+    4. Unsupported params are refused so the caller can ask TMDB
+    """
+    columns = build_columns(reversed(ROWS))
+
+    assert evaluate(columns, {"sort_by": "popularity.desc"}) == ([1, 2, 3, 4], 4)
+    assert evaluate(columns, {"include_adult": "true"})[0][0] == 5
+    assert evaluate(columns, {"with_genres": f"{ACTION}|{COMEDY}"}) == ([1, 3, 4], 3)
+    assert evaluate(columns, {"with_genres": f"{ACTION},{DRAMA}"}) == ([1], 1)
+    assert evaluate(columns, {"with_genres": f"{ACTION},99999"}) == ([], 0)
+    assert evaluate(columns, {"with_original_language": "en", "vote_count.gte": "100", "with_runtime.lte": "130"}) == ([1, 2], 2)
+    assert evaluate(columns, {"primary_release_date.gte": "2000-01-01"}) == ([1, 3], 2)
+    assert evaluate(columns, {"sort_by": "vote_average.desc"})[0] == [2, 4, 1, 3]
+    assert evaluate(columns, {"sort_by": "primary_release_date.asc"})[0] == [2, 1, 3, 4]
+    assert evaluate(columns, {"page": "2"}) == ([], 4)
+
+    with pytest.raises(UnsupportedQuery):
+        evaluate(columns, {"with_watch_providers": "8"})
+    with pytest.raises(UnsupportedQuery):
+        evaluate(columns, {"sort_by": "revenue.desc"})
+
+def test_facet_filters_use_posting_lists():
+    """
+    Test keyword, cast, crew and company filters
+
+    This test verifies that:
+    1. "|" lists match any ID and "," lists match all of them
+    2. without_* params exclude movies with any of the IDs
+    3. Facet filters combine with each other and with column filters
+    4. Queries are declined while too few candidates have the facet's data
+    """
+    columns = build_columns(ROWS)
+
+    assert evaluate(columns, {"with_keywords": f"{HEIST}|{SEQUEL}"}) == ([1, 2, 4], 3)
+    assert evaluate(columns, {"with_keywords": f"{HEIST},{SEQUEL}"}) == ([1], 1)
+    assert evaluate(columns, {"without_keywords": f"{SEQUEL}"}) == ([2, 3], 2)
+    assert evaluate(columns, {"with_cast": "10", "with_crew": "100"}) == ([1], 1)
+    assert evaluate(columns, {"with_companies": "2", "with_genres": f"{DRAMA}"}) == ([2], 1)
+    assert evaluate(columns, {"without_companies": "1|2"}) == ([4], 1)
+    assert evaluate(columns, {"with_cast": "99999"}) == ([], 0)
+
+    unknown = build_columns(ROWS[:3] + [ROWS[3][:10] + (None, None, None, None)])
+    assert evaluate(unknown, {"with_keywords": f"{HEIST}", "vote_average.gte": "7"}, min_facet_coverage=0.5) == ([1, 2], 2)
+    with pytest.raises(UnsupportedQuery):
+        evaluate(unknown, {"with_keywords": f"{HEIST}"}, min_facet_coverage=0.95)
@@ -0,0 +1,71 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.routers import metrics
+
+def test_metrics_require_token(test_client):
+    """
+    Test access control on the metrics routes
+
+    This test verifies that:
+    1. Metrics answer 404 while no token is configured
+    2. A missing or wrong token is rejected with 401
+    3. The configured token is accepted
+    """
+    with patch.object(metrics.settings, "METRICS_TOKEN", None):
+        assert test_client.get("/api/metrics/search").status_code == 404
+
+    with patch.object(metrics.settings, "METRICS_TOKEN", "s3cret"):
+        header = metrics.settings.METRICS_HEADER
+        assert test_client.get("/api/metrics/search").status_code == 401
+        assert test_client.get("/api/metrics/search", headers={header: "wrong"}).status_code == 401
+        response = test_client.get("/api/metrics/search", headers={header: "s3cret"})
+        assert response.status_code == 200
+        assert "pid" in response.json()
+
+async def test_pool_times_every_concurrent_checkout():
+    """
+    Test connection pool instrumentation under contention
+
+    This test verifies that:
+    1. Every checkout is timed once, including ones that waited concurrently
+    2. Only checkouts that found the pool exhausted count as waits
+    3. A checkout that gives up counts as a timeout
+    """
+    from sqlalchemy import exc, text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.database.database import InstrumentedQueuePool
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=5,
+    )
+    pool = engine.pool
+
+    async def checkout():
+        async with engine.connect() as conn:
+            await conn.execute(text("select 1"))
+
+    held = await engine.connect()
+    waiting = [asyncio.create_task(checkout()) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    await held.close()
+    await asyncio.gather(*waiting)
+    assert pool.checkout_latency.count == 4
+    assert pool.wait_time.count == 3
+    assert pool.timeouts == 0
+
+    held = await engine.connect()
+    pool._timeout = 0.05
+    with pytest.raises(exc.TimeoutError):
+        await checkout()
+    await held.close()
+    assert pool.checkout_latency.count == 6
+    assert pool.timeouts == 1
+    await engine.dispose()
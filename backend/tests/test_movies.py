@@ -53,4 +53,86 @@ async def test_get_movie_genres(test_client):
             assert isinstance(genre["name"], str)
         
         # Verify mock was called once
-        assert async_mock.call_count == 1 
\ No newline at end of file
+        assert async_mock.call_count == 1
+
+@pytest.mark.asyncio
+async def test_search_merges_tmdb_pages():
+    """
+    Test multi-page TMDB search
+    
+    This test verifies that:
+    1. A 40-result page is built from two TMDB pages
+    2. A movie repeated on the second TMDB page is kept once, in first position
+    3. Totals are counted in 40-result pages
+    4. Repeating the search is served from the page cache
+    """
+    from app.services.search_service import search_tmdb
+
+    def tmdb_page(page, ids):
+        response = MagicMock()
+        response.raise_for_status.return_value = None
+        response.json.return_value = {
+            "page": page,
+            "results": [{"id": movie_id, "title": f"Movie {movie_id}"} for movie_id in ids],
+            "total_pages": 5,
+            "total_results": 90,
+        }
+        return response
+
+    async def fake_get(url, params=None, headers=None):
+        page = int(params["page"])
+        ids = list(range((page - 1) * 20, page * 20))
+        if page == 4:
+            ids[0] = 45
+        return tmdb_page(page, ids)
+
+    async_mock = AsyncMock(side_effect=fake_get)
+    with patch('httpx.AsyncClient.get', new=async_mock):
+        data = await search_tmdb("merge test", page=2, page_size=40)
+        again = await search_tmdb("Merge Test ", page=2, page_size=40)
+
+    ids = [movie["id"] for movie in data["results"]]
+    assert ids == [movie_id for movie_id in range(40, 80) if movie_id != 60]
+    assert data["total_pages"] == 3
+    assert data["total_results"] == 90
+    assert sorted(call.kwargs["params"]["page"] for call in async_mock.call_args_list) == ["3", "4"]
+    assert again == data
+
+@pytest.mark.asyncio
+async def test_search_serves_catalog_or_tmdb():
+    """
+    Test the choice between catalog and TMDB search
+    
+    This test verifies that:
+    1. A query with a full page of strong catalog matches is served locally
+    2. Later pages of that query come from the catalog too
+    3. A query with fewer strong matches than a page goes to TMDB
+    """
+    from app.models.movie import Movie
+    from app.routers.movies import search_movies
+    from app.services import search_service
+    from app.services.catalog_service import movie_row
+    from conftest import TestingSessionLocal
+
+    async with TestingSessionLocal() as session:
+        for movie_id in range(1, 26):
+            session.add(Movie(**movie_row({"id": movie_id, "title": f"Matrix {movie_id}"})))
+        for movie_id in range(101, 106):
+            session.add(Movie(**movie_row({"id": movie_id, "title": f"Dune {movie_id}"})))
+        await session.commit()
+
+    tmdb_page = {"page": 1, "results": [{"id": 438631, "title": "Dune"}], "total_pages": 1, "total_results": 1}
+    tmdb_mock = AsyncMock(return_value=tmdb_page)
+    with patch.object(search_service, "search_tmdb", new=tmdb_mock):
+        async with TestingSessionLocal() as session:
+            search = dict(page_size=20, year=None, primary_release_year=None, db=session)
+            first = await search_movies(query="matrix", page=1, **search)
+            second = await search_movies(query="matrix", page=2, **search)
+            dune = await search_movies(query="dune", page=1, **search)
+
+    assert len(first["results"]) == 20
+    assert first["total_pages"] == 2
+    assert first["total_results"] == 25
+    assert {movie["id"] for movie in first["results"] + second["results"]} == set(range(1, 26))
+    assert dune == tmdb_page
+    tmdb_mock.assert_awaited_once_with("dune", 1, 20, None, None)
@@ -0,0 +1,41 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.password_hashing import PasswordHashPool
+
+async def test_cancelled_queued_call_leaves_the_queue():
+    """
+    Test cancelling a password hashing call that is still queued
+
+    This test verifies that:
+    1. A full queue rejects new calls with 503
+    2. Cancelling a queued call frees its queue slot
+    3. The cancelled job never runs, and later calls are accepted again
+    """
+    pool = PasswordHashPool(max_workers=1, max_queue=1)
+    release = threading.Event()
+    ran = []
+
+    running = asyncio.create_task(pool.run(release.wait))
+    while pool.running == 0:
+        await asyncio.sleep(0.01)
+    queued = asyncio.create_task(pool.run(ran.append, "cancelled"))
+    await asyncio.sleep(0.01)
+    assert pool.stats()["queued"] == 1
+    with pytest.raises(HTTPException) as rejected:
+        await pool.run(ran.append, "rejected")
+    assert rejected.value.status_code == 503
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert pool.stats()["queued"] == 0
+
+    release.set()
+    assert await running is True
+    await pool.run(ran.append, "accepted")
+    assert ran == ["accepted"]
+    assert pool.stats()["queued"] == 0
@@ -0,0 +1,37 @@
+from app.services.recommendations import CooccurrenceBuilder
+
+# (user, movie) rows grouped by user
+ROWS = [
+    ("a", 1), ("a", 2), ("a", 3),
+    ("b", 1), ("b", 2),
+    ("c", 2), ("c", 3), ("c", 4),
+    ("d", 5),
+]
+
+def test_cooccurrence_recommendations():
+    """
+    Test the item-item co-occurrence model
+
+    This test verifies that:
+    1. Movies listed together by more users score higher
+    2. A user's own movies are never recommended back
+    3. Users without co-occurring history get the most listed movies
+    4. Pruning keeps the pair counts within budget
+    """
+    builder = CooccurrenceBuilder(chunk_pairs=2)
+    builder.add(ROWS[:4])
+    builder.add(ROWS[4:])
+    model = builder.finish(neighbours=10)
+
+    assert builder.users == 4
+    assert model.movie_ids.tolist() == [1, 2, 3, 4, 5]
+    assert model.recommend([1], limit=2) == [2, 3]
+    assert model.recommend([2, 3], limit=2) == [1, 4]
+    assert model.recommend([5], limit=3) == [2, 1, 3]
+    assert model.recommend([], limit=1) == [2]
+
+    pruned = CooccurrenceBuilder(max_pairs=2)
+    pruned.add(ROWS)
+    pruned.finish()
+    assert len(pruned._keys) <= 2
+    assert pruned.pruned_below == 2
@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.database import routing
+from app.database.routing import ReplicaRouter
+
+def test_reads_round_robin_across_healthy_replicas():
+    """
+    Test replica selection
+
+    This test verifies that:
+    1. Reads alternate between replicas
+    2. Reads fall back to the primary when no replica is healthy
+    """
+    primary, replica_a, replica_b = MagicMock(), MagicMock(), MagicMock()
+    router = ReplicaRouter(primary, [replica_a, replica_b])
+
+    picks = [router.engine_for_read() for _ in range(4)]
+    assert picks == [replica_a, replica_b, replica_a, replica_b]
+
+    router._healthy = []
+    assert router.engine_for_read() is primary
+
+def test_recent_writer_reads_from_primary():
+    """
+    Test the read-your-writes window
+    """
+    primary, replica = MagicMock(), MagicMock()
+    router = ReplicaRouter(primary, [replica], read_your_writes_seconds=30)
+    user_id = uuid4()
+
+    router.mark_write(user_id)
+
+    assert router.engine_for_read(user_id) is primary
+    assert router.engine_for_read(uuid4()) is replica
+
+def test_committed_write_opens_window_for_request_user(monkeypatch):
+    """
+    Test that committing a write marks the request's user
+
+    Uses an in-memory SQLite database as a stand-in for the primary.
+    """
+    router = ReplicaRouter(MagicMock(), [MagicMock()], read_your_writes_seconds=30)
+    monkeypatch.setattr(routing, "replica_router", router)
+    engine = create_engine("sqlite://")
+    table = Table("t", MetaData(), Column("id", Integer))
+    table.metadata.create_all(engine)
+    user_id = uuid4()
+    token = routing.request_user_id.set(user_id)
+    try:
+        with Session(engine) as session:
+            session.execute(select(table))
+            session.commit()
+            assert router.engine_for_read(user_id) is not router.primary
+
+            session.execute(insert(table).values(id=1))
+            session.commit()
+    finally:
+        routing.request_user_id.reset(token)
+
+    assert router.engine_for_read(user_id) is router.primary
@@ -0,0 +1,54 @@
+from datetime import date
+
+from app.services.discover_engine import build_columns
+from app.services.similarity import SimilarityIndex, _stale, build_vectors, changed_movies
+
+ACTION, DRAMA, COMEDY = 28, 18, 35
+
+def _row(movie_id, genres, keywords, cast, crew, language="en", adult=False):
+    return (movie_id, 10.0, 7.0, 100, 100, date(2020, 1, 1), genres, language, adult, False, keywords, cast, crew, [])
+
+ROWS = [
+    _row(1, [ACTION], [500, 501], [10, 11], [100]),
+    _row(2, [ACTION], [500, 501], [10, 12], [100]),
+    _row(3, [ACTION], [500], [13], [101]),
+    _row(4, [COMEDY], [900], [20], [200], language="fr"),
+    _row(5, [ACTION], [500, 501], [10, 11], [100], adult=True),
+    _row(6, [ACTION], None, None, None),
+]
+
+def test_similar_movies_from_content_vectors():
+    """
+    Test content-based similar movies
+
+    This test verifies that:
+    1. Movies sharing more weighted features rank higher
+    2. Unrelated, adult and detail-less movies are never suggested
+    3. Movies without keywords and credits are not in the index
+    4. Snapshot diffs find changed, removed and newly eligible movies only
+    5. Cached lists a changed movie could enter are marked stale
+    6. Cached lists expire after the cache TTL
+    """
+    index = SimilarityIndex(top_k=2)
+    index.load(build_columns(ROWS))
+
+    assert index.similar(1) == [2, 3]
+    assert index.similar(4) == []
+    assert index.similar(6) is None
+    assert index.similar(1) == [2, 3]
+    assert index.stats()["hits"] == 1
+
+    changed = ROWS[:2] + [_row(3, [ACTION], [500, 501], [10, 11], [100])] + ROWS[3:]
+    vectors = build_vectors(build_columns(changed))
+    previous = build_vectors(build_columns(ROWS))
+    assert changed_movies(previous, build_vectors(build_columns(ROWS))) == set()
+    assert changed_movies(previous, vectors) == {3}
+    detailed = ROWS[:5] + [_row(6, [ACTION], [500], [10], [100]), _row(7, [DRAMA], None, None, None)]
+    assert changed_movies(previous, build_vectors(build_columns(detailed[1:]))) == {1, 6}
+    cached = {2: ([1, 3], 0.1), 4: ([], 0.0)}
+    assert _stale(vectors, {3}, cached) == {2}
+
+    expiring = SimilarityIndex(top_k=2, cache_ttl_seconds=0)
+    expiring.load(build_columns(ROWS))
+    assert expiring.similar(1) == expiring.similar(1) == [2, 3]
+    assert expiring.stats()["misses"] == 2
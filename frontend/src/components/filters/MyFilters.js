@@ -86,7 +86,7 @@ const MyFilters = () => {
       setPopularityRange(JSON.parse(filter.popularity_range));
     }
     if (filter.genres) {
-      setSelectedGenres(JSON.parse(filter.genres));
+      setSelectedGenres(filter.genres);
     }
     
     setEditModalOpen(true);
@@ -102,7 +102,7 @@ const MyFilters = () => {
         year_range: yearRange ? JSON.stringify(yearRange) : null,
         rating_range: ratingRange ? JSON.stringify(ratingRange) : null,
         popularity_range: popularityRange ? JSON.stringify(popularityRange) : null,
-        genres: selectedGenres.length > 0 ? JSON.stringify(selectedGenres) : null,
+        genres: selectedGenres.length > 0 ? selectedGenres : null,
       };
 
       await filterSettingsApi.updateFilterSetting(currentFilter.id, filterData);
@@ -144,7 +144,7 @@ const MyFilters = () => {
     }
     
     if (filter.genres) {
-      const selectedGenreIds = JSON.parse(filter.genres);
+      const selectedGenreIds = filter.genres;
       if (selectedGenreIds.length > 0) {
         const genreNames = selectedGenreIds
           .map(id => genres.find(g => g.id === id)?.name)
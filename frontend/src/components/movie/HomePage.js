@@ -12,6 +12,9 @@ import { variants } from '../../utils/theme';
 import MovieDetailsModal from './MovieDetailsModal';
 import { toast } from 'react-hot-toast';
 
+// Search results per page; the API merges several TMDB pages into one response
+const SEARCH_PAGE_SIZE = 40;
+
 // Custom hook for responsive design
 const useResponsiveDefaults = () => {
   const [isMobile, setIsMobile] = useState(false);
@@ -121,7 +124,7 @@ const HomePage = () => {
       let response;
 
       if (listKey === 'search-results') {
-        response = await movieApi.searchMovies(searchQuery, currentPage);
+        response = await movieApi.searchMovies(searchQuery, currentPage, SEARCH_PAGE_SIZE);
         if (response) {
           setSearchResults(prev => {
             const existingIds = new Set((prev || []).map(movie => movie.id));
@@ -273,7 +276,7 @@ const HomePage = () => {
 
       const loadPage = async (page) => {
         if (listKey === 'search-results') {
-          return await movieApi.searchMovies(searchQuery, page);
+          return await movieApi.searchMovies(searchQuery, page, SEARCH_PAGE_SIZE);
         } else if (listKey === 'filtered-results') {
           return await movieApi.getFilteredMovies(page, {
             yearRange,
@@ -762,18 +765,19 @@ const HomePage = () => {
       if (movieId) {
         setIsLoadingModal(true);
         try {
-          const [details, credits, videos, watchProviders] = await Promise.all([
+          const [details, credits, videos, watchProviders, similar] = await Promise.all([
             movieApi.getMovieDetails(movieId),
             movieApi.getMovieCredits(movieId),
             movieApi.getMovieVideos(movieId),
-            movieApi.getMovieWatchProviders(movieId)
+            movieApi.getMovieWatchProviders(movieId),
+            movieApi.getSimilarMovies(movieId).catch(() => ({ results: [] }))
           ]);
 
           setMovieDetails({
             ...details,
             credits,
             videos: videos.results || [],
-            similar: [], // Temporarily disabled until backend is ready
+            similar: similar.results || [],
             watchProviders: watchProviders.results?.US?.flatrate || []
           });
           setSelectedMovie(details);
@@ -52,18 +52,19 @@ const MyLists = () => {
       if (movieId) {
         setIsLoadingModal(true);
         try {
-          const [details, credits, videos, watchProviders] = await Promise.all([
+          const [details, credits, videos, watchProviders, similar] = await Promise.all([
             movieApi.getMovieDetails(movieId),
             movieApi.getMovieCredits(movieId),
             movieApi.getMovieVideos(movieId),
-            movieApi.getMovieWatchProviders(movieId)
+            movieApi.getMovieWatchProviders(movieId),
+            movieApi.getSimilarMovies(movieId).catch(() => ({ results: [] }))
           ]);
 
           setMovieModalDetails({
             ...details,
             credits,
             videos: videos.results || [],
-            similar: [], // Temporarily disabled until backend is ready
+            similar: similar.results || [],
             watchProviders: watchProviders.results?.US?.flatrate || []
           });
           setSelectedMovie(details);
@@ -210,17 +211,6 @@ const MyLists = () => {
     handleDeleteList(list);
   };
 
-  // Add this new function to fetch movie details
-  const fetchMovieDetails = async (movieId) => {
-    try {
-      const details = await movieApi.getMovieDetails(movieId);
-      return details;
-    } catch (error) {
-      console.error(`Error fetching details for movie ${movieId}:`, error);
-      return null;
-    }
-  };
-
   // Update the handleListExpand function
   const handleListExpand = async (listId) => {
     if (expandedListId === listId) {
@@ -237,14 +227,22 @@ const MyLists = () => {
       const unfetchedMovies = list.items.filter(item => !newDetails[item.movie_id]);
       
       if (unfetchedMovies.length > 0) {
-        const detailsPromises = unfetchedMovies.map(item => fetchMovieDetails(item.movie_id));
-        const results = await Promise.all(detailsPromises);
-        
-        results.forEach((details, index) => {
-          if (details) {
-            newDetails[unfetchedMovies[index].movie_id] = details;
-          }
-        });
+        // The batch endpoint accepts up to 100 IDs per call
+        const ids = unfetchedMovies.map(item => item.movie_id);
+        const chunks = [];
+        for (let i = 0; i < ids.length; i += 100) {
+          chunks.push(ids.slice(i, i + 100));
+        }
+        try {
+          const responses = await Promise.all(chunks.map(chunk => movieApi.getMoviesBatch(chunk)));
+          responses.forEach(response => {
+            (response?.results || []).forEach(details => {
+              newDetails[String(details.id)] = details;
+            });
+          });
+        } catch (error) {
+          console.error('Error fetching list movie details:', error);
+        }
         
         setListMovieDetails(newDetails);
       }
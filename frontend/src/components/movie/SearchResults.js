@@ -24,18 +24,19 @@ const SearchResults = () => {
       if (movieId) {
         setIsLoadingModal(true);
         try {
-          const [details, credits, videos, watchProviders] = await Promise.all([
+          const [details, credits, videos, watchProviders, similar] = await Promise.all([
             movieApi.getMovieDetails(movieId),
             movieApi.getMovieCredits(movieId),
             movieApi.getMovieVideos(movieId),
-            movieApi.getMovieWatchProviders(movieId)
+            movieApi.getMovieWatchProviders(movieId),
+            movieApi.getSimilarMovies(movieId).catch(() => ({ results: [] }))
           ]);
 
           setMovieDetails({
             ...details,
             credits,
             videos: videos.results || [],
-            similar: [], // Temporarily disabled until backend is ready
+            similar: similar.results || [],
             watchProviders: watchProviders.results?.US?.flatrate || []
           });
           setSelectedMovie(details);
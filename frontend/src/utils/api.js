@@ -204,7 +204,7 @@ const checkTokenExpiration = () => {
         expiresAt: new Date(payload.exp * 1000),
         issuedAt: new Date(payload.iat * 1000),
         type: payload.token_type,
-        email: payload.sub,
+        userId: payload.sub,
         timeUntilExpiry: (payload.exp * 1000) - Date.now()
       };
     } catch (error) {
@@ -220,7 +220,7 @@ const checkTokenExpiration = () => {
       expiresAt: decodedAccess?.expiresAt,
       issuedAt: decodedAccess?.issuedAt,
       type: decodedAccess?.type,
-      email: decodedAccess?.email,
+      userId: decodedAccess?.userId,
       timeUntilExpiry: decodedAccess?.timeUntilExpiry + 'ms',
       hasExpired: decodedAccess?.timeUntilExpiry < 0
     });
@@ -234,7 +234,7 @@ const checkTokenExpiration = () => {
       expiresAt: decodedRefresh?.expiresAt,
       issuedAt: decodedRefresh?.issuedAt,
       type: decodedRefresh?.type,
-      email: decodedRefresh?.email,
+      userId: decodedRefresh?.userId,
       timeUntilExpiry: decodedRefresh?.timeUntilExpiry + 'ms',
       hasExpired: decodedRefresh?.timeUntilExpiry < 0
     });
@@ -467,15 +467,19 @@ export const movieApi = {
     return api.get(`/api/movies/popular?${params.toString()}`);
   },
   
-  searchMovies: async (query, page = 1) => {
+  searchMovies: async (query, page = 1, pageSize = 20) => {
     const params = new URLSearchParams({
       query: query.trim(),
       page: page.toString(),
-      include_adult: 'false',
-      language: 'en-US'
+      page_size: pageSize.toString()
     });
     return api.get(`/api/movies/search?${params.toString()}`);
   },
+
+  autocompleteMovies: async (query, limit = 10) => {
+    const params = new URLSearchParams({ q: query.trim(), limit: limit.toString() });
+    return api.get(`/api/movies/autocomplete?${params.toString()}`);
+  },
   
   getTopRatedMovies: (page = 1, filters = {}) => {
     const params = new URLSearchParams({ page: page.toString() });
@@ -523,9 +527,11 @@ export const movieApi = {
   },
   
   getMovieDetails: (id) => api.get(`/api/movies/${id}`),
+  getMoviesBatch: (ids) => api.get('/api/movies/batch', { params: { ids: ids.join(',') } }),
   getMovieCredits: (id) => api.get(`/api/movies/${id}/credits`),
   getMovieVideos: (id) => api.get(`/api/movies/${id}/videos`),
   getSimilarMovies: (id) => api.get(`/api/movies/${id}/similar`),
+  getRecommendedMovies: (limit = 20) => api.get('/api/movies/recommended', { params: { limit } }),
   getPersonDetails: (id) => api.get(`/api/person/${id}`),
   getMovieWatchProviders: (id) => api.get(`/api/movies/${id}/watch-providers`),
 };
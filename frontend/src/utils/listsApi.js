@@ -2,6 +2,7 @@ import api from './api';
 
 export const listsApi = {
   getLists: () => api.get('/api/lists'),
+  getListSummaries: () => api.get('/api/lists/summary'),
   createList: (listData) => api.post('/api/lists', listData),
   updateList: async (listId, listData) => {
     console.log('Updating list:', { listId, listData }); // Debug log
@@ -25,4 +26,9 @@ export const listsApi = {
   toggleWatchlist: async (movieId) => {
     return await api.post(`/api/lists/watchlist/${movieId}`);
   },
+  getListStatuses: async (movieIds) => {
+    return await api.post('/api/lists/status', {
+      movie_ids: movieIds.map((id) => id.toString()),
+    });
+  },
 }; 
\ No newline at end of file